@@ -1,15 +1,26 @@
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import BaseAdapter, HTTPAdapter
 import re
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import heapq
 import time
-from groq import Groq
 import io
 import urllib.parse
-import feedparser
+import base64
+import threading
+import uuid
+import os
+import hashlib
+import atexit
+import sqlite3
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+import mmap
+from array import array
 
 # Page configuration
 st.set_page_config(
@@ -18,13 +29,1749 @@ st.set_page_config(
     layout="wide"
 )
 
+# Elements whose class or id marks them as page chrome rather than article text
+BOILERPLATE_PATTERN = re.compile(
+    r'comment|share|social|related|footer|header|nav|menu|sidebar|advert|promo|'
+    r'newsletter|subscribe|cookie|breadcrumb|popup|banner|widget|recommend',
+    re.IGNORECASE
+)
+
+def get_setting(name, default=None):
+    """Streamlit secret, falling back to an environment variable of the same name"""
+    try:
+        if name in st.secrets:
+            return st.secrets[name]
+    except Exception:  # no secrets.toml, e.g. on crawl worker nodes
+        pass
+    return os.environ.get(name, default)
+
+def _intern(value):
+    """Share one copy of short, highly repeated strings (sources, dates, sectors)"""
+    return sys.intern(value) if isinstance(value, str) and len(value) <= 64 else value
+
+class Article:
+    """Compact search result record.
+    
+    Content for the LLM is derived on demand from title and body/description
+    instead of being stored as another copy of the text, and repeated values
+    such as source and date strings are interned.
+    """
+    
+    __slots__ = ('title', 'link', 'description', 'source', 'date', 'search_source',
+                 'timestamp', 'published', 'date_source', 'body', 'canonical')
+    
+    def __init__(self, title, link, description='', source='Unknown', date='2024+'):
+        self.title = title.strip() if title else 'No Title'
+        self.link = link or ''
+        self.description = description or ''
+        self.source = _intern(source or 'Unknown')
+        self.date = _intern(date or '2024+')
+        self.search_source = None
+        self.timestamp = None
+        self.published = ''
+        self.date_source = None
+        self.body = None
+        self.canonical = None
+    
+    @property
+    def content(self):
+        if self.body:
+            return f"{self.title}. {self.body}"
+        if self.description:
+            return f"{self.title}. {self.description}"
+        return self.title or 'No content'
+    
+    @property
+    def display_date(self):
+        return self.published or self.date
+    
+    def copy(self):
+        duplicate = Article.__new__(Article)
+        for name in Article.__slots__:
+            setattr(duplicate, name, getattr(self, name))
+        return duplicate
+    
+    def to_dict(self):
+        return {name: getattr(self, name) for name in Article.__slots__}
+    
+    @classmethod
+    def from_dict(cls, data):
+        article = cls(data.get('title'), data.get('link'), data.get('description'), data.get('source'), data.get('date'))
+        for name in ('search_source', 'published', 'date_source'):
+            if data.get(name):
+                setattr(article, name, _intern(data[name]))
+        article.timestamp = data.get('timestamp')
+        article.body = data.get('body')
+        article.canonical = data.get('canonical')
+        return article
+
+class Lead:
+    """Extracted company lead that references its article instead of copying its fields"""
+    
+    __slots__ = ('company_name', 'core_intent', 'stage', 'detailed_timeline', 'project_type',
+                 'sector', 'confidence', 'private_sector', 'article')
+    
+    def __init__(self, company, article):
+        self.company_name = company['company_name']
+        self.core_intent = company['core_intent']
+        self.stage = company['stage']
+        self.detailed_timeline = _intern(company['detailed_timeline'])
+        self.project_type = _intern(company['project_type'])
+        self.sector = _intern(company['sector'])
+        self.confidence = _intern(company['confidence'])
+        self.private_sector = company['is_private_sector']
+        self.article = article
+    
+    def to_dict(self):
+        """Lead fields in the extraction schema; the article is stored separately"""
+        return {
+            'company_name': self.company_name,
+            'core_intent': self.core_intent,
+            'stage': self.stage,
+            'detailed_timeline': self.detailed_timeline,
+            'project_type': self.project_type,
+            'sector': self.sector,
+            'confidence': self.confidence,
+            'is_private_sector': self.private_sector
+        }
+    
+    def to_row(self):
+        """Row in the results table schema"""
+        return {
+            'Company Name': self.company_name,
+            'Source Link': self.article.link,
+            'Core Intent': self.core_intent,
+            'Stage': self.stage,
+            'Detailed Timeline': self.detailed_timeline,
+            'Project Type': self.project_type,
+            'Sector': self.sector,
+            'Confidence': self.confidence,
+            'Article Title': self.article.title,
+            'Source': self.article.source,
+            'Date': self.article.display_date,
+            'Private Sector': self.private_sector
+        }
+
+class SharedCache:
+    """Process-wide TTL cache with a memory limit, optional SQLite backing and request coalescing.
+    
+    Concurrent lookups of the same missing key share a single computation:
+    the first caller computes, later callers wait for its result.
+    """
+    
+    def __init__(self, name, ttl_seconds=6 * 3600, max_bytes=256 * 1024 * 1024, db_path=None,
+                 encode=lambda value: value, decode=lambda data: data):
+        self.name = name
+        # Values are sized and persisted as JSON of encode(value)
+        self.encode = encode
+        self.decode = decode
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (stored_at, size, value)
+        self.current_bytes = 0
+        self.in_flight = {}
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self.db_path = db_path
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            with sqlite3.connect(db_path) as db:
+                db.execute(f"CREATE TABLE IF NOT EXISTS cache_{name} (key TEXT PRIMARY KEY, stored_at REAL, value TEXT)")
+    
+    def _store(self, key, value, stored_at, size):
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.current_bytes -= self.entries.pop(key)[1]
+        self.entries[key] = (stored_at, size, value)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes and self.entries:
+            _, (_, evicted_size, _) = self.entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.stats['evictions'] += 1
+    
+    def _lookup(self, key, count=True):
+        """Fresh value from memory, then disk; caller holds the lock"""
+        now = time.time()
+        entry = self.entries.get(key)
+        if entry is not None:
+            if now - entry[0] <= self.ttl_seconds:
+                self.entries.move_to_end(key)
+                self.stats['hits'] += count
+                return True, entry[2]
+            self.current_bytes -= self.entries.pop(key)[1]
+        
+        if self.db_path:
+            with sqlite3.connect(self.db_path) as db:
+                row = db.execute(f"SELECT stored_at, value FROM cache_{self.name} WHERE key = ?", (key,)).fetchone()
+            if row and now - row[0] <= self.ttl_seconds:
+                value = self.decode(json.loads(row[1]))
+                self._store(key, value, row[0], len(row[1]))
+                self.stats['disk_hits'] += count
+                return True, value
+        return False, None
+    
+    def get(self, key):
+        with self._lock:
+            return self._lookup(key)
+    
+    def contains(self, key):
+        """Whether a fresh value is cached, without counting a lookup"""
+        with self._lock:
+            return self._lookup(key, count=False)[0]
+    
+    def put(self, key, value):
+        stored_at = time.time()
+        payload = json.dumps(self.encode(value), ensure_ascii=False)
+        with self._lock:
+            self._store(key, value, stored_at, len(payload))
+        if self.db_path:
+            with sqlite3.connect(self.db_path) as db:
+                db.execute(
+                    f"INSERT OR REPLACE INTO cache_{self.name} (key, stored_at, value) VALUES (?, ?, ?)",
+                    (key, stored_at, payload)
+                )
+    
+    def get_or_compute(self, key, compute, should_cache=lambda value: True):
+        """Return (value, cached); identical concurrent misses are coalesced into one compute"""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value, True
+            waiter = self.in_flight.get(key)
+            if waiter is None:
+                waiter = {'event': threading.Event(), 'value': None, 'error': None}
+                self.in_flight[key] = waiter
+                owner = True
+                self.stats['misses'] += 1
+            else:
+                owner = False
+                self.stats['coalesced'] += 1
+        
+        if not owner:
+            waiter['event'].wait()
+            if waiter['error'] is not None:
+                raise waiter['error']
+            return waiter['value'], True
+        
+        try:
+            value = compute()
+            waiter['value'] = value
+            if should_cache(value):
+                self.put(key, value)
+            return value, False
+        except Exception as e:
+            waiter['error'] = e
+            raise
+        finally:
+            with self._lock:
+                self.in_flight.pop(key, None)
+            waiter['event'].set()
+    
+    def summary(self):
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['disk_hits'] + self.stats['misses'] + self.stats['coalesced']
+            served = self.stats['hits'] + self.stats['disk_hits'] + self.stats['coalesced']
+            return dict(
+                self.stats,
+                entries=len(self.entries),
+                megabytes=self.current_bytes / (1024 * 1024),
+                hit_rate=served / lookups if lookups else 0.0
+            )
+
+@st.cache_resource
+def get_shared_cache(name):
+    """One cache per name for the whole server process, so every session shares it"""
+    settings = {
+        'search': ('SEARCH_CACHE_TTL_HOURS', 6, 'SEARCH_CACHE_MAX_MB', 256),
+        'bodies': ('BODY_CACHE_TTL_HOURS', 72, 'BODY_CACHE_MAX_MB', 256),
+        'redirects': ('REDIRECT_CACHE_TTL_HOURS', 24, 'REDIRECT_CACHE_MAX_MB', 16),
+        'extraction': ('EXTRACTION_CACHE_TTL_HOURS', 168, 'EXTRACTION_CACHE_MAX_MB', 64),
+    }
+    codecs = {
+        'search': (lambda articles: [article.to_dict() for article in articles],
+                   lambda rows: [Article.from_dict(row) for row in rows]),
+    }
+    ttl_key, ttl_default, size_key, size_default = settings[name]
+    encode, decode = codecs.get(name, (lambda value: value, lambda data: data))
+    return SharedCache(
+        name,
+        ttl_seconds=float(get_setting(ttl_key, ttl_default)) * 3600,
+        max_bytes=int(float(get_setting(size_key, size_default)) * 1024 * 1024),
+        db_path=get_setting("CACHE_DB_PATH"),
+        encode=encode,
+        decode=decode
+    )
+
+@st.cache_resource
+def get_source_yield_stats():
+    """Per-source yield, accumulated across runs and sessions of this server process"""
+    return {'stats': {}, 'lock': threading.Lock()}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# (connect, read) timeouts per transport session; names are news sources plus shared fetchers
+SOURCE_TIMEOUTS = {
+    'Google News': (5, 15),
+    'DuckDuckGo': (5, 20),
+    'Bing News': (5, 15),
+    'Yahoo News': (5, 15),
+    'Reuters RSS': (5, 20),
+    'Google Search': (5, 15),  # PR Newswire, Business Wire and Indian Business News
+    'articles': (5, 10),       # article pages and redirect resolution, across many hosts
+}
+DEFAULT_TIMEOUT = (5, 15)
+SOURCE_HEADERS = {
+    'DuckDuckGo': {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+    },
+}
+
+def _module_available(name):
+    try:
+        __import__(name)
+        return True
+    except ImportError:
+        return False
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default (connect, read) timeout when the caller gives none"""
+    
+    def __init__(self, timeout, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+    
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+class Http2Adapter(BaseAdapter):
+    """requests adapter backed by an httpx HTTP/2 client; responses are read in full.
+    
+    Streamed requests and requests with custom TLS verification, client
+    certificates or a proxy go through `fallback` (an HTTP/1.1 adapter) so
+    byte caps, verify and proxy settings keep working.
+    """
+    
+    def __init__(self, timeout, max_connections, fallback):
+        super().__init__()
+        import httpx
+        self.timeout = timeout
+        self.fallback = fallback
+        self.requests_sent = 0
+        self.client = httpx.Client(
+            http2=True,
+            follow_redirects=False,  # requests.Session follows redirects itself
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        import httpx
+        if stream or verify is not True or cert or requests.utils.select_proxy(request.url, proxies or {}):
+            return self.fallback.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        timeout = self.timeout if timeout is None else timeout
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        try:
+            reply = self.client.request(
+                request.method, request.url, headers=dict(request.headers), content=request.body,
+                timeout=httpx.Timeout(read, connect=connect)
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        self.requests_sent += 1
+        
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.reason = reply.reason_phrase
+        response.headers = requests.structures.CaseInsensitiveDict(reply.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = reply.content  # already decompressed by httpx
+        response._content_consumed = True
+        return response
+    
+    def close(self):
+        self.client.close()
+        self.fallback.close()
+
+class HttpTransport:
+    """Process-wide HTTP layer: one pooled session per source, compression and per-source timeouts.
+    
+    Sessions are shared by every scout, so keep-alive connections (and their TLS
+    handshakes) are reused across queries, jobs and browser sessions.
+    """
+    
+    def __init__(self, pool_maxsize=16, pool_connections=32, http2=False):
+        self.pool_maxsize = pool_maxsize
+        self.pool_connections = pool_connections
+        # HTTP/2 needs the optional h2 package next to httpx
+        self.http2 = http2 and _module_available('httpx') and _module_available('h2')
+        # urllib3 only decodes brotli when a brotli package is installed
+        brotli = _module_available('brotli') or _module_available('brotlicffi')
+        self.accept_encoding = 'gzip, deflate, br' if brotli else 'gzip, deflate'
+        self._sessions = {}
+        self._lock = threading.Lock()
+    
+    def session(self, name):
+        with self._lock:
+            if name not in self._sessions:
+                self._sessions[name] = self._create_session(name)
+            return self._sessions[name]
+    
+    def _create_session(self, name):
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': self.accept_encoding,
+            'Connection': 'keep-alive',
+        })
+        session.headers.update(SOURCE_HEADERS.get(name, {}))
+        timeout = SOURCE_TIMEOUTS.get(name, DEFAULT_TIMEOUT)
+        pooled = PooledAdapter(
+            timeout, pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize, max_retries=0
+        )
+        session.mount('http://', pooled)
+        # Article pages are streamed with a byte cap, so only search sessions use HTTP/2
+        if self.http2 and name != 'articles':
+            session.mount('https://', Http2Adapter(timeout, self.pool_maxsize, fallback=pooled))
+        else:
+            session.mount('https://', pooled)
+        return session
+    
+    def summary(self):
+        """Requests and new connections per session and host; reuse = share of requests on a kept-alive connection"""
+        rows = []
+        with self._lock:
+            sessions = list(self._sessions.items())
+        for name, session in sessions:
+            adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+            for adapter in adapters.values():
+                if hasattr(adapter, 'poolmanager'):
+                    pools = adapter.poolmanager.pools
+                    for key in list(pools.keys()):
+                        pool = pools.get(key)
+                        if pool is None or not pool.num_requests:
+                            continue
+                        rows.append({
+                            'Session': name, 'Host': pool.host, 'Requests': pool.num_requests,
+                            'Connections': pool.num_connections,
+                            'Reuse': 1 - pool.num_connections / pool.num_requests
+                        })
+                elif getattr(adapter, 'requests_sent', 0):
+                    rows.append({
+                        'Session': name, 'Host': 'HTTP/2 (all hosts)', 'Requests': adapter.requests_sent,
+                        'Connections': None, 'Reuse': None
+                    })
+        return rows
+
+class SourceClient:
+    """A scout's handle on a shared session, attaching the scout's status hook to each request"""
+    
+    def __init__(self, session, hook):
+        self.session = session
+        self.hook = hook
+        self.requests = 0  # every attempt, so paged and speculative fetches are charged too
+        self._lock = threading.Lock()
+    
+    def _count(self):
+        with self._lock:
+            self.requests += 1
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('hooks', {'response': self.hook})
+        self._count()
+        return self.session.request(method, url, **kwargs)
+    
+    def get(self, url, **kwargs):
+        kwargs.setdefault('hooks', {'response': self.hook})
+        self._count()
+        return self.session.get(url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        kwargs.setdefault('hooks', {'response': self.hook})
+        self._count()
+        return self.session.post(url, **kwargs)
+
+@st.cache_resource
+def get_http_transport():
+    """One HTTP transport for the whole server process"""
+    return HttpTransport(
+        pool_maxsize=int(get_setting("HTTP_POOL_MAXSIZE", 16)),
+        http2=str(get_setting("HTTP2", "false")).lower() in ('1', 'true', 'yes')
+    )
+
+# HTTP statuses that mean a source is refusing us for the rest of the run
+BLOCKED_STATUS_CODES = {401, 403, 429, 503}
+
+# Query parameters that only identify the referrer or campaign, never the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', 'ocid', 'cvid',
+    'ei', 'ved', 'usg', 'sa', 'cmpid', 'cmp', 'icid', 'ito', 'ncid', 'sr_share', 'smid',
+    'fromapp', 'ref', 'ref_src', 'referrer', 'rss', 'amp', 'outputtype',
+}
+TRACKING_PARAM_PREFIXES = ('utm_', '_ga', '_gl', 'hsa_', 'pk_', 'mtm_', 'at_')
+HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+AMP_PATH_PATTERN = re.compile(r'(?:/amp/?|\.amp(?:\.html?)?|/amp\.html?)$', re.IGNORECASE)
+AMP_CACHE_PATTERN = re.compile(r'^/(?:c/)?(?:s/)?([^/]+\.[^/]+)(/.*)?$')
+
+# Hosts whose links are redirects to the real article, resolved over the network
+REDIRECT_HOSTS = {
+    'news.google.com', 'feedproxy.google.com', 'bit.ly', 't.co', 'ow.ly', 'tinyurl.com',
+    'buff.ly', 'dlvr.it', 'lnkd.in', 'trib.al', 'shorturl.at', 'rb.gy',
+}
+
+def unwrap_redirect_url(url):
+    """Target URL embedded in a search engine click-tracking link, or the link unchanged"""
+    parsed = urllib.parse.urlparse(url)
+    host = parsed.netloc.lower()
+    query = urllib.parse.parse_qs(parsed.query)
+    if 'duckduckgo.com' in host and 'uddg' in query:
+        return query['uddg'][0]
+    if 'bing.com' in host:
+        if 'url' in query:  # /news/apiclick.aspx
+            return query['url'][0]
+        encoded = query.get('u', [''])[0]
+        if encoded.startswith('a1'):  # /ck/a?...&u=a1<base64url>
+            try:
+                target = base64.urlsafe_b64decode(encoded[2:] + '=' * (-len(encoded[2:]) % 4)).decode('utf-8')
+            except Exception:
+                return url
+            return target if target.startswith(('http://', 'https://')) else url
+    if host.endswith('google.com') and parsed.path == '/url':
+        return (query.get('q') or query.get('url') or [url])[0]
+    if 'r.search.yahoo.com' in host:
+        match = re.search(r'/RU=([^/]+)/', parsed.path)
+        if match:
+            return urllib.parse.unquote(match.group(1))
+    return url
+
+def canonicalize_url(url):
+    """Canonical form of an article URL for dedup: https, bare lower-case host, no tracking
+    parameters, fragment, AMP variant or trailing slash; remaining parameters sorted"""
+    url = (url or '').strip()
+    if url.startswith('//'):
+        url = 'https:' + url
+    url = unwrap_redirect_url(url)
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return url
+    
+    host = (parsed.hostname or '').lower().rstrip('.')
+    path = parsed.path or '/'
+    # Google / Cloudflare AMP caches serve another site's page under their own host
+    if host.endswith('.cdn.ampproject.org') or (host.endswith('google.com') and path.startswith('/amp/')):
+        match = AMP_CACHE_PATTERN.match(path[4:] if path.startswith('/amp/') else path)
+        if match:
+            host, path = match.group(1).lower(), match.group(2) or '/'
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix) and host.count('.') > 1:
+            host = host[len(prefix):]
+            break
+    if parsed.port and parsed.port not in (80, 443):
+        host = f"{host}:{parsed.port}"
+    
+    path = re.sub(r'/{2,}', '/', path)
+    if path.lower().startswith('/amp/'):
+        path = path[4:]
+    path = AMP_PATH_PATTERN.sub('', path) or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    
+    params = [
+        (key, value) for key, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ]
+    query = urllib.parse.urlencode(sorted(params))
+    return urllib.parse.urlunparse(('https', host, path, '', query, ''))
+
+# Date formats seen in article metadata and snippets, tried in order
+DATE_FORMATS = [
+    '%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%d/%m/%Y', '%d-%m-%Y',
+    '%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y', '%b %d %Y', '%B %d %Y',
+    '%d %b, %Y', '%d %B, %Y'
+]
+
+RELATIVE_DATE_PATTERN = re.compile(
+    r'^(\d+)\s*(s|sec|secs|second|seconds|m|min|mins|minute|minutes|h|hr|hrs|hour|hours|'
+    r'd|day|days|w|wk|week|weeks|mo|mon|month|months|y|yr|yrs|year|years)\b\.?(\s+ago)?$',
+    re.IGNORECASE
+)
+RELATIVE_UNITS = {
+    's': timedelta(seconds=1), 'm': timedelta(minutes=1), 'h': timedelta(hours=1),
+    'd': timedelta(days=1), 'w': timedelta(weeks=1), 'mo': timedelta(days=30), 'y': timedelta(days=365)
+}
+
+URL_DATE_PATTERNS = [
+    re.compile(r'/(20\d{2})[/-](\d{1,2})[/-](\d{1,2})(?:/|-|$)'),
+    re.compile(r'[/_-](20\d{2})(\d{2})(\d{2})(?:\d{0,6})(?:[/_.-]|$)'),
+    re.compile(r'/(20\d{2})/(\d{1,2})/')
+]
+SNIPPET_DATE_PATTERN = re.compile(
+    r'\b(?:\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*,?\s+20\d{2}|'
+    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2},?\s+20\d{2})\b'
+)
+
+# Schema for company objects returned by the extraction model: field -> (default, allowed values)
+COMPANY_SCHEMA = {
+    'company_name': (None, None),
+    'core_intent': ('Private Sector Project', None),
+    'stage': ('Under Development', None),
+    'detailed_timeline': ('Timeline not specified', None),
+    'project_type': ('Unknown', {'greenfield': 'Greenfield', 'brownfield': 'Brownfield'}),
+    'sector': ('Private Sector', None),
+    'confidence': ('medium', {'high': 'high', 'medium': 'medium', 'low': 'low'}),
+    'is_private_sector': (False, None)
+}
+PLACEHOLDER_NAMES = {'', 'null', 'none', 'n/a', 'na', 'unknown', 'not mentioned', 'not specified', 'extracted company name'}
+
+def _close_json(text):
+    """Close any open brackets of truncated output, dropping a cut-off string value, dangling key or comma"""
+    stack = []
+    in_string = escaped = False
+    string_start = 0
+    for position, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            string_start = position
+        elif char in '{[':
+            stack.append('}' if char == '{' else ']')
+        elif char in '}]' and stack:
+            stack.pop()
+    if in_string:
+        # A half-written value (possibly a company name) is worse than none
+        text = text[:string_start]
+    text = re.sub(r'(,\s*"[^"]*"\s*:?\s*|(?<=\{)\s*"[^"]*"\s*:?\s*|[,:]\s*)$', '', text.rstrip())
+    return text + ''.join(reversed(stack))
+
+# String literals (possibly cut off at the end), Python literals and trailing commas; only the
+# last two are rewritten, so "True North Ltd" or "None of the plants" inside a value stay intact
+JSON_REPAIR_PATTERN = re.compile(r'("(?:[^"\\]|\\.)*(?:"|$))|\b(True|False|None)\b|,(\s*[}\]])')
+PYTHON_LITERALS = {'True': 'true', 'False': 'false', 'None': 'null'}
+
+def _repair_token(match):
+    string, literal, closer = match.groups()
+    if string is not None:
+        return string
+    if literal is not None:
+        return PYTHON_LITERALS[literal]
+    return closer
+
+def repair_json_text(text):
+    """Fix common LLM JSON defects: code fences, prose around the object, trailing commas, Python literals"""
+    text = re.sub(r'^\s*```(?:json)?\s*|\s*```\s*$', '', text.strip(), flags=re.IGNORECASE)
+    start = min((position for position in (text.find('{'), text.find('[')) if position >= 0), default=-1)
+    if start > 0:
+        text = text[start:]
+    end = max(text.rfind('}'), text.rfind(']'))
+    if end >= 0 and text[end + 1:].strip() and not text[end + 1:].strip().startswith(('"', ',')):
+        text = text[:end + 1]
+    return JSON_REPAIR_PATTERN.sub(_repair_token, text)
+
+def parse_llm_json(text):
+    """Parse extraction output tolerantly.
+    
+    Returns (companies, status) where status is 'ok', 'repaired', 'salvaged' or
+    'failed'. Salvaging keeps every complete company object found in output
+    that cannot be repaired as a whole, e.g. when it was cut off mid-array.
+    """
+    text = (text or '').strip()
+    try:
+        data = json.loads(text)
+        status = 'ok'
+    except json.JSONDecodeError:
+        data = None
+    
+    if data is None:
+        repaired = repair_json_text(text)
+        for candidate in (repaired, _close_json(repaired)):
+            try:
+                data = json.loads(candidate)
+                status = 'repaired'
+                break
+            except json.JSONDecodeError:
+                continue
+    
+    if isinstance(data, dict) and isinstance(data.get('companies'), list):
+        return data['companies'], status
+    if isinstance(data, list):
+        return data, status
+    if isinstance(data, dict) and 'company_name' in data:
+        return [data], status
+    
+    # Salvage complete company objects from whatever is left
+    decoder = json.JSONDecoder()
+    repaired = repair_json_text(text)
+    companies = []
+    position = repaired.find('{')
+    while position >= 0:
+        try:
+            value, end = decoder.raw_decode(repaired, position)
+        except json.JSONDecodeError:
+            position = repaired.find('{', position + 1)
+            continue
+        if isinstance(value, dict) and 'company_name' in value:
+            companies.append(value)
+            position = repaired.find('{', end)
+        else:
+            position = repaired.find('{', position + 1)
+    return companies, ('salvaged' if companies else 'failed')
+
+def validate_company(company):
+    """Normalize a company object against COMPANY_SCHEMA; None if it is not a usable private sector lead"""
+    if not isinstance(company, dict):
+        return None
+    normalized = {}
+    for field, (default, allowed) in COMPANY_SCHEMA.items():
+        value = company.get(field, default)
+        if field == 'is_private_sector':
+            value = value if isinstance(value, bool) else str(value).strip().lower() in ('true', 'yes', '1')
+        elif value is None or isinstance(value, (dict, list)):
+            value = default
+        else:
+            value = ' '.join(str(value).split()) or default
+            if allowed is not None:
+                value = allowed.get(str(value).lower(), default)
+        normalized[field] = value
+    
+    if str(normalized['company_name'] or '').strip().lower() in PLACEHOLDER_NAMES:
+        return None
+    if not normalized['is_private_sector']:
+        return None
+    return normalized
+
+# Named lead scoring profiles: feature weights plus the sectors each profile cares most about.
+# 'Balanced' reproduces the original hand-tuned scoring.
+SCORING_PROFILES = {
+    'Balanced': {
+        'weights': {
+            'confidence': 1.0, 'project_type': 2.0, 'stage_signal': 2.0, 'specific_timeline': 2.0,
+            'high_priority_sector': 3.0, 'medium_priority_sector': 2.0, 'other_sector': 1.0, 'private_sector': 1.0
+        },
+        'high_priority_sectors': ['manufacturing', 'warehouse', 'logistics park', 'data centre', 'industrial park'],
+        'medium_priority_sectors': ['hospital', 'it park', 'corporate campus', 'office tower']
+    },
+    'Warehousing sales': {
+        'weights': {
+            'confidence': 1.0, 'project_type': 1.0, 'stage_signal': 3.0, 'specific_timeline': 3.0,
+            'high_priority_sector': 5.0, 'medium_priority_sector': 2.0, 'other_sector': 0.0, 'private_sector': 1.0
+        },
+        'high_priority_sectors': ['warehouse', 'logistics park', 'industrial park'],
+        'medium_priority_sectors': ['manufacturing', 'factory', 'production facility', 'industrial unit', 'retail']
+    },
+    'Hospital HVAC': {
+        'weights': {
+            'confidence': 1.0, 'project_type': 3.0, 'stage_signal': 2.0, 'specific_timeline': 3.0,
+            'high_priority_sector': 5.0, 'medium_priority_sector': 2.5, 'other_sector': 0.0, 'private_sector': 1.0
+        },
+        'high_priority_sectors': ['hospital', 'healthcare', 'medical center', 'clinic'],
+        'medium_priority_sectors': ['pharmaceutical', 'laboratory', 'research center', 'r&d facility', 'data centre']
+    }
+}
+
+TIMELINE_INDICATORS = [
+    '2024', '2025', 'q1', 'q2', 'q3', 'q4', 'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december'
+]
+
+class LeadScorer:
+    """Columnar lead scoring.
+    
+    Feature columns are computed once per lead table; scoring under any
+    profile is then a single matrix-vector product, so re-ranking needs no
+    LLM re-run and no per-row Python.
+    """
+    
+    FEATURES = ['confidence', 'project_type', 'stage_signal', 'specific_timeline', 'private_sector']
+    
+    def __init__(self, lead_signals):
+        self.signal_pattern = '|'.join(re.escape(signal) for signal in lead_signals)
+        self.timeline_pattern = '|'.join(re.escape(indicator) for indicator in TIMELINE_INDICATORS)
+    
+    def build_table(self, companies):
+        """Lead DataFrame with feature columns (prefixed with '_') added"""
+        import numpy as np
+        import pandas as pd
+        table = pd.DataFrame([company.to_row() if hasattr(company, 'to_row') else company for company in companies])
+        confidence = table['Confidence'].astype(str)
+        table['_confidence'] = np.select([confidence == 'high', confidence == 'medium'], [3.0, 2.0], 1.0)
+        table['_project_type'] = table['Project Type'].isin(['Greenfield', 'Brownfield']).astype(float)
+        table['_stage_signal'] = table['Stage'].astype(str).str.lower().str.contains(self.signal_pattern, regex=True).astype(float)
+        timeline = table.get('Detailed Timeline', pd.Series('', index=table.index)).fillna('').astype(str)
+        table['_specific_timeline'] = timeline.str.lower().str.contains(self.timeline_pattern, regex=True).astype(float)
+        table['_private_sector'] = table.get('Private Sector', pd.Series(True, index=table.index)).fillna(True).astype(bool).astype(float)
+        # Sector tiers depend on the profile, so keep sectors categorical and resolve tiers per category
+        table['_sector'] = table['Sector'].astype(str).str.lower().astype('category')
+        table['_dedup_key'] = (
+            table['Company Name'].astype(str).str.lower().str.strip() + '_' + table['Core Intent'].astype(str).str[:30]
+        )
+        return table
+    
+    def score(self, table, profile_name):
+        """Score every lead under a profile with vector operations"""
+        import numpy as np
+        profile = SCORING_PROFILES[profile_name]
+        weights = profile['weights']
+        features = table[[f'_{feature}' for feature in self.FEATURES]].to_numpy(dtype=float)
+        scores = features @ np.array([weights[feature] for feature in self.FEATURES])
+        
+        # Tier per unique sector (first matching tier wins, as substring match), then broadcast by code
+        tier_weights = []
+        for sector in table['_sector'].cat.categories:
+            if any(priority in sector for priority in profile['high_priority_sectors']):
+                tier_weights.append(weights['high_priority_sector'])
+            elif any(priority in sector for priority in profile['medium_priority_sectors']):
+                tier_weights.append(weights['medium_priority_sector'])
+            else:
+                tier_weights.append(weights['other_sector'])
+        if tier_weights:
+            scores = scores + np.asarray(tier_weights)[table['_sector'].cat.codes.to_numpy()]
+        return scores
+    
+    @staticmethod
+    def max_score(profile_name):
+        weights = SCORING_PROFILES[profile_name]['weights']
+        return (3 * weights['confidence'] + weights['project_type'] + weights['stage_signal'] + weights['specific_timeline']
+                + max(weights['high_priority_sector'], weights['medium_priority_sector'], weights['other_sector'])
+                + weights['private_sector'])
+    
+    def rank(self, table, profile_name):
+        """Leads sorted by score under the profile, one row per company + core intent"""
+        if table.empty:
+            return table
+        ranked = table.assign(**{'Relevance Score': self.score(table, profile_name)})
+        ranked = ranked.sort_values('Relevance Score', ascending=False, kind='stable')
+        ranked = ranked.drop_duplicates('_dedup_key')
+        return ranked[[column for column in ranked.columns if not column.startswith('_')]].reset_index(drop=True)
+    
+    @staticmethod
+    def lead_count(table):
+        """Number of leads rank() returns for a table, without scoring it"""
+        if table is None or table.empty:
+            return 0
+        return int(table['_dedup_key'].nunique())
+
+class ArticlePrioritizer:
+    """Cheap pre-extraction score used to spend an analysis budget on the best articles first.
+    
+    Each component is scaled to [0, 1]: distinct lead signals and sectors mentioned
+    in the article text, the historical lead rate of the source that found it,
+    and recency with an exponential half-life.
+    """
+    
+    WEIGHTS = {'signals': 3.0, 'sectors': 2.0, 'source': 2.0, 'recency': 1.5}
+    
+    def __init__(self, lead_signals, sectors, half_life_days=60, now=None):
+        self.signal_pattern = re.compile('|'.join(re.escape(signal) for signal in lead_signals), re.IGNORECASE)
+        self.sector_pattern = re.compile(r'\b(?:' + '|'.join(re.escape(sector) for sector in sectors) + r')\b', re.IGNORECASE)
+        self.half_life = half_life_days * 86400
+        self.now = (now or datetime.now(timezone.utc)).timestamp()
+        self._source_rates = {}
+    
+    def source_rate(self, source):
+        """Smoothed leads per unique article from earlier runs, scaled so 0.5 leads/article is the top"""
+        if source not in self._source_rates:
+            history = SourceScheduler.historical(source)
+            rate = (history['leads'] + 1.0) / (history['unique'] + 5.0)
+            self._source_rates[source] = min(rate / 0.5, 1.0)
+        return self._source_rates[source]
+    
+    def score(self, article):
+        text = article.content[:2000]
+        signals = len({match.lower() for match in self.signal_pattern.findall(text)})
+        sectors = len({match.lower() for match in self.sector_pattern.findall(text)})
+        if article.timestamp is not None:
+            recency = 0.5 ** (max(self.now - article.timestamp, 0.0) / self.half_life)
+        else:
+            recency = 0.25
+        return (self.WEIGHTS['signals'] * min(signals, 3) / 3
+                + self.WEIGHTS['sectors'] * min(sectors, 2) / 2
+                + self.WEIGHTS['source'] * self.source_rate(article.search_source or article.source)
+                + self.WEIGHTS['recency'] * recency)
+    
+    def queue(self, articles, start_index, end_index, skip=(), chunk_size=500):
+        """Max-priority heap of (-score, position), built chunk by chunk"""
+        heap = []
+        for chunk_start in range(start_index, end_index, chunk_size):
+            chunk = articles[chunk_start:min(chunk_start + chunk_size, end_index)]
+            heap.extend(
+                (-self.score(article), position)
+                for position, article in enumerate(chunk, start=chunk_start)
+                if position not in skip
+            )
+        heapq.heapify(heap)
+        return heap
+
+class AnalysisBudget:
+    """Limits on LLM calls, tokens and wall-clock seconds for one analysis run; None means unlimited"""
+    
+    def __init__(self, max_calls=None, max_tokens=None, max_seconds=None):
+        self.max_calls = max_calls or None
+        self.max_tokens = max_tokens or None
+        self.max_seconds = max_seconds or None
+        self.started = time.monotonic()
+    
+    def start(self):
+        """Restart the wall clock; called where extraction begins so preview work is not charged"""
+        self.started = time.monotonic()
+    
+    def usage(self, cascade_stats):
+        tiers = (cascade_stats['triage'], cascade_stats['extraction'])
+        return {
+            'calls': sum(tier['calls'] for tier in tiers),
+            'tokens': sum(tier['tokens'] for tier in tiers),
+            'seconds': time.monotonic() - self.started
+        }
+    
+    def fraction_used(self, cascade_stats):
+        used = self.usage(cascade_stats)
+        limits = {'calls': self.max_calls, 'tokens': self.max_tokens, 'seconds': self.max_seconds}
+        fractions = [used[name] / limit for name, limit in limits.items() if limit]
+        return max(fractions) if fractions else 0.0
+    
+    def exhausted(self, cascade_stats):
+        return self.fraction_used(cascade_stats) >= 1.0
+    
+    def describe(self):
+        parts = []
+        if self.max_calls:
+            parts.append(f"{self.max_calls} LLM calls")
+        if self.max_tokens:
+            parts.append(f"{self.max_tokens:,} tokens")
+        if self.max_seconds:
+            parts.append(f"{self.max_seconds:.0f}s")
+        return ", ".join(parts) or "no limit"
+
+# Rule-based extraction patterns. A company name is up to five capitalized words
+# before a legal suffix, or a capitalized headline subject before a project verb.
+LEGAL_SUFFIX = r"(?:Pvt\.?\s+Ltd\.?|Private\s+Limited|Ltd\.?|Limited|LLP|Inc\.?|Corporation|Corp\.?)"
+NAME_WORD = r"(?:[A-Z][A-Za-z0-9&'.-]*|&)"
+COMPANY_SUFFIX_PATTERN = re.compile(rf"\b((?:{NAME_WORD}\s+){{0,4}}{NAME_WORD}\s+{LEGAL_SUFFIX})(?![A-Za-z])")
+TRAILING_SUFFIX_PATTERN = re.compile(rf"(?:\s+{LEGAL_SUFFIX})+$", re.IGNORECASE)
+# Sentence ends, except after abbreviations such as "Ltd." or "Rs." that sit mid-sentence
+SENTENCE_ABBREVIATIONS = ['Ltd', 'Pvt', 'Inc', 'Corp', 'Co', 'Bros', 'No', 'Rs', 'Dr', 'Mr', 'Mrs', 'Ms', 'Jr', 'Sr', 'St', 'vs']
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])" + ''.join(rf"(?<!\b{abbreviation}\.)" for abbreviation in SENTENCE_ABBREVIATIONS) + r"\s+")
+HEADLINE_SUBJECT_PATTERN = re.compile(
+    rf"^((?:{NAME_WORD}\s+){{0,3}}{NAME_WORD})\s+(?:to|will|plans?|announces?|unveils?|launch(?:es)?|opens?|"
+    r"inaugurates?|sets?\s+up|expands?|breaks|lays|commissions?|invests?|begins?|starts?|signs?|bags?|wins?|gets?)\b"
+)
+NAME_STOPWORDS = {
+    'the', 'a', 'an', 'india', "india's", 'indian', 'new', 'breaking', 'exclusive', 'update', 'report', 'govt',
+    'government', 'pm', 'cm', 'centre', 'state', 'it', 'this', 'its', 'how', 'why', 'what', 'after', 'with',
+}
+PUBLIC_SECTOR_PATTERN = re.compile(
+    r"\b(?:Government|Govt|Ministry|Municipal|Authority|Department|Board|Railways?|Nigam|Council|Commission|"
+    r"NHAI|Police|Army|Navy|State|National\s+Highways|Panchayat|Cantonment)\b"
+)
+SECTOR_ALIASES = {
+    'data center': 'data centre', 'medical centre': 'medical center', 'research centre': 'research center',
+    'financial centre': 'financial center', 'warehousing': 'warehouse', 'plant': 'manufacturing',
+}
+BROWNFIELD_PATTERN = re.compile(
+    r"\b(?:brownfield|expan(?:d|ds|ding|sion)|capacity|moderni[sz](?:e|es|ing|ation)|renovat(?:e|es|ing|ion)|"
+    r"upgrad(?:e|es|ing)|second\s+phase|phase\s+(?:ii|2))\b", re.IGNORECASE
+)
+GREENFIELD_PATTERN = re.compile(
+    r"\b(?:greenfield|new|set\s+up|setting\s+up|sets\s+up|foundation\s+stone|ground\s*breaking|break(?:s|ing)?\s+ground|"
+    r"construction\s+began|upcoming)\b", re.IGNORECASE
+)
+MONTH_NAMES = r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
+TIMELINE_PATTERN = re.compile(
+    r"\b(?:(?:by|in|from|until|till|before|during|end\s+of|starting)\s+)?(?:"
+    r"Q[1-4]\s*(?:FY\s*)?(?:20)?\d{2}|"
+    r"(?:H[12]|first\s+half|second\s+half)\s+(?:of\s+)?(?:FY\s*)?20\d{2}|"
+    r"FY\s*(?:20)?\d{2}(?:-\d{2})?|"
+    rf"(?:\d{{1,2}}(?:st|nd|rd|th)?\s+)?{MONTH_NAMES}\.?,?\s+(?:\d{{1,2}},?\s+)?20\d{{2}}|"
+    r"(?:within|in)\s+(?:the\s+)?(?:next\s+)?\d+\s+(?:months?|years?|weeks?)|"
+    r"next\s+(?:year|quarter|month)"
+    r")\b|\b(?:by|in|from|until|till|before|during)\s+20[2-4]\d\b",
+    re.IGNORECASE
+)
+
+class RuleBasedExtractor:
+    """Local, network-free company extraction producing rows in COMPANY_SCHEMA.
+    
+    Names come from legal-suffix and headline-subject patterns, sector from
+    SECTORS, stage from LEAD_SIGNALS and timeline from date patterns. Used as an
+    instant preview of an analysis and as the fallback when Groq fails.
+    """
+    
+    MAX_COMPANIES = 5
+    
+    def __init__(self, lead_signals, sectors):
+        names = sorted(set(sectors) | set(SECTOR_ALIASES), key=len, reverse=True)
+        self.sector_pattern = re.compile(r'\b(' + '|'.join(re.escape(name) for name in names) + r')s?\b', re.IGNORECASE)
+        signals = sorted(lead_signals, key=len, reverse=True)
+        self.signal_pattern = re.compile(r'\b(' + '|'.join(re.escape(signal) for signal in signals) + r')\b', re.IGNORECASE)
+    
+    @staticmethod
+    def clean_name(name):
+        """Drop leading words that are not part of the name; None if nothing usable is left"""
+        words = re.split(r'[;:]\s+', SENTENCE_BREAK.split(name)[-1])[-1].split()  # the pattern can run across a sentence end
+        while words and (words[0].lower() in NAME_STOPWORDS or words[0].lower().endswith('-based')):
+            words.pop(0)
+        name = ' '.join(words).strip(" .,'&-")
+        if len(name) < 3 or PUBLIC_SECTOR_PATTERN.search(name):
+            return None
+        return name
+    
+    @staticmethod
+    def name_key(name):
+        """Dedup key ignoring case and the legal suffix, so "Apex Ltd" and "Apex Limited" are one company"""
+        return ' '.join(TRAILING_SUFFIX_PATTERN.sub('', name).lower().replace('.', ' ').split())
+    
+    def company_names(self, title, text):
+        """(name, has legal suffix) pairs in order of appearance"""
+        found = {}
+        for match in COMPANY_SUFFIX_PATTERN.finditer(text):
+            name = self.clean_name(match.group(1))
+            if name and self.name_key(name) not in found:
+                found[self.name_key(name)] = (name, True)
+        if not found:
+            match = HEADLINE_SUBJECT_PATTERN.match(title)
+            name = self.clean_name(match.group(1)) if match else None
+            if name:
+                found[self.name_key(name)] = (name, False)
+        return list(found.values())[:self.MAX_COMPANIES]
+    
+    def _first(self, pattern, title, text):
+        match = pattern.search(title) or pattern.search(text)
+        return match.group(1) if match else None
+    
+    def extract(self, title, content):
+        """Validated company objects for one article"""
+        text = content[:4000]
+        if not text.startswith(title):
+            text = f"{title}. {text}"
+        names = self.company_names(title, text)
+        if not names:
+            return []
+        
+        sector = self._first(self.sector_pattern, title, text)
+        if sector:
+            sector = SECTOR_ALIASES.get(sector.lower(), sector.lower())
+        signal = self._first(self.signal_pattern, title, text)
+        if re.search(r'\bbrownfield\b', text, re.IGNORECASE) or (
+                not re.search(r'\bgreenfield\b', text, re.IGNORECASE) and BROWNFIELD_PATTERN.search(text)):
+            project_type = 'Brownfield'
+        elif GREENFIELD_PATTERN.search(text):
+            project_type = 'Greenfield'
+        else:
+            project_type = 'Unknown'
+        timeline = list(dict.fromkeys(' '.join(match.group(0).split()) for match in TIMELINE_PATTERN.finditer(text)))[:2]
+        
+        companies = []
+        for name, has_suffix in names:
+            sentence = next((part for part in SENTENCE_BREAK.split(text) if name in part), title)
+            company = validate_company({
+                'company_name': name,
+                'core_intent': sentence[:150],
+                'stage': signal[:1].upper() + signal[1:] if signal else None,
+                'detailed_timeline': '; '.join(timeline) or None,
+                'project_type': project_type,
+                'sector': sector,
+                'confidence': 'medium' if has_suffix and (signal or project_type != 'Unknown') else 'low',
+                'is_private_sector': True
+            })
+            if company is not None:
+                companies.append(company)
+        return companies
+    
+    def leads(self, articles):
+        """Leads for a sequence of articles"""
+        return [Lead(company, article) for article in articles for company in self.extract(article.title, article.content)]
+
+class SourceScheduler:
+    """Adaptive allocation of a search request budget across news sources.
+    
+    Each source's share of the budget follows its measured yield (unique
+    articles plus extracted leads per request), blended with what earlier runs
+    in this process observed. Sources that fail repeatedly or answer with a
+    blocking status are skipped for the rest of the run. The budget counts HTTP
+    requests, so a paged query is charged for every page it fetched; without a
+    budget every term is sent to every source.
+    """
+    
+    def __init__(self, sources, num_terms, request_budget=None, min_requests=2, failure_limit=3, lead_weight=3.0):
+        self.sources = list(sources)
+        self.num_terms = max(num_terms, 1)
+        self.request_budget = request_budget
+        self.min_requests = min_requests
+        self.failure_limit = failure_limit
+        self.lead_weight = lead_weight
+        self.requests_made = 0
+        self.credit = {source: 0.0 for source in self.sources}
+        self.run_stats = {
+            source: {'queries': 0, 'requests': 0, 'cached': 0, 'articles': 0, 'unique': 0, 'consecutive_failures': 0, 'blocked': None}
+            for source in self.sources
+        }
+    
+    @staticmethod
+    def historical(source):
+        """Yield counters for a source accumulated over previous runs"""
+        store = get_source_yield_stats()
+        with store['lock']:
+            return dict(store['stats'].get(source, {'requests': 0, 'unique': 0, 'leads': 0}))
+    
+    @staticmethod
+    def record_leads(source, count):
+        """Credit extracted leads to the source that found the article"""
+        store = get_source_yield_stats()
+        with store['lock']:
+            stats = store['stats'].setdefault(source, {'requests': 0, 'unique': 0, 'leads': 0})
+            stats['leads'] += count
+    
+    def yield_score(self, source):
+        """Smoothed yield per request; unmeasured sources start at the prior"""
+        history = self.historical(source)
+        run = self.run_stats[source]
+        requests_made = history['requests'] + run['requests']
+        value = history['unique'] + run['unique'] + self.lead_weight * history['leads']
+        prior_requests, prior_value = 2.0, 10.0
+        return (value + prior_value) / (requests_made + prior_requests)
+    
+    def active_sources(self):
+        return [source for source in self.sources if not self.run_stats[source]['blocked']]
+    
+    def requests_per_query(self):
+        """Measured HTTP requests per source query this run (paged sources send several)"""
+        queries = sum(run['queries'] for run in self.run_stats.values())
+        return self.requests_made / queries if queries and self.requests_made else 1.0
+    
+    def plan(self, term_index):
+        """Choose which sources to query for the next search term"""
+        active = self.active_sources()
+        remaining_terms = max(self.num_terms - term_index, 1)
+        if self.request_budget is None:
+            remaining_queries = len(active) * remaining_terms
+        else:
+            remaining_queries = -(-(self.request_budget - self.requests_made) // self.requests_per_query())
+        remaining_queries = max(int(remaining_queries), 0)
+        if not active or remaining_queries <= 0:
+            return []
+        
+        # Exploration: every source gets a few queries before yield decides
+        exploring = [source for source in active if self.run_stats[source]['queries'] < self.min_requests]
+        if exploring:
+            return exploring[:remaining_queries]
+        
+        # Spread the remaining budget over the remaining terms, then water-fill
+        # per-term shares proportional to yield, capped at one query per term
+        per_term = min(remaining_queries / remaining_terms, len(active))
+        scores = {source: self.yield_score(source) for source in active}
+        shares = {}
+        open_sources = set(active)
+        budget_left = per_term
+        while open_sources and budget_left > 1e-9:
+            total = sum(scores[source] for source in open_sources)
+            capped = set()
+            for source in open_sources:
+                share = shares.get(source, 0.0) + budget_left * scores[source] / total
+                if share >= 1.0:
+                    share = 1.0
+                    capped.add(source)
+                shares[source] = share
+            budget_left = per_term - sum(shares.values())
+            if not capped:
+                break
+            open_sources -= capped
+        
+        for source in active:
+            self.credit[source] += shares.get(source, 0.0)
+        chosen = [source for source in sorted(active, key=lambda s: -self.credit[source]) if self.credit[source] >= 1.0 - 1e-9]
+        for source in chosen:
+            self.credit[source] -= 1.0
+        return chosen[:remaining_queries]
+    
+    def record(self, source, article_count, unique_count, status_code=None, error=None, cached=False, requests=1):
+        """Record the outcome of one source query (`requests` pages) and decide whether the source is blocked"""
+        run = self.run_stats[source]
+        if cached:
+            # Served from the shared cache: free, and says nothing new about the source
+            run['cached'] += 1
+            run['articles'] += article_count
+            run['unique'] += unique_count
+            return
+        
+        self.requests_made += requests
+        run['queries'] += 1
+        run['requests'] += requests
+        run['articles'] += article_count
+        run['unique'] += unique_count
+        
+        if status_code in BLOCKED_STATUS_CODES:
+            run['blocked'] = f"HTTP {status_code}"
+        elif error is not None or article_count == 0:
+            run['consecutive_failures'] += 1
+            if run['consecutive_failures'] >= self.failure_limit:
+                run['blocked'] = 'error' if error is not None else 'no results'
+        else:
+            run['consecutive_failures'] = 0
+        
+        store = get_source_yield_stats()
+        with store['lock']:
+            stats = store['stats'].setdefault(source, {'requests': 0, 'unique': 0, 'leads': 0})
+            stats['requests'] += requests
+            stats['unique'] += unique_count
+    
+    def summary(self):
+        """Per-source report rows for display"""
+        rows = []
+        for source in self.sources:
+            run = self.run_stats[source]
+            history = self.historical(source)
+            rows.append({
+                'Source': source,
+                'Queries': run['queries'],
+                'Requests': run['requests'],
+                'Cache Hits': run['cached'],
+                'Unique Articles': run['unique'],
+                'Articles / Request': round(run['unique'] / run['requests'], 2) if run['requests'] else 0.0,
+                'Leads / Request (all runs)': round(history['leads'] / history['requests'], 2) if history['requests'] else 0.0,
+                'Status': f"skipped ({run['blocked']})" if run['blocked'] else 'active'
+            })
+        return rows
+
+# Per-article extraction results are checkpointed here so interrupted analyses can resume
+CHECKPOINT_DIR = get_setting("CHECKPOINT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scout_checkpoints'))
+CHECKPOINT_RETENTION_DAYS = 7
+
+class ExtractionCheckpoint:
+    """Append-only on-disk record of per-article extraction results for one article set, range and mode"""
+    
+    def __init__(self, articles, start_index, end_index, mode='range', directory=CHECKPOINT_DIR):
+        if hasattr(articles, 'digest'):
+            fingerprint = articles.digest()  # kept up to date while the store was written
+        else:
+            fingerprint = hashlib.sha1()
+            for article in articles:
+                fingerprint.update(ArticleStore.fingerprint_line(article))
+        # Range and budget runs over the same articles record different subsets, so never share a file
+        fingerprint.update(f"{mode}:{start_index}:{end_index}".encode('ascii'))
+        
+        self.key = fingerprint.hexdigest()[:20]
+        self.start_index = start_index
+        self.end_index = end_index
+        self.mode = mode
+        self.directory = directory
+        self.path = os.path.join(directory, f"{self.key}.jsonl")
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def prune(directory=CHECKPOINT_DIR, retention_days=CHECKPOINT_RETENTION_DAYS):
+        """Delete checkpoints not touched within the retention window"""
+        if not os.path.isdir(directory):
+            return
+        cutoff = time.time() - retention_days * 86400
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            try:
+                if name.endswith('.jsonl') and os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                continue
+    
+    def load(self):
+        """Completed results as {article index: [leads]}; a torn final line is ignored"""
+        completed = {}
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, 'r', encoding='utf-8') as checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                completed[entry['index']] = entry['leads']
+        return completed
+    
+    def record(self, index, link, leads):
+        """Durably append the extraction result for one article"""
+        line = json.dumps({'index': index, 'link': link, 'leads': leads}, ensure_ascii=False)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as checkpoint_file:
+                checkpoint_file.write(line + '\n')
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+    
+    def completed_count(self):
+        return len(self.load())
+    
+    def total(self):
+        return self.end_index - self.start_index
+    
+    def clear(self):
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+ARTICLE_STORE_DIR = get_setting("ARTICLE_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), '.scout_articles'))
+ARTICLE_STORE_RETENTION_DAYS = 2
+
+class ArticleStore:
+    """Append-only JSONL file of articles, read back by slice through mmap.
+    
+    Only the byte offset, timestamp and source of each article stay in memory,
+    so sessions holding tens of thousands of articles stay small and a preview
+    or analysis range decodes just the rows it covers.
+    """
+    
+    def __init__(self, directory=ARTICLE_STORE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{uuid.uuid4().hex}.jsonl")
+        self._offsets = array('q')
+        self._timestamps = array('d')  # NaN for undated articles
+        self._source_codes = array('H')
+        self._sources = []
+        self._source_lookup = {}
+        self._digest = hashlib.sha1()
+        self._size = 0
+        self._writer = None
+        self._map = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def fingerprint_line(article):
+        return f"{article.link}|{article.title[:100]}\n".encode('utf-8')
+    
+    @staticmethod
+    def prune(directory=ARTICLE_STORE_DIR, retention_days=ARTICLE_STORE_RETENTION_DAYS):
+        """Delete stores not touched within the retention window"""
+        if not os.path.isdir(directory):
+            return
+        cutoff = time.time() - retention_days * 86400
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            try:
+                if name.endswith('.jsonl') and os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                continue
+    
+    def append(self, article):
+        line = (json.dumps(article.to_dict(), ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            if self._writer is None:
+                self._writer = open(self.path, 'ab')
+            self._writer.write(line)
+            self._offsets.append(self._size)
+            self._size += len(line)
+            self._timestamps.append(article.timestamp if article.timestamp is not None else float('nan'))
+            source = article.source
+            if source not in self._source_lookup:
+                self._source_lookup[source] = len(self._sources)
+                self._sources.append(source)
+            self._source_codes.append(self._source_lookup[source])
+            self._digest.update(self.fingerprint_line(article))
+    
+    def extend(self, articles):
+        for article in articles:
+            self.append(article)
+    
+    def __len__(self):
+        return len(self._offsets)
+    
+    def _view(self):
+        """mmap covering everything written so far"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+            if self._map is None or len(self._map) < self._size:
+                if self._map is not None:
+                    self._map.close()
+                with open(self.path, 'rb') as store_file:
+                    self._map = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._map
+    
+    def _read(self, view, position):
+        start = self._offsets[position]
+        end = self._offsets[position + 1] if position + 1 < len(self._offsets) else self._size
+        return Article.from_dict(json.loads(view[start:end]))
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            if not positions:
+                return []
+            view = self._view()
+            return [self._read(view, position) for position in positions]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('article index out of range')
+        return self._read(self._view(), index)
+    
+    def take(self, positions):
+        """Articles at arbitrary positions, in the order given"""
+        if not len(positions):
+            return []
+        view = self._view()
+        return [self._read(view, position) for position in positions]
+    
+    def chunks(self, size=500):
+        """Consecutive lists of at most `size` articles"""
+        for start in range(0, len(self), size):
+            yield self[start:start + size]
+    
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+    
+    def timestamps(self):
+        """(timestamp, position) pairs of dated articles, from memory"""
+        return [(timestamp, position) for position, timestamp in enumerate(self._timestamps) if timestamp == timestamp]
+    
+    def source_counts(self):
+        """Articles per source, most common first, from memory"""
+        counts = {}
+        for code in self._source_codes:
+            counts[code] = counts.get(code, 0) + 1
+        return {self._sources[code]: count for code, count in sorted(counts.items(), key=lambda item: -item[1])}
+    
+    def digest(self):
+        """Copy of the running link/title fingerprint, as ExtractionCheckpoint computes it"""
+        return self._digest.copy()
+    
+    def close(self):
+        """Release file handles; they are reopened on the next append or read"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+    
+    def delete(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class Job:
+    """A long-running search or analysis executed off the Streamlit script thread"""
+    
+    def __init__(self, kind, description):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.description = description
+        self.status = 'queued'  # queued, running, done, failed, cancelled
+        self.progress = 0.0
+        self.message = 'Waiting for a free worker...'
+        self.messages = deque(maxlen=200)
+        self.partial = deque(maxlen=200)  # recent items only; runs can be very large
+        self.partial_count = 0
+        self.preview = []  # ranked rule-based rows shown until the AI results are in
+        self.preview_count = 0
+        self.result = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.created_at = time.time()
+        self.finished_at = None
+        self._lock = threading.Lock()
+    
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed', 'cancelled')
+    
+    def log(self, level, message):
+        with self._lock:
+            self.messages.append((level, message.strip()))
+    
+    def set_progress(self, fraction, message=''):
+        self.progress = min(max(fraction, 0.0), 1.0)
+        if message:
+            self.message = message.strip()
+    
+    def add_partial(self, items):
+        with self._lock:
+            self.partial.extend(items)
+            self.partial_count += len(items)
+    
+    def set_preview(self, rows, count):
+        with self._lock:
+            self.preview = rows
+            self.preview_count = count
+    
+    def partial_snapshot(self, limit=None):
+        with self._lock:
+            return list(self.partial)[-limit:] if limit else list(self.partial)
+    
+    def recent_messages(self, limit=8):
+        with self._lock:
+            return list(self.messages)[-limit:]
+    
+    def cancel(self):
+        self.cancel_event.set()
+        self.message = 'Cancelling...'
+
+class JobRunner:
+    """Local job queue running searches and analyses on a shared worker pool.
+    
+    Jobs outlive the script run that submitted them, so widget interaction,
+    reruns and browser reconnects do not interrupt the work, and sessions on
+    the same server run side by side instead of one after another.
+    """
+    
+    def __init__(self, max_workers=4, retention_seconds=3600):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scout-job')
+        self.retention_seconds = retention_seconds
+        self.jobs = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, kind, description, target, *args, **kwargs):
+        """Queue target(job, *args, **kwargs) and return the job handle"""
+        job = Job(kind, description)
+        with self._lock:
+            self._prune()
+            self.jobs[job.id] = job
+        self.executor.submit(self._run, job, target, args, kwargs)
+        return job
+    
+    def _run(self, job, target, args, kwargs):
+        if job.cancel_event.is_set():
+            job.status = 'cancelled'
+            job.finished_at = time.time()
+            return
+        job.status = 'running'
+        job.message = 'Starting...'
+        try:
+            job.result = target(job, *args, **kwargs)
+            job.status = 'cancelled' if job.cancel_event.is_set() else 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.progress = 1.0 if job.status == 'done' else job.progress
+            job.finished_at = time.time()
+    
+    def _prune(self):
+        cutoff = time.time() - self.retention_seconds
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.finished and job.finished_at < cutoff]:
+            del self.jobs[job_id]
+    
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id) if job_id else None
+    
+    def active_count(self):
+        with self._lock:
+            return sum(1 for job in self.jobs.values() if not job.finished)
+
+@st.cache_resource
+def get_job_runner():
+    """One job runner per server process, shared by all sessions"""
+    return JobRunner(max_workers=int(get_setting("JOB_WORKERS", 4)))
+
+def run_search_job(job, **params):
+    scout = MultiSectorCompanyScout()
+    scout.job = job
+    return scout.run_search_pipeline(**params)
+
+def run_analysis_job(job, articles, start_index, end_index, use_cascade, triage_threshold, resume=False, budget_limits=None):
+    scout = MultiSectorCompanyScout()
+    scout.job = job
+    scout.TRIAGE_THRESHOLD = triage_threshold
+    budget = AnalysisBudget(**budget_limits) if budget_limits else None
+    return scout.run_analysis_pipeline(articles, start_index, end_index, use_cascade, resume, budget)
+
+# Sidebar defaults; most sessions start from these, so they are also what gets pre-warmed
+DEFAULT_PROJECT_TYPES = ["Greenfield Projects", "Brownfield Projects"]
+DEFAULT_SECTORS = ["manufacturing", "warehouse", "hospital", "it park", "logistics park"]
+DEFAULT_SOURCES = ['Google News', 'DuckDuckGo', 'Bing News']
+DEFAULT_RESULTS_PER_SEARCH = 10
+DEFAULT_ANALYSIS_ARTICLES = 50
+
+class CacheWarmer:
+    """Off-hours pre-warming of the search and extraction caches for popular sidebar selections.
+    
+    Inside the configured hours, the stalest combination older than its freshness
+    target is searched and its first articles extracted, within hourly budgets of
+    source requests and LLM calls. Nothing runs while interactive jobs are active.
+    """
+    
+    def __init__(self, combinations, hours=(1, 6), freshness_hours=4, requests_per_hour=120,
+                 llm_calls_per_hour=200, check_seconds=300, enabled=True):
+        self.combinations = combinations
+        self.enabled = enabled
+        self.hours = hours
+        self.freshness_seconds = freshness_hours * 3600
+        self.requests_per_hour = requests_per_hour
+        self.llm_calls_per_hour = llm_calls_per_hour
+        self.check_seconds = check_seconds
+        self.last_warmed = {}  # combination label -> time its last warm-up finished
+        self.usage = deque()  # (time, source requests, LLM calls) over the last hour
+        self.history = deque(maxlen=20)
+        self.job = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    @staticmethod
+    def label(combination):
+        return f"{', '.join(combination['sectors'])} on {', '.join(combination['sources'])}"
+    
+    def in_window(self, now=None):
+        """Whether the local hour falls in [start, end), wrapping past midnight"""
+        hour = datetime.fromtimestamp(now or time.time()).hour
+        start, end = self.hours
+        return start <= hour < end if start <= end else hour >= start or hour < end
+    
+    def spent(self, now=None):
+        """(source requests, LLM calls) used in the last hour"""
+        cutoff = (now or time.time()) - 3600
+        with self._lock:
+            while self.usage and self.usage[0][0] < cutoff:
+                self.usage.popleft()
+            return sum(entry[1] for entry in self.usage), sum(entry[2] for entry in self.usage)
+    
+    def due(self, now=None):
+        """The stalest combination past its freshness target, or None"""
+        now = now or time.time()
+        stale = [
+            combination for combination in self.combinations
+            if now - self.last_warmed.get(self.label(combination), 0) >= self.freshness_seconds
+        ]
+        return min(stale, key=lambda combination: self.last_warmed.get(self.label(combination), 0), default=None)
+    
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='scout-cache-warmer', daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the thread and cancel a warm-up in progress (cache release and interpreter exit)"""
+        self._stop.set()
+        if self.job is not None:
+            self.job.cancel()
+    
+    def _run(self):
+        while not self._stop.wait(self.check_seconds):
+            try:
+                self.tick()
+            except Exception as e:
+                self.history.append((time.time(), 'error', str(e)[:200]))
+    
+    def tick(self, now=None):
+        """Warm one due combination if the window, the budgets and interactive load allow"""
+        if not self.in_window(now) or get_job_runner().active_count():
+            return None
+        combination = self.due(now)
+        if combination is None:
+            return None
+        requests, calls = self.spent(now)
+        if requests >= self.requests_per_hour:
+            return None
+        return self.warm(combination, self.requests_per_hour - requests, max(self.llm_calls_per_hour - calls, 0))
+    
+    def warm(self, combination, request_budget, llm_calls):
+        """Search a combination as the sidebar would and extract its first articles into the caches"""
+        label = self.label(combination)
+        job = Job('warm', f"Pre-warming {label}")
+        job.status = 'running'
+        self.job = job
+        scout = MultiSectorCompanyScout()
+        scout.job = job
+        try:
+            queries = scout.get_search_queries(combination['sectors'], combination['project_types'])
+            full_sweep = scout.sweep_requests(len(queries), len(combination['sources']), combination['max_results'])
+            search_budget = min(request_budget, full_sweep)
+            search = scout.run_search_pipeline(queries, combination['max_results'], combination['sources'], request_budget=search_budget)
+            articles = search['articles']
+            if llm_calls and articles and not job.cancel_event.is_set():
+                scout.extract_companies_with_enhanced_groq(
+                    articles, 0, min(combination['analyze_articles'], len(articles)),
+                    budget=AnalysisBudget(max_calls=llm_calls)
+                )
+            if hasattr(articles, 'delete'):
+                articles.delete()
+            calls = scout.cascade_stats['triage']['calls'] + scout.cascade_stats['extraction']['calls']
+            with self._lock:
+                self.usage.append((time.time(), scout.requests_made, calls))
+            # A sweep cut short by the request budget stays due; cached pairs cost nothing next time
+            complete = search_budget == full_sweep or scout.requests_made < search_budget
+            if complete:
+                self.last_warmed[label] = time.time()
+            job.status = 'cancelled' if job.cancel_event.is_set() else 'done'
+            self.history.append((time.time(), label, f"{len(articles)} articles, {scout.requests_made} requests, {calls} LLM calls"
+                                 + ("" if complete else ", partial: request budget")))
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+            self.history.append((time.time(), label, f"failed: {str(e)[:200]}"))
+        finally:
+            job.finished_at = time.time()
+        return job
+    
+    def describe(self):
+        """One-line status for the sidebar"""
+        requests, calls = self.spent()
+        last = max(self.last_warmed.values(), default=None)
+        age = f"last run {(time.time() - last) / 3600:.1f}h ago" if last else "not run yet"
+        return (f"{len(self.combinations)} combinations, {self.hours[0]:02d}:00-{self.hours[1]:02d}:00, {age} | "
+                f"{requests}/{self.requests_per_hour} requests, {calls}/{self.llm_calls_per_hour} LLM calls this hour")
+
+def warm_combinations():
+    """Combinations to pre-warm from WARM_COMBINATIONS (JSON list), defaulting to the sidebar defaults"""
+    configured = get_setting("WARM_COMBINATIONS")
+    if isinstance(configured, str):
+        configured = json.loads(configured)
+    combinations = []
+    for entry in configured or [{}]:
+        combinations.append({
+            'sectors': list(entry.get('sectors', DEFAULT_SECTORS)),
+            'sources': list(entry.get('sources', DEFAULT_SOURCES)),
+            'project_types': list(entry.get('project_types', DEFAULT_PROJECT_TYPES)),
+            'max_results': int(entry.get('max_results', DEFAULT_RESULTS_PER_SEARCH)),
+            'analyze_articles': int(entry.get('analyze_articles', DEFAULT_ANALYSIS_ARTICLES)),
+        })
+    return combinations
+
+@st.cache_resource(on_release=lambda warmer: warmer.stop())
+def get_cache_warmer():
+    """One pre-warming thread per server process, started only when CACHE_WARMING is enabled.
+    
+    Streamlit runs no app code before a page is first loaded, so main() asks for the
+    warmer on every run: it starts with the first page load after a restart.
+    """
+    start_hour, end_hour = (int(hour) for hour in str(get_setting("WARM_HOURS", "1-6")).split('-'))
+    warmer = CacheWarmer(
+        warm_combinations(),
+        hours=(start_hour, end_hour),
+        freshness_hours=float(get_setting("WARM_FRESHNESS_HOURS", 4)),
+        requests_per_hour=int(get_setting("WARM_REQUESTS_PER_HOUR", 120)),
+        llm_calls_per_hour=int(get_setting("WARM_LLM_CALLS_PER_HOUR", 200)),
+        enabled=str(get_setting("CACHE_WARMING", "false")).lower() in ('1', 'true', 'yes')
+    )
+    if warmer.enabled:
+        warmer.start()
+        atexit.register(warmer.stop)
+    return warmer
+
 class MultiSectorCompanyScout:
     def __init__(self):
-        self.groq_client = Groq(api_key=st.secrets.get("GROQ_API_KEY"))
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self._groq_client = None
+        self._http_clients = {}
+        self._http_lock = threading.Lock()  # page threads of one query may ask for a client together
+        self.last_status_code = None
+        self.source_report = []
+        self.requests_made = 0  # source requests made by the last hybrid_search
+        
+        # Background job this scout is running in, if any; None means inline on the page
+        self.job = None
+        self.seen_keys = None  # dedup keys of the running search, consulted when paging
+        self._progress_widgets = None
         
         # Comprehensive sector list
         self.SECTORS = [
@@ -52,6 +1799,8 @@ class MultiSectorCompanyScout:
             "investment approved", "project approved", "clearance obtained",
             "tender", "bidding", "contract awarded", "construction contract"
         ]
+        self.lead_scorer = LeadScorer(self.LEAD_SIGNALS)
+        self.rule_extractor = RuleBasedExtractor(self.LEAD_SIGNALS, self.SECTORS)
         
         # Additional press release and news sites
         self.NEWS_SOURCES = {
@@ -64,7 +1813,220 @@ class MultiSectorCompanyScout:
             'Business Wire': self.search_business_wire,
             'Indian Business News': self.search_indian_business_news
         }
+        
+        # Two-tier model cascade: a small model triages each article and only
+        # likely private-sector projects are sent to the large extraction model
+        self.TRIAGE_MODEL = get_setting("GROQ_TRIAGE_MODEL", "llama-3.1-8b-instant")
+        self.EXTRACTION_MODEL = get_setting("GROQ_EXTRACTION_MODEL", "llama-3.3-70b-versatile")
+        self.TRIAGE_THRESHOLD = float(get_setting("GROQ_TRIAGE_THRESHOLD", 0.5))
+        # Consecutive Groq failures after which the rest of a run uses the rule-based extractor
+        self.LLM_FAILURE_LIMIT = int(get_setting("LLM_FAILURE_LIMIT", 3))
+        
+        # Result paging: stop once a page is mostly articles we already have
+        self.MAX_RESULT_PAGES = int(get_setting("MAX_RESULT_PAGES", 5))
+        self.DUPLICATE_STOP_FRACTION = float(get_setting("DUPLICATE_STOP_FRACTION", 0.6))
+        self.reset_cascade_stats()
     
+    @property
+    def groq_client(self):
+        """Groq client, created on first use so search-only scouts need no API key"""
+        if self._groq_client is None:
+            from groq import Groq
+            self._groq_client = Groq(
+                api_key=get_setting("GROQ_API_KEY"),
+                base_url=get_setting("GROQ_BASE_URL"),
+                timeout=float(get_setting("GROQ_TIMEOUT", 30))
+            )
+        return self._groq_client
+    
+    @groq_client.setter
+    def groq_client(self, client):
+        self._groq_client = client
+    
+    def http(self, name='articles'):
+        """Shared pooled session for a source (or 'articles'), reporting statuses to this scout"""
+        with self._http_lock:
+            if name not in self._http_clients:
+                self._http_clients[name] = SourceClient(get_http_transport().session(name), self._record_status)
+            return self._http_clients[name]
+    
+    def sweep_requests(self, num_queries, num_sources, max_results):
+        """Most requests a full sweep can take: every query on every source, paged at 10 results a page"""
+        return num_queries * num_sources * max(1, min(self.MAX_RESULT_PAGES, -(-max_results // 10)))
+    
+    def source_requests(self):
+        """Search requests this scout has sent so far (article fetches excluded)"""
+        return sum(client.requests for name, client in list(self._http_clients.items()) if name != 'articles')
+    
+    def notify(self, level, message):
+        """Send a status message to the running job, or straight to the page when inline"""
+        if self.job is not None:
+            self.job.log(level, message)
+        else:
+            getattr(st, level)(message)
+    
+    def report_progress(self, fraction, message=''):
+        """Update progress on the running job, or on a page progress bar when inline"""
+        if self.job is not None:
+            self.job.set_progress(fraction, message)
+            return
+        if self._progress_widgets is None:
+            self._progress_widgets = (st.progress(0), st.empty())
+        progress_bar, status_text = self._progress_widgets
+        progress_bar.progress(min(max(fraction, 0.0), 1.0))
+        if message:
+            status_text.text(message)
+    
+    def clear_progress(self):
+        if self._progress_widgets is not None:
+            for widget in self._progress_widgets:
+                widget.empty()
+            self._progress_widgets = None
+    
+    def publish_partial(self, items):
+        """Expose results produced so far to the running job"""
+        if self.job is not None:
+            self.job.add_partial(items)
+    
+    def publish_preview(self, articles, start_index, end_index, stop=None, chunk_size=500, limit=200, publish_every=10):
+        """Rule-based leads for the range, shown on the running job while the LLM works.
+        
+        Runs next to extraction: the first chunk is published right away and the
+        preview is refreshed every `publish_every` chunks until `stop` is set.
+        """
+        if self.job is None:
+            return
+        leads = []
+        chunk_starts = range(start_index, end_index, chunk_size)
+        for chunk_number, chunk_start in enumerate(chunk_starts, start=1):
+            if self.cancelled() or (stop is not None and stop.is_set()):
+                return
+            leads.extend(self.rule_extractor.leads(articles[chunk_start:min(chunk_start + chunk_size, end_index)]))
+            if leads and (chunk_number == 1 or chunk_number % publish_every == 0 or chunk_number == len(chunk_starts)):
+                ranked = self.lead_scorer.rank(self.lead_scorer.build_table(leads), 'Balanced')
+                self.job.set_preview(ranked.head(limit).to_dict('records'), len(ranked))
+    
+    def extraction_cache_key(self, article, use_cascade):
+        """Extraction results depend on the article URL and the models (and triage threshold) that saw it"""
+        triage = f"{self.TRIAGE_MODEL}@{self.TRIAGE_THRESHOLD:g}" if use_cascade else ''
+        return f"{self.EXTRACTION_MODEL}|{triage}|{self.article_key(article)}"
+    
+    def rule_based_fallback(self, article):
+        """Leads for one article from the local extractor, used when Groq fails"""
+        leads = self.rule_extractor.leads([article])
+        self.cascade_stats['rule_based'] += 1
+        if leads:
+            self.publish_partial(leads)
+        return leads
+    
+    def cancelled(self):
+        return self.job is not None and self.job.cancel_event.is_set()
+    
+    def reset_cascade_stats(self):
+        """Reset per-tier call, token and latency totals"""
+        self.cascade_stats = {
+            'triage': {'calls': 0, 'seconds': 0.0, 'errors': 0, 'tokens': 0},
+            'extraction': {'calls': 0, 'seconds': 0.0, 'errors': 0, 'tokens': 0},
+            'articles': 0,
+            'rule_based': 0,
+            'cached': 0,
+            'triage_passed': 0,
+            'triage_rejected': 0,
+            'json_repaired': 0,
+            'json_salvaged': 0,
+            'json_reasked': 0
+        }
+    
+    def groq_chat(self, tier, model, system_prompt, user_prompt, max_tokens, max_retries=2):
+        """Call a Groq chat model with retry logic, recording calls, tokens and latency for the tier"""
+        stats = self.cascade_stats[tier]
+        for attempt in range(max_retries):
+            started = time.perf_counter()
+            try:
+                chat_completion = self.groq_client.chat.completions.create(
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    model=model,
+                    temperature=0.1,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"}
+                )
+                usage = getattr(chat_completion, 'usage', None)
+                stats['tokens'] += getattr(usage, 'total_tokens', 0) or 0
+                return chat_completion.choices[0].message.content
+            except Exception as e:
+                stats['errors'] += 1
+                # Groq rejects invalid JSON mode output with a 400 that still carries
+                # the generation; hand it to the repair layer instead of paying again
+                body = getattr(e, 'body', None)
+                if isinstance(body, dict):
+                    error = body.get('error', body)
+                    if isinstance(error, dict) and error.get('failed_generation'):
+                        return error['failed_generation']
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(1)  # Wait before retry
+            finally:
+                stats['calls'] += 1
+                stats['seconds'] += time.perf_counter() - started
+    
+    def triage_article(self, title, content):
+        """Ask the small triage model whether an article describes a private sector project.
+        
+        Returns (passed, probability). Triage failures fail open so no lead is lost.
+        """
+        system_prompt = """You screen Indian business news for a sales team.
+Answer one question: does this article describe a PRIVATE SECTOR greenfield (new facility) or brownfield (expansion, modernization) project?
+Return EXACT JSON: {"relevant": true/false, "confidence": number between 0 and 1}"""
+        user_prompt = f"TITLE: {title}\nCONTENT: {content[:1000]}"
+        
+        try:
+            response_text = self.groq_chat('triage', self.TRIAGE_MODEL, system_prompt, user_prompt, max_tokens=50)
+            data = json.loads(response_text.strip())
+            relevant = str(data.get('relevant', True)).lower() == 'true'
+            confidence = min(max(float(data.get('confidence', 1.0)), 0.0), 1.0)
+            probability = confidence if relevant else 1.0 - confidence
+        except Exception:
+            return True, 1.0
+        
+        passed = probability >= self.TRIAGE_THRESHOLD
+        if passed:
+            self.cascade_stats['triage_passed'] += 1
+        else:
+            self.cascade_stats['triage_rejected'] += 1
+        return passed, probability
+    
+    def display_cascade_stats(self):
+        """Show per-tier call counts, latency and the calls saved by triage"""
+        stats = self.cascade_stats
+        triage, extraction = stats['triage'], stats['extraction']
+        if not triage['calls'] and not extraction['calls'] and not stats.get('cached'):
+            return
+        
+        st.subheader(" Model Cascade")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            avg = triage['seconds'] / triage['calls'] if triage['calls'] else 0
+            st.metric(f"Triage calls ({self.TRIAGE_MODEL})", triage['calls'], f"{avg:.2f}s avg", delta_color="off")
+        with col2:
+            avg = extraction['seconds'] / extraction['calls'] if extraction['calls'] else 0
+            st.metric(f"Extraction calls ({self.EXTRACTION_MODEL})", extraction['calls'], f"{avg:.2f}s avg", delta_color="off")
+        with col3:
+            st.metric("Skipped by triage", stats['triage_rejected'])
+        with col4:
+            st.metric("Total LLM time", f"{triage['seconds'] + extraction['seconds']:.1f}s")
+        tokens = triage.get('tokens', 0) + extraction.get('tokens', 0)
+        if tokens:
+            st.caption(f"{tokens:,} tokens used ({triage.get('tokens', 0):,} triage, {extraction.get('tokens', 0):,} extraction)")
+        if stats.get('cached'):
+            st.caption(f"{stats['cached']} articles served from the extraction cache")
+        if stats.get('rule_based'):
+            st.caption(f"{stats['rule_based']} articles analyzed by the rule-based extractor because Groq failed")
+        if stats.get('json_repaired') or stats.get('json_salvaged') or stats.get('json_reasked'):
+            st.caption(f"JSON output repaired for {stats['json_repaired']} articles, salvaged for {stats['json_salvaged']}, re-asked for {stats['json_reasked']}")
+
     def search_google_news_rss(self, query, max_results=20):
         """Free Google News RSS search"""
         try:
@@ -75,7 +2037,7 @@ class MultiSectorCompanyScout:
             
             search_url = f"{base_url}/search?q={dated_query.replace(' ', '%20')}&hl=en-IN&gl=IN&ceid=IN:en"
             
-            response = self.session.get(search_url, timeout=15)
+            response = self.http('Google News').get(search_url)
             if response.status_code == 200:
                 import xml.etree.ElementTree as ET
                 root = ET.fromstring(response.content)
@@ -90,289 +2052,237 @@ class MultiSectorCompanyScout:
                     # Clean HTML tags from description
                     description = re.sub(r'<[^>]+>', '', description)
                     
-                    # Ensure all fields are strings
-                    articles.append({
-                        'title': str(title) if title else 'No Title',
-                        'link': str(link) if link else '',
-                        'description': str(description) if description else '',
-                        'source': 'Google News',
-                        'date': str(pub_date) if pub_date else '2024+',
-                        'content': f"{title}. {description}" if title and description else str(title) if title else 'No content'
-                    })
+                    articles.append(Article(title, link, description, 'Google News', pub_date))
                 
                 return articles
             return []
         except Exception as e:
-            st.error(f"Google News error: {str(e)}")
+            self.notify('error', f"Google News error: {str(e)}")
             return []
 
+    def fetch_pages(self, fetch_page, max_results, page_size):
+        """Collect results page by page with the next page already in flight.
+        
+        Stops at max_results, at an empty page, or at a page where at least
+        DUPLICATE_STOP_FRACTION of the articles were already seen in this query
+        or in the running search.
+        """
+        max_pages = max(1, min(self.MAX_RESULT_PAGES, -(-max_results // page_size)))
+        if max_pages == 1:
+            return fetch_page(0)[:max_results]
+        
+        seen_here = set()
+        results = []
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='scout-page')
+        pending = {page: executor.submit(fetch_page, page) for page in range(2)}
+        try:
+            for page in range(max_pages):
+                try:
+                    articles = pending.pop(page).result()
+                except Exception:
+                    if page == 0:
+                        raise
+                    break  # keep what the earlier pages returned
+                if not articles:
+                    break
+                
+                repeated = 0
+                for article in articles:
+                    key = self.article_key(article)
+                    if key in seen_here or (self.seen_keys is not None and key in self.seen_keys):
+                        repeated += 1
+                    if key not in seen_here:
+                        seen_here.add(key)
+                        results.append(article)
+                if len(results) >= max_results or repeated / len(articles) >= self.DUPLICATE_STOP_FRACTION:
+                    break
+                if page + 2 < max_pages:
+                    pending[page + 2] = executor.submit(fetch_page, page + 2)
+        finally:
+            # The page still in flight reports its status through this scout's hook,
+            # so let it land here rather than during the next source's query
+            executor.shutdown(wait=True, cancel_futures=True)
+        return results[:max_results]
+
     def search_duckduckgo_news(self, query, max_results=15):
         """DuckDuckGo search with comprehensive query building"""
         try:
             # Build enhanced query with lead signals
             enhanced_query = self.build_enhanced_query(query)
-            
-            base_url = "https://html.duckduckgo.com/html/"
-            params = {
-                'q': enhanced_query,
-                'kl': 'in-en',
-            }
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            response = self.session.post(base_url, data=params, headers=headers, timeout=20)
-            articles = []
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                results = soup.find_all('div', class_='result')
-                
-                for result in results[:max_results]:
-                    try:
-                        title_elem = result.find('a', class_='result__a')
-                        snippet_elem = result.find('a', class_='result__snippet')
-                        
-                        if title_elem:
-                            title = title_elem.text.strip()
-                            link = title_elem.get('href')
-                            snippet = snippet_elem.text.strip() if snippet_elem else ""
-                            
-                            # Extract actual URL from DuckDuckGo redirect
-                            if link and 'uddg=' in link:
-                                match = re.search(r'uddg=([^&]+)', link)
-                                if match:
-                                    link = urllib.parse.unquote(match.group(1))
-                            
-                            # Only include valid news links
-                            if link and any(domain in link for domain in ['.com', '.in', '.org', '.net', '.co']):
-                                articles.append({
-                                    'title': str(title) if title else 'No Title',
-                                    'link': str(link) if link else '',
-                                    'description': str(snippet) if snippet else '',
-                                    'source': 'DuckDuckGo',
-                                    'date': '2024+',
-                                    'content': f"{title}. {snippet}" if title and snippet else str(title) if title else 'No content'
-                                })
-                    except Exception:
-                        continue
-                
-                return articles
-            else:
-                return []
-                
+            return self.fetch_pages(lambda page: self._duckduckgo_page(enhanced_query, page), max_results, page_size=30)
         except Exception as e:
-            st.error(f"DuckDuckGo search error: {str(e)}")
+            self.notify('error', f"DuckDuckGo search error: {str(e)}")
             return []
 
+    def _duckduckgo_page(self, enhanced_query, page, page_size=30):
+        base_url = "https://html.duckduckgo.com/html/"
+        params = {
+            'q': enhanced_query,
+            'kl': 'in-en',
+        }
+        if page:
+            params.update({'s': page * page_size, 'dc': page * page_size + 1, 'v': 'l', 'o': 'json'})
+        
+        # Browser-like headers live on the DuckDuckGo session (SOURCE_HEADERS)
+        response = self.http('DuckDuckGo').post(base_url, data=params)
+        articles = []
+        
+        if response.status_code == 200:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(response.content, 'html.parser')
+            results = soup.find_all('div', class_='result')
+            
+            for result in results:
+                try:
+                    title_elem = result.find('a', class_='result__a')
+                    snippet_elem = result.find('a', class_='result__snippet')
+                    
+                    if title_elem:
+                        title = title_elem.text.strip()
+                        link = title_elem.get('href')
+                        snippet = snippet_elem.text.strip() if snippet_elem else ""
+                        
+                        # Extract actual URL from DuckDuckGo redirect
+                        if link and 'uddg=' in link:
+                            match = re.search(r'uddg=([^&]+)', link)
+                            if match:
+                                link = urllib.parse.unquote(match.group(1))
+                        
+                        # Only include valid news links
+                        if link and any(domain in link for domain in ['.com', '.in', '.org', '.net', '.co']):
+                            articles.append(Article(title, link, snippet, 'DuckDuckGo', '2024+'))
+                except Exception:
+                    continue
+        
+        return articles
+
     def search_bing_news(self, query, max_results=15):
         """Bing News search"""
         try:
-            base_url = "https://www.bing.com/news/search"
-            params = {
-                'q': f"{query} India",
-                'qft': 'sortbydate="1"',  # Sort by date
-                'form': 'YFNR'
-            }
-            
-            response = self.session.get(base_url, params=params, timeout=15)
-            articles = []
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                news_cards = soup.find_all('div', class_='news-card')
-                
-                for card in news_cards[:max_results]:
-                    try:
-                        title_elem = card.find('a', class_='title')
-                        description_elem = card.find('div', class_='snippet')
-                        source_elem = card.find('div', class_='source')
-                        time_elem = card.find('span', class_='time')
-                        
-                        if title_elem:
-                            title = title_elem.text.strip()
-                            link = title_elem.get('href')
-                            description = description_elem.text.strip() if description_elem else ""
-                            source = source_elem.text.strip() if source_elem else "Bing News"
-                            date = time_elem.text.strip() if time_elem else "2024+"
-                            
-                            articles.append({
-                                'title': str(title) if title else 'No Title',
-                                'link': str(link) if link else '',
-                                'description': str(description) if description else '',
-                                'source': str(source) if source else 'Bing News',
-                                'date': str(date) if date else '2024+',
-                                'content': f"{title}. {description}" if title and description else str(title) if title else 'No content'
-                            })
-                    except Exception:
-                        continue
-                
-                return articles
-            return []
+            return self.fetch_pages(lambda page: self._bing_news_page(query, page), max_results, page_size=10)
         except Exception as e:
-            st.warning(f"Bing News search limited: {str(e)}")
+            self.notify('warning', f"Bing News search limited: {str(e)}")
             return []
 
+    def _bing_news_page(self, query, page, page_size=10):
+        base_url = "https://www.bing.com/news/search"
+        params = {
+            'q': f"{query} India",
+            'qft': 'sortbydate="1"',  # Sort by date
+            'form': 'YFNR'
+        }
+        if page:
+            params['first'] = page * page_size + 1
+        
+        response = self.http('Bing News').get(base_url, params=params)
+        articles = []
+        
+        if response.status_code == 200:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(response.content, 'html.parser')
+            news_cards = soup.find_all('div', class_='news-card')
+            
+            for card in news_cards:
+                try:
+                    title_elem = card.find('a', class_='title')
+                    description_elem = card.find('div', class_='snippet')
+                    source_elem = card.find('div', class_='source')
+                    time_elem = card.find('span', class_='time')
+                    
+                    if title_elem:
+                        title = title_elem.text.strip()
+                        link = title_elem.get('href')
+                        description = description_elem.text.strip() if description_elem else ""
+                        source = source_elem.text.strip() if source_elem else "Bing News"
+                        date = time_elem.text.strip() if time_elem else "2024+"
+                        
+                        articles.append(Article(title, link, description, source, date))
+                except Exception:
+                    continue
+        
+        return articles
+
     def search_yahoo_news(self, query, max_results=10):
         """Yahoo News search"""
         try:
-            base_url = "https://news.search.yahoo.com/search"
-            params = {
-                'p': f"{query} India",
-                'fr': 'uh3_news_web_gs',
-                'fr2': 'p:news,m:news'
-            }
-            
-            response = self.session.get(base_url, params=params, timeout=15)
-            articles = []
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                results = soup.find_all('div', class_='NewsArticle')
-                
-                for result in results[:max_results]:
-                    try:
-                        title_elem = result.find('h4').find('a') if result.find('h4') else None
-                        if title_elem:
-                            title = title_elem.text.strip()
-                            link = title_elem.get('href')
-                            description_elem = result.find('p', class_='s-desc')
-                            description = description_elem.text.strip() if description_elem else ""
-                            
-                            articles.append({
-                                'title': str(title) if title else 'No Title',
-                                'link': str(link) if link else '',
-                                'description': str(description) if description else '',
-                                'source': 'Yahoo News',
-                                'date': '2024+',
-                                'content': f"{title}. {description}" if title and description else str(title) if title else 'No content'
-                            })
-                    except Exception:
-                        continue
-                
-                return articles
-            return []
+            return self.fetch_pages(lambda page: self._yahoo_news_page(query, page), max_results, page_size=10)
         except Exception as e:
-            st.warning(f"Yahoo News search limited: {str(e)}")
+            self.notify('warning', f"Yahoo News search limited: {str(e)}")
             return []
 
+    def _yahoo_news_page(self, query, page, page_size=10):
+        base_url = "https://news.search.yahoo.com/search"
+        params = {
+            'p': f"{query} India",
+            'fr': 'uh3_news_web_gs',
+            'fr2': 'p:news,m:news'
+        }
+        if page:
+            params['b'] = page * page_size + 1
+        
+        response = self.http('Yahoo News').get(base_url, params=params)
+        articles = []
+        
+        if response.status_code == 200:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(response.content, 'html.parser')
+            results = soup.find_all('div', class_='NewsArticle')
+            
+            for result in results:
+                try:
+                    title_elem = result.find('h4').find('a') if result.find('h4') else None
+                    if title_elem:
+                        title = title_elem.text.strip()
+                        link = title_elem.get('href')
+                        description_elem = result.find('p', class_='s-desc')
+                        description = description_elem.text.strip() if description_elem else ""
+                        
+                        articles.append(Article(title, link, description, 'Yahoo News', '2024+'))
+                except Exception:
+                    continue
+        
+        return articles
+
     def search_reuters_rss(self, query, max_results=10):
         """Reuters RSS feed search"""
         try:
             # Reuters business news RSS
             rss_url = "https://www.reutersagency.com/feed/?best-topics=business-finance&post_type=best"
-            feed = feedparser.parse(rss_url)
+            import feedparser
+            # Fetch through the pooled session (timeouts, compression), let feedparser only parse
+            response = self.http('Reuters RSS').get(rss_url)
+            if response.status_code != 200:
+                return []
+            feed = feedparser.parse(response.content)
             
             articles = []
             for entry in feed.entries[:max_results]:
                 # Check if query terms are in title or summary
                 if any(term.lower() in (entry.title + ' ' + entry.summary).lower() for term in query.split()):
-                    articles.append({
-                        'title': str(entry.title) if hasattr(entry, 'title') else 'No Title',
-                        'link': str(entry.link) if hasattr(entry, 'link') else '',
-                        'description': str(entry.summary) if hasattr(entry, 'summary') else '',
-                        'source': 'Reuters',
-                        'date': str(entry.published) if hasattr(entry, 'published') else '2024+',
-                        'content': f"{entry.title}. {entry.summary}" if hasattr(entry, 'title') and hasattr(entry, 'summary') else str(entry.title) if hasattr(entry, 'title') else 'No content'
-                    })
+                    articles.append(Article(entry.get('title'), entry.get('link'), entry.get('summary'), 'Reuters', entry.get('published')))
             
             return articles
-        except Exception as e:
-            st.warning(f"Reuters RSS search limited: {str(e)}")
-            return []
-
-    def search_pr_newswire(self, query, max_results=10):
-        """PR Newswire style search"""
-        try:
-            # Using Google search for PR Newswire content
-            base_url = "https://www.google.com/search"
-            params = {
-                'q': f"{query} site:prnewswire.com OR site:prnewswire.co.in",
-                'tbm': 'nws',
-                'tbs': 'qdr:y'  # Past year
-            }
-            
-            response = self.session.get(base_url, params=params, timeout=15)
-            articles = []
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                results = soup.find_all('div', class_='SoaBEf')
-                
-                for result in results[:max_results]:
-                    try:
-                        title_elem = result.find('div', role='heading')
-                        link_elem = result.find('a')
-                        description_elem = result.find('div', class_='Y3v8qd')
-                        
-                        if title_elem and link_elem:
-                            title = title_elem.text.strip()
-                            link = link_elem.get('href')
-                            description = description_elem.text.strip() if description_elem else ""
-                            
-                            articles.append({
-                                'title': str(title) if title else 'No Title',
-                                'link': str(link) if link else '',
-                                'description': str(description) if description else '',
-                                'source': 'PR Newswire',
-                                'date': '2024+',
-                                'content': f"{title}. {description}" if title and description else str(title) if title else 'No content'
-                            })
-                    except Exception:
-                        continue
-                
-                return articles
+        except Exception as e:
+            self.notify('warning', f"Reuters RSS search limited: {str(e)}")
             return []
+
+    def search_pr_newswire(self, query, max_results=10):
+        """PR Newswire style search"""
+        try:
+            # Using Google search for PR Newswire content
+            full_query = f"{query} site:prnewswire.com OR site:prnewswire.co.in"
+            return self.fetch_pages(lambda page: self._google_news_page(full_query, page, 'PR Newswire'), max_results, page_size=10)
         except Exception as e:
-            st.warning(f"PR Newswire search limited: {str(e)}")
+            self.notify('warning', f"PR Newswire search limited: {str(e)}")
             return []
 
     def search_business_wire(self, query, max_results=10):
         """Business Wire style search"""
         try:
-            base_url = "https://www.google.com/search"
-            params = {
-                'q': f"{query} site:businesswire.com OR site:businesswireindia.com",
-                'tbm': 'nws',
-                'tbs': 'qdr:y'
-            }
-            
-            response = self.session.get(base_url, params=params, timeout=15)
-            articles = []
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                results = soup.find_all('div', class_='SoaBEf')
-                
-                for result in results[:max_results]:
-                    try:
-                        title_elem = result.find('div', role='heading')
-                        link_elem = result.find('a')
-                        description_elem = result.find('div', class_='Y3v8qd')
-                        
-                        if title_elem and link_elem:
-                            title = title_elem.text.strip()
-                            link = link_elem.get('href')
-                            description = description_elem.text.strip() if description_elem else ""
-                            
-                            articles.append({
-                                'title': str(title) if title else 'No Title',
-                                'link': str(link) if link else '',
-                                'description': str(description) if description else '',
-                                'source': 'Business Wire',
-                                'date': '2024+',
-                                'content': f"{title}. {description}" if title and description else str(title) if title else 'No content'
-                            })
-                    except Exception:
-                        continue
-                
-                return articles
-            return []
+            full_query = f"{query} site:businesswire.com OR site:businesswireindia.com"
+            return self.fetch_pages(lambda page: self._google_news_page(full_query, page, 'Business Wire'), max_results, page_size=10)
         except Exception as e:
-            st.warning(f"Business Wire search limited: {str(e)}")
+            self.notify('warning', f"Business Wire search limited: {str(e)}")
             return []
 
     def search_indian_business_news(self, query, max_results=15):
@@ -389,51 +2299,52 @@ class MultiSectorCompanyScout:
             
             source_query = " OR ".join([f"site:{source}" for source in indian_sources])
             full_query = f"{query} ({source_query})"
-            
-            base_url = "https://www.google.com/search"
-            params = {
-                'q': full_query,
-                'tbm': 'nws',
-                'tbs': 'qdr:y'
-            }
-            
-            response = self.session.get(base_url, params=params, timeout=15)
-            articles = []
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                results = soup.find_all('div', class_='SoaBEf')
-                
-                for result in results[:max_results]:
-                    try:
-                        title_elem = result.find('div', role='heading')
-                        link_elem = result.find('a')
-                        description_elem = result.find('div', class_='Y3v8qd')
-                        source_elem = result.find('span', class_='r0bn4c')
-                        
-                        if title_elem and link_elem:
-                            title = title_elem.text.strip()
-                            link = link_elem.get('href')
-                            description = description_elem.text.strip() if description_elem else ""
-                            source = source_elem.text.strip() if source_elem else "Indian Business"
-                            
-                            articles.append({
-                                'title': str(title) if title else 'No Title',
-                                'link': str(link) if link else '',
-                                'description': str(description) if description else '',
-                                'source': str(source) if source else 'Indian Business',
-                                'date': '2024+',
-                                'content': f"{title}. {description}" if title and description else str(title) if title else 'No content'
-                            })
-                    except Exception:
-                        continue
-                
-                return articles
-            return []
+            return self.fetch_pages(
+                lambda page: self._google_news_page(full_query, page, 'Indian Business', use_result_source=True),
+                max_results, page_size=10
+            )
         except Exception as e:
-            st.warning(f"Indian business news search limited: {str(e)}")
+            self.notify('warning', f"Indian business news search limited: {str(e)}")
             return []
 
+    def _google_news_page(self, full_query, page, source_label, use_result_source=False, page_size=10):
+        """One page of Google News (tbm=nws) results from the past year"""
+        base_url = "https://www.google.com/search"
+        params = {
+            'q': full_query,
+            'tbm': 'nws',
+            'tbs': 'qdr:y'  # Past year
+        }
+        if page:
+            params['start'] = page * page_size
+        
+        response = self.http('Google Search').get(base_url, params=params)
+        articles = []
+        
+        if response.status_code == 200:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(response.content, 'html.parser')
+            results = soup.find_all('div', class_='SoaBEf')
+            
+            for result in results:
+                try:
+                    title_elem = result.find('div', role='heading')
+                    link_elem = result.find('a')
+                    description_elem = result.find('div', class_='Y3v8qd')
+                    source_elem = result.find('span', class_='r0bn4c') if use_result_source else None
+                    
+                    if title_elem and link_elem:
+                        title = title_elem.text.strip()
+                        link = link_elem.get('href')
+                        description = description_elem.text.strip() if description_elem else ""
+                        source = source_elem.text.strip() if source_elem else source_label
+                        
+                        articles.append(Article(title, link, description, source, '2024+'))
+                except Exception:
+                    continue
+        
+        return articles
+
     def build_enhanced_query(self, base_query):
         """Build enhanced search queries with lead signals"""
         # Combine base query with lead signals for better targeting
@@ -456,44 +2367,389 @@ class MultiSectorCompanyScout:
         
         return f"({final_query}) India after:2024-01-01"
 
-    def hybrid_search(self, search_terms, max_results_per_source=15, selected_sources=None):
-        """Hybrid search across multiple free sources"""
-        if selected_sources is None:
-            selected_sources = list(self.NEWS_SOURCES.keys())
+    def resolve_google_news_link(self, url):
+        """Resolve a news.google.com redirect link to the publisher URL"""
+        parsed = urllib.parse.urlparse(url)
+        if parsed.netloc != 'news.google.com':
+            return url
         
-        all_articles = []
-        
-        for term in search_terms:
-            for source_name in selected_sources:
-                if source_name in self.NEWS_SOURCES:
-                    try:
-                        st.info(f" Searching {source_name} for: {term}")
-                        articles = self.NEWS_SOURCES[source_name](term, max_results_per_source)
-                        all_articles.extend(articles)
-                        time.sleep(1)  # Rate limiting
-                    except Exception as e:
-                        st.warning(f"Error searching {source_name}: {str(e)}")
-                        continue
+        # Older article ids are base64 protobufs that embed the target URL
+        article_id = parsed.path.rstrip('/').split('/')[-1]
+        try:
+            decoded = base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+            match = re.search(rb'https?://[\x21-\x7e]+', decoded)
+            if match:
+                return match.group(0).decode('ascii')
+        except Exception:
+            pass
+        
+        # Otherwise follow the redirect chain without downloading the body
+        try:
+            response = self.http().get(url, timeout=(5, 10), allow_redirects=True, stream=True)
+            response.close()
+            if urllib.parse.urlparse(response.url).netloc != 'news.google.com':
+                return response.url
+        except Exception:
+            pass
+        return None
+
+    def extract_main_text(self, html, max_chars=8000):
+        """Extract the main article text from an HTML page, dropping boilerplate"""
+        try:
+            import lxml.html
+            doc = lxml.html.fromstring(html)
+        except Exception:
+            return ''
+        
+        for element in doc.xpath('//script|//style|//noscript|//nav|//header|//footer|//aside|//form|//iframe|//svg'):
+            element.drop_tree()
+        for element in doc.xpath('//*[@class or @id]'):
+            marker = f"{element.get('class', '')} {element.get('id', '')}"
+            if BOILERPLATE_PATTERN.search(marker) and element.getparent() is not None and element.tag not in ('html', 'body', 'article', 'main'):
+                element.drop_tree()
+        
+        # Group paragraphs by container and keep the densest container
+        containers = {}
+        for paragraph in doc.iter('p'):
+            text = ' '.join(paragraph.text_content().split())
+            if len(text) < 40:
+                continue
+            parent = paragraph.getparent()
+            containers.setdefault(parent, []).append(text)
+        
+        if not containers:
+            return ''
+        
+        best = max(containers.values(), key=lambda paragraphs: sum(len(p) for p in paragraphs))
+        return ' '.join(best)[:max_chars]
+
+    def fetch_article_body(self, url, max_bytes=1_500_000, timeout=10):
+        """Download an article page with a byte cap and timeout and return its main text, cached by URL"""
+        body, _ = get_shared_cache('bodies').get_or_compute(
+            url, lambda: self._download_article_body(url, max_bytes, timeout),
+            should_cache=bool  # '' means a timeout, block or non-HTML answer: retry next time instead of pinning it
+        )
+        return body
+
+    def _download_article_body(self, url, max_bytes, timeout):
+        target = self.resolve_google_news_link(url)
+        if not target:
+            return ''
+        try:
+            deadline = time.monotonic() + timeout
+            with self.http().get(target, timeout=(5, timeout), stream=True) as response:
+                content_type = response.headers.get('Content-Type', '')
+                if response.status_code != 200 or 'html' not in content_type:
+                    return ''
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=16384):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= max_bytes or time.monotonic() > deadline:
+                        break
+                return self.extract_main_text(b''.join(chunks))
+        except Exception:
+            return ''
+
+    def enrich_articles(self, articles, max_workers=8, max_bytes=1_500_000, timeout=10):
+        """Fetch full article bodies concurrently and fold them into the content used for extraction"""
+        targets = [article for article in articles if article.link]
+        if not targets:
+            return articles
         
-        # Remove duplicates based on URL and title
+        enriched_count = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch_article_body, article.link, max_bytes, timeout): article
+                for article in targets
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                if self.cancelled():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                article = futures[future]
+                body = future.result()
+                if body and len(body) > len(article.description):
+                    article.body = body
+                    enriched_count += 1
+                self.report_progress(done / len(targets), f" Fetching full text {done}/{len(targets)}...")
+        
+        self.clear_progress()
+        self.notify('info', f" Fetched full text for {enriched_count} of {len(targets)} articles")
+        return articles
+
+    def _record_status(self, response, *args, **kwargs):
+        """Session hook remembering the last HTTP status, used to detect blocked sources"""
+        self.last_status_code = response.status_code
+        if '/sorry/' in response.url:  # Google captcha interstitial
+            self.last_status_code = 429
+
+    @staticmethod
+    def article_key(article):
+        """Dedup key for articles across sources: the canonical URL, or the title when there is no usable link"""
+        canonical = article.canonical or canonicalize_url(article.link)
+        if canonical.startswith('https://'):
+            return canonical
+        return f"{article.title[:100]}_{article.link}"
+
+    def resolve_redirect(self, url, timeout=5):
+        """Final URL behind a redirect link, cached across sessions; '' when it cannot be resolved"""
+        target, _ = get_shared_cache('redirects').get_or_compute(url, lambda: self._follow_redirects(url, timeout) or '')
+        return target
+
+    def _follow_redirects(self, url, timeout):
+        if urllib.parse.urlparse(url).netloc == 'news.google.com':
+            return self.resolve_google_news_link(url)
+        # HEAD is cheapest; some shorteners reject it, so fall back to a GET that is never read
+        for method in ('HEAD', 'GET'):
+            try:
+                response = self.http().request(method, url, timeout=(5, timeout), allow_redirects=True, stream=True)
+                response.close()
+                if response.status_code < 400:
+                    return response.url
+            except Exception:
+                continue
+        return None
+
+    def canonicalize_articles(self, articles, max_workers=8):
+        """Resolve redirect links to publisher URLs and attach each article's canonical URL"""
+        pending = [
+            article for article in articles
+            if article.canonical is None and urllib.parse.urlparse(article.link).netloc.lower() in REDIRECT_HOSTS
+        ]
+        if pending and str(get_setting("RESOLVE_REDIRECTS", "true")).lower() not in ('0', 'false', 'no'):
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                for article, target in zip(pending, executor.map(lambda article: self.resolve_redirect(article.link), pending)):
+                    if target:
+                        article.link = target
+        for article in articles:
+            if article.canonical is None:
+                article.link = unwrap_redirect_url(article.link)
+                article.canonical = canonicalize_url(article.link)
+        return articles
+
+    def dedupe_articles(self, articles, sink=None):
+        """Keep the first article for each dedup key, appending to `sink` (a list by default)"""
         seen_articles = set()
-        unique_articles = []
-        for article in all_articles:
-            # Ensure article has required fields
-            if not article.get('title'):
-                article['title'] = 'No Title'
-            if not article.get('link'):
-                article['link'] = ''
-            
-            article_key = f"{str(article['title'])[:100]}_{article['link']}"
+        unique_articles = [] if sink is None else sink
+        for article in articles:
+            article_key = self.article_key(article)
             if article_key not in seen_articles:
                 seen_articles.add(article_key)
                 unique_articles.append(article)
+        return unique_articles
+
+    @staticmethod
+    def search_cache_key(source_name, term, max_results):
+        return f"{source_name}|{max_results}|{term}"
+
+    def cached_search(self, source_name, term, max_results):
+        """Run one source query through the shared cross-session cache; returns (articles, cached)"""
+        articles, cached = get_shared_cache('search').get_or_compute(
+            self.search_cache_key(source_name, term, max_results),
+            lambda: self.NEWS_SOURCES[source_name](term, max_results),
+            should_cache=bool  # empty answers are usually blocks or outages, so never pin them
+        )
+        # Callers annotate articles in place, so hand out copies of the shared entries
+        return [article.copy() for article in articles], cached
+
+    def hybrid_search(self, search_terms, max_results_per_source=15, selected_sources=None, request_budget=None, sink=None):
+        """Hybrid search across multiple free sources with an adaptive request budget.
+        
+        Unique articles are appended to `sink` (a list by default, or an ArticleStore).
+        """
+        if selected_sources is None:
+            selected_sources = list(self.NEWS_SOURCES.keys())
+        selected_sources = [source for source in selected_sources if source in self.NEWS_SOURCES]
+        
+        scheduler = SourceScheduler(selected_sources, len(search_terms), request_budget)
+        search_cache = get_shared_cache('search')
+        
+        # Remove duplicates by canonical URL as results arrive
+        seen_articles = set()
+        unique_articles = [] if sink is None else sink
+        self.seen_keys = seen_articles  # lets paged sources stop once pages repeat what we have
+        
+        for term_index, term in enumerate(search_terms):
+            if self.cancelled():
+                self.notify('warning', f" Search cancelled after {term_index} of {len(search_terms)} queries")
+                break
+            self.report_progress(term_index / len(search_terms), f" Query {term_index + 1}/{len(search_terms)}: {term}")
+            # Sources with a cached answer for this term cost nothing, so always include them
+            planned = scheduler.plan(term_index)
+            cached_sources = [
+                source_name for source_name in scheduler.active_sources()
+                if source_name not in planned and search_cache.contains(self.search_cache_key(source_name, term, max_results_per_source))
+            ]
+            for source_name in planned + cached_sources:
+                self.last_status_code = None
+                requests_before = self.source_requests()
+                try:
+                    self.notify('info', f" Searching {source_name} for: {term}")
+                    articles, cached = self.cached_search(source_name, term, max_results_per_source)
+                except Exception as e:
+                    self.notify('warning', f"Error searching {source_name}: {str(e)}")
+                    scheduler.record(source_name, 0, 0, self.last_status_code, error=e, requests=self.source_requests() - requests_before)
+                    continue
+                requests = self.source_requests() - requests_before  # paged sources send several
+                status_code = self.last_status_code  # redirect resolution below makes requests of its own
+                self.canonicalize_articles(articles)
+                
+                new_articles = []
+                for article in articles:
+                    article.search_source = _intern(source_name)
+                    
+                    article_key = self.article_key(article)
+                    if article_key not in seen_articles:
+                        seen_articles.add(article_key)
+                        unique_articles.append(article)
+                        new_articles.append(article)
+                new_count = len(new_articles)
+                
+                scheduler.record(source_name, len(articles), new_count, status_code, cached=cached, requests=requests)
+                if new_count:
+                    self.publish_partial(new_articles)
+                if scheduler.run_stats[source_name]['blocked']:
+                    self.notify('warning', f" Skipping {source_name} for the rest of this run ({scheduler.run_stats[source_name]['blocked']})")
+                if not cached:
+                    time.sleep(1)  # Rate limiting
         
+        self.seen_keys = None
+        self.clear_progress()
+        self.source_report = scheduler.summary()
+        self.requests_made = scheduler.requests_made
+        cache_hits = sum(stats['cached'] for stats in scheduler.run_stats.values())
+        queries = sum(stats['queries'] for stats in scheduler.run_stats.values())
+        self.notify('info', f" Sent {queries} of {len(search_terms) * len(selected_sources)} possible source queries in {scheduler.requests_made} requests ({cache_hits} more served from the shared cache)")
         return unique_articles
 
-    def get_search_queries(self, selected_sectors, project_types):
-        """Generate targeted search queries based on user selection"""
+    def parse_article_date(self, raw_date, now=None):
+        """Parse a source date string (RFC-822, ISO, relative \"2h ago\", or written) into a UTC datetime"""
+        now = now or datetime.now(timezone.utc)
+        text = ' '.join(str(raw_date or '').split())
+        if not text or text == '2024+':
+            return None
+        
+        lowered = text.lower()
+        if lowered in ('just now', 'now', 'today'):
+            return now
+        if lowered == 'yesterday':
+            return now - timedelta(days=1)
+        
+        match = RELATIVE_DATE_PATTERN.match(text)
+        if match:
+            unit = match.group(2).lower()
+            key = 'mo' if unit.startswith('mo') else unit[0]
+            return now - int(match.group(1)) * RELATIVE_UNITS[key]
+        
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError, IndexError):
+            parsed = None
+        if parsed is None:
+            try:
+                parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+            except ValueError:
+                parsed = None
+        if parsed is None:
+            cleaned = text.replace('Sept', 'Sep').rstrip('.')
+            for date_format in DATE_FORMATS:
+                try:
+                    parsed = datetime.strptime(cleaned, date_format)
+                    break
+                except ValueError:
+                    continue
+        if parsed is None:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
+
+    def infer_date_from_text(self, link, description):
+        """Fallback date heuristics: dates embedded in the URL path, then in the snippet"""
+        path = urllib.parse.urlparse(link or '').path
+        for pattern in URL_DATE_PATTERNS:
+            match = pattern.search(path)
+            if match:
+                parts = [int(part) for part in match.groups()] + [1]
+                try:
+                    return datetime(parts[0], parts[1], parts[2], tzinfo=timezone.utc), 'url'
+                except ValueError:
+                    continue
+        
+        match = SNIPPET_DATE_PATTERN.search(description or '')
+        if match:
+            parsed = self.parse_article_date(match.group(0).replace('.', ''))
+            if parsed:
+                return parsed, 'snippet'
+        return None, None
+
+    def normalize_article_dates(self, articles, now=None):
+        """Attach a normalized UTC timestamp to every article"""
+        now = now or datetime.now(timezone.utc)
+        for article in articles:
+            published = self.parse_article_date(article.date, now)
+            date_source = 'source' if published else None
+            if published is None:
+                published, date_source = self.infer_date_from_text(article.link, article.description)
+            if published and published > now + timedelta(days=1):
+                published, date_source = None, None
+            
+            article.timestamp = published.timestamp() if published else None
+            article.published = _intern(published.strftime('%Y-%m-%d')) if published else ''
+            article.date_source = date_source
+        return articles
+
+    def filter_recent_articles(self, articles, max_age_days, keep_undated=True, now=None):
+        """Drop articles published before the recency window"""
+        now = now or datetime.now(timezone.utc)
+        cutoff = (now - timedelta(days=max_age_days)).timestamp()
+        return [
+            article for article in articles
+            if (article.timestamp is None and keep_undated)
+            or (article.timestamp is not None and article.timestamp >= cutoff)
+        ]
+
+    def build_date_index(self, articles):
+        """Sorted (timestamps, positions) index over dated articles, for recency order and the date range"""
+        if hasattr(articles, 'timestamps'):
+            dated = sorted(articles.timestamps())  # ArticleStore keeps timestamps in memory
+        else:
+            dated = sorted(
+                (article.timestamp, position)
+                for position, article in enumerate(articles)
+                if article.timestamp is not None
+            )
+        return [timestamp for timestamp, _ in dated], [position for _, position in dated]
+
+    def recency_order(self, articles, date_index=None):
+        """Positions newest first, undated articles last in their original order"""
+        timestamps, positions = date_index or self.build_date_index(articles)
+        dated = set(positions)
+        return list(reversed(positions)) + [position for position in range(len(articles)) if position not in dated]
+
+    def source_counts(self, articles):
+        """Articles per source, most common first"""
+        if hasattr(articles, 'source_counts'):
+            return articles.source_counts()  # ArticleStore counts from memory
+        counts = {}
+        for article in articles:
+            counts[article.source] = counts.get(article.source, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def date_range_label(self, articles, date_index=None):
+        """Human readable publication date range of the articles"""
+        timestamps, _ = date_index or self.build_date_index(articles)
+        if not timestamps:
+            return "Unknown"
+        oldest = datetime.fromtimestamp(timestamps[0], timezone.utc)
+        newest = datetime.fromtimestamp(timestamps[-1], timezone.utc)
+        return f"{oldest.strftime('%b %Y')} - {newest.strftime('%b %Y')}"
+
+    def get_search_queries(self, selected_sectors, project_types, limit=20):
+        """Generate targeted search queries based on user selection; limit=None returns the full set"""
         base_queries = []
         
         # Generate queries for each selected sector
@@ -525,77 +2781,130 @@ class MultiSectorCompanyScout:
             for signal in self.LEAD_SIGNALS[:3]:
                 enhanced_queries.append(f"{base_query} {signal}")
         
-        return list(set(enhanced_queries))[:20]  # Limit to 20 unique queries
+        unique_queries = list(dict.fromkeys(enhanced_queries))
+        return unique_queries[:limit] if limit else unique_queries  # Default limit of 20 unique queries
+
+    def run_search_pipeline(self, search_queries, max_per_source, selected_sources, request_budget=None,
+                            recency_days=365, keep_undated=True, fetch_full_text=False):
+        """Search, date-normalize, recency-filter and optionally enrich articles into an ArticleStore"""
+        fetched = ArticleStore()
+        self.hybrid_search(search_queries, max_per_source, selected_sources, request_budget, sink=fetched)
+        result = self.prepare_articles(fetched, recency_days, keep_undated, fetch_full_text)
+        result['source_report'] = self.source_report
+        if result['articles'] is not fetched:
+            fetched.delete()
+        return result
 
-    def display_found_articles(self, articles):
-        """Display all found articles in an organized way"""
+    def prepare_articles(self, articles, recency_days=365, keep_undated=True, fetch_full_text=False, chunk_size=500):
+        """Date-normalize, recency-filter, sort and optionally enrich fetched articles into an ArticleStore.
+        
+        Articles are streamed through in chunks, so only one chunk is decoded at a time.
+        """
+        result = {'articles': articles, 'date_range': None}
         if not articles:
-            st.warning("No articles found to display")
-            return
+            return result
         
-        st.header(" All Found Articles")
-        st.info(f"Total articles found: {len(articles)}")
+        # Normalize publication dates and drop stale articles before enrichment or LLM calls
+        recent = ArticleStore()
+        chunks = articles.chunks(chunk_size) if hasattr(articles, 'chunks') else (
+            articles[start:start + chunk_size] for start in range(0, len(articles), chunk_size)
+        )
+        for chunk in chunks:
+            self.normalize_article_dates(chunk)
+            recent.extend(self.filter_recent_articles(chunk, recency_days, keep_undated))
+        if len(recent) < len(articles):
+            self.notify('info', f" Dropped {len(articles) - len(recent)} articles older than {recency_days} days")
+        date_index = self.build_date_index(recent)
+        result['date_range'] = self.date_range_label(recent, date_index)
         
-        # Create a DataFrame for better display
-        articles_df = pd.DataFrame(articles)
+        # Rewrite newest first, fetching full text chunk by chunk on the way
+        order = self.recency_order(recent, date_index)
+        ordered = ArticleStore()
+        enrich = fetch_full_text and not self.cancelled()
+        for start in range(0, len(order), chunk_size):
+            chunk = recent.take(order[start:start + chunk_size])
+            if enrich and not self.cancelled():
+                self.enrich_articles(chunk)
+            ordered.extend(chunk)
+        recent.delete()
+        ordered.close()
         
-        # Display articles in an expandable table
-        with st.expander(" View All Articles Details", expanded=False):
-            # Show summary statistics
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Articles", len(articles))
-            with col2:
-                sources = articles_df['source'].value_counts()
-                st.metric("Sources", len(sources))
-            with col3:
-                st.metric("Date Range", "Jan 2024 - Present")
-            
-            # Display sources breakdown
-            st.subheader(" Sources Breakdown")
-            source_counts = articles_df['source'].value_counts()
-            if not source_counts.empty:
-                st.bar_chart(source_counts)
-            
-            # Display articles in a detailed table
-            st.subheader(" Article Details")
-            
-            # Create a simplified display with proper error handling
-            for i, article in enumerate(articles):
-                try:
-                    # Safely get title and ensure it's a string
-                    title = str(article.get('title', 'No Title'))
-                    if len(title) > 100:
-                        display_title = title[:100] + "..."
-                    else:
-                        display_title = title
-                    
-                    with st.expander(f"{i+1}. {display_title}", key=f"article_{i}"):
-                        st.write(f"**Source:** {article.get('source', 'Unknown')}")
-                        st.write(f"**Date:** {article.get('date', 'Unknown')}")
-                        st.write(f"**Description:** {article.get('description', 'No description available')}")
-                        st.write(f"**Link:** [Read Article]({article.get('link', '')})")
-                except Exception as e:
-                    st.warning(f"Error displaying article {i+1}: {str(e)}")
-                    continue
+        result['articles'] = ordered
+        return result
+
+    def run_analysis_pipeline(self, articles, start_index, end_index, use_cascade=True, resume=False, budget=None):
+        """Extract and rank private sector companies from a range of articles, checkpointing as it goes"""
+        checkpoint = ExtractionCheckpoint(articles, start_index, end_index, mode='range' if budget is None else 'budget')
+        if not resume:
+            checkpoint.clear()
+        # The preview runs alongside extraction so the first LLM call is not held back by it
+        preview_stop = threading.Event()
+        preview = threading.Thread(
+            target=self.publish_preview, args=(articles, start_index, end_index, preview_stop),
+            name='scout-preview', daemon=True
+        )
+        preview.start()
+        try:
+            companies_data = self.extract_companies_with_enhanced_groq(
+                articles,
+                start_index=start_index,
+                end_index=end_index,
+                use_cascade=use_cascade,
+                checkpoint=checkpoint,
+                budget=budget
+            )
+        finally:
+            # Final results replace the preview; stop before the caller may delete the store
+            preview_stop.set()
+            preview.join()
+        return {
+            # Ranked per profile when shown; row dicts are only built for display and export
+            'lead_table': self.lead_scorer.build_table(companies_data) if companies_data else None,
+            'cascade_stats': self.cascade_stats,
+            'articles_analyzed': self.cascade_stats['articles'] if budget else end_index - start_index
+        }
+
+    def range_order(self, articles, start_index, end_index, chunk_size=500):
+        """(position, article) pairs in order, decoding one chunk of the range at a time"""
+        for chunk_start in range(start_index, end_index, chunk_size):
+            chunk = articles[chunk_start:min(chunk_start + chunk_size, end_index)]
+            yield from enumerate(chunk, start=chunk_start)
+
+    def budget_order(self, articles, start_index, end_index, budget, completed):
+        """(position, article) pairs best-first until the budget runs out.
+        
+        Checkpointed articles come first because restoring them is free.
+        """
+        for position in sorted(completed):
+            if start_index <= position < end_index:
+                yield position, articles[position]
+        queue = ArticlePrioritizer(self.LEAD_SIGNALS, self.SECTORS).queue(articles, start_index, end_index, skip=completed)
+        self.notify('info', f" Prioritized {len(queue)} articles; analyzing best-first within {budget.describe()}")
+        while queue and not budget.exhausted(self.cascade_stats):
+            _, position = heapq.heappop(queue)
+            yield position, articles[position]
 
-    def extract_companies_with_enhanced_groq(self, articles, start_index=0, end_index=None):
-        """Use Groq with enhanced prompts for better extraction including timeline details"""
+    def extract_companies_with_enhanced_groq(self, articles, start_index=0, end_index=None, use_cascade=True, checkpoint=None, budget=None):
+        """Use Groq with enhanced prompts for better extraction including timeline details.
+        
+        With a checkpoint, each finished article is persisted as it completes and
+        articles already recorded are restored instead of being sent to Groq again.
+        With a budget, the range is analyzed best-first by pre-score until the
+        budget is spent instead of in order.
+        """
         if not articles:
             return []
             
         if end_index is None:
             end_index = len(articles)
-            
-        articles_to_analyze = articles[start_index:end_index]
+        total = max(end_index - start_index, 0)
         
-        if not articles_to_analyze:
-            st.warning("No articles in the selected range to analyze")
+        if not total:
+            self.notify('warning', "No articles in the selected range to analyze")
             return []
             
         extracted_data = []
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        self.reset_cascade_stats()
         
         # Enhanced system prompt with timeline extraction
         system_prompt = f"""You are an expert Indian business analyst. Extract companies from news articles with focus on private sector projects.
@@ -635,20 +2944,65 @@ Return EXACT JSON format:
 
 If no private sector companies found, return: {{"companies": []}}"""
         
+        completed = checkpoint.load() if checkpoint else {}
+        if completed:
+            self.notify('info', f" Resuming: {len(completed)} of {total} articles restored from checkpoint")
+        
+        if budget is None:
+            work = self.range_order(articles, start_index, end_index)
+        else:
+            budget.start()
+            work = self.budget_order(articles, start_index, end_index, budget, completed)
+        
+        extraction_cache = get_shared_cache('extraction')
         processed_count = 0
-        for i, article in enumerate(articles_to_analyze):
+        llm_failures = 0
+        degraded = False  # Groq given up on for the rest of the run
+        for i, (position, article) in enumerate(work):
+            if self.cancelled():
+                self.notify('warning', f" Analysis cancelled after {i} of {total} articles")
+                break
+            
+            self.cascade_stats['articles'] += 1
+            if position in completed:
+                restored = [Lead(company, article) for company in completed[position]]
+                extracted_data.extend(restored)
+                processed_count += len(restored)
+                self.publish_partial(restored)
+                continue
+            
             try:
-                status_text.text(f" Analyzing article {start_index + i + 1}/{end_index}...")
-                progress_bar.progress((i + 1) / len(articles_to_analyze))
+                if budget is None:
+                    self.report_progress((i + 1) / total, f" Analyzing article {position + 1}/{end_index}...")
+                else:
+                    self.report_progress(budget.fraction_used(self.cascade_stats), f" Analyzing article {position + 1} (priority #{i + 1} of {total})...")
+                
+                cache_key = self.extraction_cache_key(article, use_cascade)
+                found, cached_companies = extraction_cache.get(cache_key)
+                if found:
+                    leads = [Lead(company, article) for company in cached_companies]
+                    self.cascade_stats['cached'] += 1
+                    extracted_data.extend(leads)
+                    processed_count += len(leads)
+                    self.publish_partial(leads)
+                    if checkpoint:
+                        checkpoint.record(position, article.link, cached_companies)
+                    continue
                 
-                content = article.get('content', '')
+                if degraded:
+                    leads = self.rule_based_fallback(article)
+                    extracted_data.extend(leads)
+                    processed_count += len(leads)
+                    continue
+                
+                content = article.content
                 if len(content) > 2500:  # Slightly reduced for better token usage
                     content = content[:2500]
                 
                 user_prompt = f"""
                 Analyze this Indian business news article for PRIVATE SECTOR companies with construction/expansion projects:
 
-                TITLE: {article.get('title', 'No Title')}
+                TITLE: {article.title}
                 CONTENT: {content}
 
                 Extract ALL private sector companies. Focus on companies in: {', '.join(self.SECTORS)}.
@@ -656,135 +3010,83 @@ If no private sector companies found, return: {{"companies": []}}"""
                 PAY SPECIAL ATTENTION TO TIMELINE INFORMATION: Extract months, years, quarters, specific dates when mentioned.
                 """
                 
-                # Use chat completion with retry logic
-                max_retries = 2
-                for attempt in range(max_retries):
-                    try:
-                        chat_completion = self.groq_client.chat.completions.create(
-                            messages=[
-                                {"role": "system", "content": system_prompt},
-                                {"role": "user", "content": user_prompt}
-                            ],
-                            model="llama-3.3-70b-versatile",
-                            temperature=0.1,
-                            max_tokens=2000,  # Increased for comprehensive analysis
-                            response_format={"type": "json_object"}
-                        )
-                        
-                        response_text = chat_completion.choices[0].message.content
-                        break
-                        
-                    except Exception as e:
-                        if attempt == max_retries - 1:
-                            raise e
-                        time.sleep(1)  # Wait before retry
+                # Cheap triage pass before paying for the large model
+                if use_cascade:
+                    passed, _ = self.triage_article(article.title, content)
+                    if not passed:
+                        extraction_cache.put(cache_key, [])
+                        if checkpoint:
+                            checkpoint.record(position, article.link, [])
+                        continue
                 
-                # Parse and validate response
                 try:
-                    data = json.loads(response_text.strip())
-                    companies = data.get('companies', [])
-                    
-                    for company in companies:
-                        # Validate required fields
-                        if (company.get('company_name') and 
-                            company.get('company_name') != 'null' and
-                            company.get('is_private_sector', False)):
-                            
-                            extracted_data.append({
-                                'Company Name': str(company['company_name']),
-                                'Source Link': article.get('link', ''),
-                                'Core Intent': str(company.get('core_intent', 'Private Sector Project')),
-                                'Stage': str(company.get('stage', 'Under Development')),
-                                'Detailed Timeline': str(company.get('detailed_timeline', 'Timeline not specified')),
-                                'Project Type': str(company.get('project_type', 'Unknown')),
-                                'Sector': str(company.get('sector', 'Private Sector')),
-                                'Confidence': str(company.get('confidence', 'medium')),
-                                'Article Title': str(article.get('title', 'No Title')),
-                                'Source': str(article.get('source', 'Unknown')),
-                                'Date': str(article.get('date', '2024+')),
-                                'Private Sector': company.get('is_private_sector', True)
-                            })
-                            processed_count += 1
-                            
-                except json.JSONDecodeError as e:
-                    st.warning(f"Failed to parse JSON from article {start_index + i + 1}: {str(e)}")
+                    response_text = self.groq_chat('extraction', self.EXTRACTION_MODEL, system_prompt, user_prompt, max_tokens=2000)
+                    # Parse tolerantly, re-asking only when nothing at all can be recovered
+                    companies, parse_status = parse_llm_json(response_text)
+                    if parse_status == 'failed':
+                        self.cascade_stats['json_reasked'] += 1
+                        response_text = self.groq_chat(
+                            'extraction', self.EXTRACTION_MODEL, system_prompt,
+                            user_prompt + "\nYour previous reply was not valid JSON. Reply with ONLY the JSON object described above.",
+                            max_tokens=2000
+                        )
+                        companies, parse_status = parse_llm_json(response_text)
+                except Exception as e:
+                    # Quota, auth and repeated failures switch the rest of the run to local extraction
+                    llm_failures += 1
+                    if getattr(e, 'status_code', None) in (401, 403, 429) or llm_failures >= self.LLM_FAILURE_LIMIT:
+                        degraded = True
+                        self.notify('warning', f" Groq unavailable ({str(e)[:150]}); analyzing the remaining articles with the rule-based extractor")
+                    else:
+                        self.notify('warning', f"Groq failed on article {position + 1}, used the rule-based extractor: {str(e)[:150]}")
+                    leads = self.rule_based_fallback(article)
+                    extracted_data.extend(leads)
+                    processed_count += len(leads)
+                    continue
+                llm_failures = 0
+                
+                if parse_status == 'failed':
+                    self.notify('warning', f"Failed to parse JSON from article {position + 1}, used the rule-based extractor")
+                    leads = self.rule_based_fallback(article)
+                    extracted_data.extend(leads)
+                    processed_count += len(leads)
                     continue
+                if parse_status in ('repaired', 'salvaged'):
+                    self.cascade_stats[f'json_{parse_status}'] += 1
+                
+                leads_before = len(extracted_data)
+                for company in companies:
+                    company = validate_company(company)
+                    if company is None:
+                        continue
+                    
+                    extracted_data.append(Lead(company, article))
+                    processed_count += 1
+                
+                if len(extracted_data) > leads_before:
+                    self.publish_partial(extracted_data[leads_before:])
+                    SourceScheduler.record_leads(
+                        article.search_source or article.source,
+                        len(extracted_data) - leads_before
+                    )
+                companies = [lead.to_dict() for lead in extracted_data[leads_before:]]
+                extraction_cache.put(cache_key, companies)
+                if checkpoint:
+                    checkpoint.record(position, article.link, companies)
                     
             except Exception as e:
-                st.warning(f"Error processing article {start_index + i + 1}: {str(e)}")
+                self.notify('warning', f"Error processing article {position + 1}: {str(e)}")
                 continue
         
-        progress_bar.empty()
-        status_text.empty()
+        self.clear_progress()
         
-        if processed_count > 0:
-            st.success(f" Successfully processed {processed_count} company entries from articles {start_index + 1} to {end_index}")
+        if processed_count > 0 and budget is None:
+            self.notify('success', f" Successfully processed {processed_count} company entries from articles {start_index + 1} to {end_index}")
+        elif processed_count > 0:
+            self.notify('success', f" Successfully processed {processed_count} company entries from the top {self.cascade_stats['articles']} of {total} articles")
         
         return extracted_data
 
-    def filter_and_rank_companies(self, companies):
-        """Filter and rank companies by relevance with sector focus"""
-        if not companies:
-            return []
-        
-        # Score companies based on multiple factors
-        for company in companies:
-            score = 0
-            
-            # Confidence scoring
-            if company['Confidence'] == 'high':
-                score += 3
-            elif company['Confidence'] == 'medium':
-                score += 2
-            else:
-                score += 1
-            
-            # Project type scoring
-            if company['Project Type'] in ['Greenfield', 'Brownfield']:
-                score += 2
-            
-            # Lead signal matching in stage
-            stage = str(company['Stage']).lower()
-            if any(signal in stage for signal in self.LEAD_SIGNALS):
-                score += 2
-            
-            # Timeline scoring - higher score for specific timelines
-            timeline = str(company.get('Detailed Timeline', '')).lower()
-            if any(time_indicator in timeline for time_indicator in ['2024', '2025', 'q1', 'q2', 'q3', 'q4', 'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august', 'september', 'october', 'november', 'december']):
-                score += 2
-            
-            # Sector priority (higher scores for key sectors)
-            sector = str(company['Sector']).lower()
-            high_priority_sectors = ['manufacturing', 'warehouse', 'logistics park', 'data centre', 'industrial park']
-            medium_priority_sectors = ['hospital', 'it park', 'corporate campus', 'office tower']
-            
-            if any(priority in sector for priority in high_priority_sectors):
-                score += 3
-            elif any(priority in sector for priority in medium_priority_sectors):
-                score += 2
-            else:
-                score += 1
-            
-            # Private sector bonus
-            if company.get('Private Sector', True):
-                score += 1
-            
-            company['Relevance Score'] = score
-        
-        # Sort by relevance
-        companies.sort(key=lambda x: x['Relevance Score'], reverse=True)
-        
-        # Remove duplicates based on company name + core intent
-        seen_companies = set()
-        unique_companies = []
-        for company in companies:
-            company_key = f"{str(company['Company Name']).lower().strip()}_{str(company['Core Intent'])[:30]}"
-            if company_key not in seen_companies:
-                seen_companies.add(company_key)
-                unique_companies.append(company)
-        
-        return unique_companies
-
     def generate_tsv_output(self, companies):
         """Generate TSV output with all enhanced fields including timeline"""
         if not companies:
@@ -807,8 +3109,99 @@ If no private sector companies found, return: {{"companies": []}}"""
         
         return "\n".join(tsv_lines)
 
+@st.fragment(run_every=1.0)
+def job_status_panel(job_id):
+    """Poll a background job and show its progress, log and partial results"""
+    job = get_job_runner().get(job_id)
+    if job is None or job.finished:
+        st.rerun()
+    
+    st.progress(job.progress, text=f"{job.description}: {job.message}")
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        partial = job.partial_snapshot()
+        noun = "articles" if job.kind == 'search' else "companies"
+        st.caption(f"Status: {job.status} | {job.partial_count} {noun} so far | elapsed {time.time() - job.created_at:.0f}s")
+    with col2:
+        if st.button(" Cancel", key=f"cancel_{job.id}", disabled=job.cancel_event.is_set(), use_container_width=True):
+            job.cancel()
+    
+    if job.kind == 'analysis' and job.preview:
+        import pandas as pd
+        with st.expander(f" Instant preview: {job.preview_count} rule-based leads, replaced by the AI results when analysis finishes", expanded=not partial):
+            rows = pd.DataFrame(job.preview[:50])
+            st.dataframe(rows[['Company Name', 'Sector', 'Project Type', 'Stage', 'Detailed Timeline', 'Confidence']], use_container_width=True, hide_index=True)
+    if job.kind == 'analysis' and partial:
+        import pandas as pd
+        rows = [lead.to_row() for lead in partial[-20:]]
+        st.dataframe(pd.DataFrame(rows)[['Company Name', 'Sector', 'Project Type', 'Stage']], use_container_width=True, hide_index=True)
+    with st.expander(" Activity", expanded=False):
+        for level, message in job.recent_messages():
+            st.caption(f"{level.upper()}: {message}")
+
+def discard_articles():
+    """Delete the session's on-disk article store before its articles are replaced"""
+    articles = st.session_state.get('articles')
+    if hasattr(articles, 'delete'):
+        articles.delete()
+
+def apply_search_job(job):
+    """Move a finished search job's results into session state"""
+    result = job.result or {}
+    articles = result.get('articles') or []
+    st.session_state.source_report = result.get('source_report')
+    if job.status == 'failed':
+        st.session_state.job_notice = ('error', f" Search failed: {job.error}")
+    elif not articles:
+        st.session_state.job_notice = ('error', """
+         No articles found. Possible issues:
+        - Internet connectivity
+        - Search engines temporarily unavailable
+        - Try different sectors, a wider recency window, or reduce query complexity
+        """)
+    else:
+        discard_articles()
+        st.session_state.articles = articles
+        st.session_state.search_complete = True
+        st.session_state.analysis_complete = False
+        st.session_state.lead_table = None
+        st.session_state.date_range = result.get('date_range')
+        cancelled = " (search cancelled, partial results)" if job.status == 'cancelled' else ""
+        st.session_state.job_notice = ('success', f" Found {len(articles)} articles{cancelled}")
+
+def apply_analysis_job(job):
+    """Move a finished analysis job's results into session state"""
+    result = job.result or {}
+    st.session_state.cascade_stats = result.get('cascade_stats')
+    lead_table = result.get('lead_table')
+    if job.status == 'failed':
+        st.session_state.job_notice = ('error', f" Analysis failed: {job.error}")
+    elif not LeadScorer.lead_count(lead_table):
+        st.session_state.job_notice = ('error', """
+        ❌ No private sector companies extracted. This could mean:
+        - Articles are about government projects
+        - News doesn't contain specific company information
+        - Try expanding sector selection
+        - Increase number of articles analyzed
+        """)
+    else:
+        st.session_state.lead_table = lead_table
+        st.session_state.articles_analyzed = result.get('articles_analyzed')
+        st.session_state.analysis_complete = True
+        cancelled = " (analysis cancelled, partial results)" if job.status == 'cancelled' else ""
+        st.session_state.job_notice = ('success', f"🎉 Found {LeadScorer.lead_count(lead_table)} private sector companies!{cancelled}")
+
+def get_session_scout():
+    """Scout kept for the browser session instead of being rebuilt on every rerun"""
+    if 'scout' not in st.session_state:
+        st.session_state.scout = MultiSectorCompanyScout()
+    scout = st.session_state.scout
+    scout._progress_widgets = None  # placeholders from the previous run are gone
+    return scout
+
 def main():
     st.title(" AI Company Scout")
+    get_cache_warmer()  # starts pre-warming with the first page load, not the first sidebar expand
     
     # Initialize session state
     if 'articles' not in st.session_state:
@@ -817,10 +3210,25 @@ def main():
         st.session_state.search_complete = False
     if 'analysis_complete' not in st.session_state:
         st.session_state.analysis_complete = False
-    if 'ranked_companies' not in st.session_state:
-        st.session_state.ranked_companies = None
+    if 'lead_table' not in st.session_state:
+        st.session_state.lead_table = None
+    if 'cascade_stats' not in st.session_state:
+        st.session_state.cascade_stats = None
+    if 'source_report' not in st.session_state:
+        st.session_state.source_report = None
+    if 'date_range' not in st.session_state:
+        st.session_state.date_range = None
+    if 'articles_analyzed' not in st.session_state:
+        st.session_state.articles_analyzed = None
+    if 'job_notice' not in st.session_state:
+        st.session_state.job_notice = None
+    # Job ids also live in the URL so a reconnecting browser picks its jobs back up
+    if 'search_job_id' not in st.session_state:
+        st.session_state.search_job_id = st.query_params.get('search_job')
+    if 'analysis_job_id' not in st.session_state:
+        st.session_state.analysis_job_id = st.query_params.get('analysis_job')
     
-    if not st.secrets.get("GROQ_API_KEY"):
+    if not get_setting("GROQ_API_KEY"):
         st.error(" Groq API key required (free at https://console.groq.com)")
         st.info("""
         **Get free API key:**
@@ -831,7 +3239,7 @@ def main():
         """)
         return
     
-    scout = MultiSectorCompanyScout()
+    scout = get_session_scout()
     
     with st.sidebar:
         st.header(" Search Configuration")
@@ -840,26 +3248,109 @@ def main():
         project_types = st.multiselect(
             "Select Project Types:",
             ["Greenfield Projects", "Brownfield Projects"],
-            default=["Greenfield Projects", "Brownfield Projects"]
+            default=DEFAULT_PROJECT_TYPES
         )
         
         st.subheader(" Target Sectors")
         selected_sectors = st.multiselect(
             "Select Sectors (Private Sector Focus):",
             scout.SECTORS,
-            default=["manufacturing", "warehouse", "hospital", "it park", "logistics park"]
+            default=DEFAULT_SECTORS
         )
         
         st.subheader(" News Sources")
         selected_sources = st.multiselect(
             "Select News Sources:",
             list(scout.NEWS_SOURCES.keys()),
-            default=['Google News', 'DuckDuckGo', 'Bing News']  # Simplified default
+            default=DEFAULT_SOURCES
         )
         
         st.subheader(" Search Settings")
-        max_per_source = st.slider("Results per Search", 5, 20, 10)
+        max_per_source = st.slider(
+            "Results per Search", 5, max(scout.MAX_RESULT_PAGES * 10, 10), DEFAULT_RESULTS_PER_SEARCH,
+            help=f"Above one page, sources are paged until this many results or until pages repeat articles already found (at most {scout.MAX_RESULT_PAGES} pages, so 10-per-page sources stop at {scout.MAX_RESULT_PAGES * 10})"
+        )
+        request_budget_pct = st.slider(
+            "Request budget (% of full sweep)", 10, 100, 70, 5,
+            help="Share of the requests a full query × source sweep (with paging) could take. The budget shifts toward sources that yield the most unique articles and leads; failing or blocked sources are skipped."
+        )
+        
+        recency_days = st.slider(
+            "Recency window (days)", 7, 730, 365,
+            help="Articles published before this window are dropped before any AI analysis"
+        )
+        keep_undated = st.checkbox("Keep articles without a detectable date", value=True)
+        
+        fetch_full_text = st.toggle(
+            "Fetch full article text",
+            value=False,
+            help="Download each article page so timelines and company names in the body reach the AI analysis"
+        )
         
+        st.subheader(" AI Settings")
+        use_cascade = st.toggle(
+            "Small-model triage before extraction",
+            value=True,
+            help=f"{scout.TRIAGE_MODEL} screens each article; only likely private sector projects go to {scout.EXTRACTION_MODEL}"
+        )
+        scout.TRIAGE_THRESHOLD = st.slider(
+            "Triage threshold", 0.0, 1.0, scout.TRIAGE_THRESHOLD, 0.05,
+            disabled=not use_cascade,
+            help="Minimum probability that an article describes a private sector project"
+        )
+        
+        with st.expander(" Shared Cache", expanded=False):
+            search_stats = get_shared_cache('search').summary()
+            body_stats = get_shared_cache('bodies').summary()
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Search hit rate", f"{search_stats['hit_rate']:.0%}")
+                st.caption(f"{search_stats['entries']} entries, {search_stats['megabytes']:.1f} MB, {search_stats['coalesced']} coalesced")
+            with col2:
+                st.metric("Article text hit rate", f"{body_stats['hit_rate']:.0%}")
+                st.caption(f"{body_stats['entries']} entries, {body_stats['megabytes']:.1f} MB")
+            extraction_stats = get_shared_cache('extraction').summary()
+            st.caption(f"Extraction cache: {extraction_stats['hit_rate']:.0%} hit rate, {extraction_stats['entries']} articles")
+            warmer = get_cache_warmer()
+            if warmer.enabled:
+                st.caption(f"Pre-warming: {warmer.describe()}")
+                if warmer.history:
+                    finished_at, label, outcome = warmer.history[-1]
+                    st.caption(f"Last: {label} ({outcome})")
+            else:
+                st.caption("Pre-warming off (set CACHE_WARMING = true)")
+
+        with st.expander(" HTTP Transport", expanded=False):
+            transport = get_http_transport()
+            pool_rows = transport.summary()
+            total_requests = sum(row['Requests'] for row in pool_rows if row['Connections'] is not None)
+            total_connections = sum(row['Connections'] for row in pool_rows if row['Connections'] is not None)
+            reuse = 1 - total_connections / total_requests if total_requests else 0.0
+            st.metric("Connection reuse", f"{reuse:.0%}")
+            st.caption(f"{total_requests} requests over {total_connections} connections | "
+                       f"{'HTTP/2' if transport.http2 else 'HTTP/1.1 keep-alive'} | {transport.accept_encoding}")
+
+        with st.expander(" Sharded Crawl", expanded=False):
+            st.caption("Load articles gathered offline with `python sharded_crawl.py run`")
+            crawl_db = st.text_input("Crawl database", value=get_setting("CRAWL_DB_PATH", "crawl.db"))
+            # A running job still reads the current article store, which loading would delete
+            job_running = bool(st.session_state.search_job_id or st.session_state.analysis_job_id)
+            if st.button("Load Crawl Results", disabled=job_running or not os.path.exists(crawl_db),
+                         help="Available once the running search or analysis finishes" if job_running else None):
+                import sharded_crawl
+                result = sharded_crawl.merge(crawl_db, recency_days, keep_undated, scout=scout)
+                st.session_state.source_report = None
+                if result['articles']:
+                    discard_articles()
+                    st.session_state.articles = result['articles']
+                    st.session_state.search_complete = True
+                    st.session_state.analysis_complete = False
+                    st.session_state.lead_table = None
+                    st.session_state.date_range = result['date_range']
+                    st.session_state.job_notice = ('success', f" Loaded {len(result['articles'])} articles from {crawl_db}")
+                else:
+                    st.session_state.job_notice = ('error', f" No articles in {crawl_db}")
+
         st.info("""
         **Enhanced Features:**
         - Multiple news sources including press release sites
@@ -870,8 +3361,28 @@ def main():
     
     st.header(" Company Discovery")
     
+    runner = get_job_runner()
+    ExtractionCheckpoint.prune()
+    ArticleStore.prune()
+    
+    # Collect background jobs that finished since the last rerun
+    for kind, apply_job in (('search', apply_search_job), ('analysis', apply_analysis_job)):
+        job = runner.get(st.session_state[f'{kind}_job_id'])
+        if st.session_state[f'{kind}_job_id'] and (job is None or job.finished):
+            if job is not None:
+                apply_job(job)
+            st.session_state[f'{kind}_job_id'] = None
+            st.query_params.pop(f'{kind}_job', None)
+    
+    if st.session_state.job_notice:
+        level, message = st.session_state.job_notice
+        getattr(st, level)(message)
+        st.session_state.job_notice = None
+    
     # Search section - ALWAYS show if we have articles or not
-    if st.session_state.articles is None or not st.session_state.search_complete:
+    if st.session_state.search_job_id:
+        job_status_panel(st.session_state.search_job_id)
+    elif st.session_state.articles is None or not st.session_state.search_complete:
         if st.button(" Start Comprehensive Search", type="primary", use_container_width=True):
             if not selected_sectors:
                 st.error(" Please select at least one sector")
@@ -887,44 +3398,24 @@ def main():
             
             # Generate targeted search queries
             search_queries = scout.get_search_queries(selected_sectors, project_types)
+            request_budget = max(1, scout.sweep_requests(len(search_queries), len(selected_sources), max_per_source) * request_budget_pct // 100)
             
-            st.info(f" Using {len(search_queries)} targeted queries across {len(selected_sectors)} sectors and {len(selected_sources)} sources")
-            
-            with st.spinner(" Comprehensive multi-source search in progress..."):
-                # Perform hybrid search
-                articles = scout.hybrid_search(search_queries, max_per_source, selected_sources)
-                
-                if not articles:
-                    st.error("""
-                     No articles found. Possible issues:
-                    - Internet connectivity
-                    - Search engines temporarily unavailable
-                    - Try different sectors or reduce query complexity
-                    """)
-                    return
-                
-                # Store articles in session state
-                st.session_state.articles = articles
-                st.session_state.search_complete = True
-                st.session_state.analysis_complete = False
-                st.session_state.ranked_companies = None
-                
-                st.success(f" Found {len(articles)} articles from {len(selected_sources)} sources")
-                
-                # Display ALL found articles before AI analysis
-                scout.display_found_articles(articles)
-                
-                # Show search summary
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    source_counts = pd.DataFrame(articles)['source'].value_counts()
-                    st.metric("Total Sources", len(source_counts))
-                with col2:
-                    st.metric("Total Articles", len(articles))
-                with col3:
-                    st.metric("Date Range", "Jan 2024+")
+            job = runner.submit(
+                'search',
+                f"Searching {len(search_queries)} queries across {len(selected_sectors)} sectors and {len(selected_sources)} sources",
+                run_search_job,
+                search_queries=search_queries,
+                max_per_source=max_per_source,
+                selected_sources=selected_sources,
+                request_budget=request_budget,
+                recency_days=recency_days,
+                keep_undated=keep_undated,
+                fetch_full_text=fetch_full_text
+            )
+            st.session_state.search_job_id = job.id
+            st.query_params['search_job'] = job.id
             
-            # Rerun to show the analysis section
+            # Rerun to show the job progress
             st.rerun()
     
     # ALWAYS show search results if we have articles
@@ -934,38 +3425,43 @@ def main():
         # Show search results summary (always visible during analysis phase)
         st.header(" Search Results Summary")
         
+        import pandas as pd
+        source_counts = pd.Series(scout.source_counts(articles), dtype='int64')
+        
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.metric("Total Articles", len(articles))
         with col2:
-            source_counts = pd.DataFrame(articles)['source'].value_counts()
             st.metric("Sources Used", len(source_counts))
         with col3:
-            st.metric("Date Range", "Jan 2024+")
+            st.metric("Date Range", st.session_state.date_range or "Unknown")
         with col4:
-            if st.session_state.ranked_companies:
-                st.metric("Companies Found", len(st.session_state.ranked_companies))
+            lead_count = LeadScorer.lead_count(st.session_state.lead_table)
+            if lead_count:
+                st.metric("Companies Found", lead_count)
             else:
                 st.metric("Ready for Analysis", "✓")
         
         # Show sources breakdown
         st.subheader(" Sources Breakdown")
-        source_df = pd.DataFrame(articles)
-        if not source_df.empty and 'source' in source_df.columns:
-            source_counts = source_df['source'].value_counts()
+        if not source_counts.empty:
             st.bar_chart(source_counts)
         
+        if st.session_state.source_report:
+            with st.expander(" Source Yield & Budget", expanded=False):
+                st.dataframe(pd.DataFrame(st.session_state.source_report), use_container_width=True, hide_index=True)
+        
         # Quick articles preview
         with st.expander(" Quick Articles Preview", expanded=True):
             st.info(f"Showing first 10 of {len(articles)} articles. Use the analysis range below to select which articles to analyze.")
             for i, article in enumerate(articles[:10]):
-                title = str(article.get('title', 'No Title'))
+                title = article.title
                 if len(title) > 100:
                     display_title = title[:100] + "..."
                 else:
                     display_title = title
                 st.write(f"**{i+1}. {display_title}**")
-                st.caption(f"Source: {article.get('source', 'Unknown')} | Date: {article.get('date', 'Unknown')}")
+                st.caption(f"Source: {article.source} | Date: {article.display_date}")
         
         # Add a separator before AI analysis
         st.markdown("---")
@@ -977,82 +3473,129 @@ def main():
         
         st.info(f" Total articles available: **{total_articles}**")
         
-        col1, col2 = st.columns(2)
-        with col1:
-            start_index = st.number_input(
-                "Start analysis from article:", 
-                min_value=0, 
-                max_value=total_articles-1, 
-                value=0,
-                help="Starting index of articles to analyze (0 = first article)"
-            )
-        with col2:
-            end_index = st.number_input(
-                "End analysis at article:", 
-                min_value=1, 
-                max_value=total_articles, 
-                value=min(50, total_articles),  # Default to 50 or total articles if less
-                help="Ending index of articles to analyze (exclusive)"
-            )
+        analysis_mode = st.radio(
+            "Analysis mode:",
+            ["Range", "Budget"],
+            horizontal=True,
+            help="Range analyzes articles in order; Budget analyzes the most promising articles first until a limit is reached"
+        )
+        budget_limits = None
+        if analysis_mode == "Range":
+            col1, col2 = st.columns(2)
+            with col1:
+                start_index = st.number_input(
+                    "Start analysis from article:", 
+                    min_value=0, 
+                    max_value=total_articles-1, 
+                    value=0,
+                    help="Starting index of articles to analyze (0 = first article)"
+                )
+            with col2:
+                end_index = st.number_input(
+                    "End analysis at article:", 
+                    min_value=1, 
+                    max_value=total_articles, 
+                    value=min(DEFAULT_ANALYSIS_ARTICLES, total_articles),
+                    help="Ending index of articles to analyze (exclusive)"
+                )
+        else:
+            start_index, end_index = 0, total_articles
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                max_calls = st.number_input("Max LLM calls:", min_value=0, value=100, step=10, help="0 = no limit")
+            with col2:
+                max_tokens = st.number_input("Max tokens:", min_value=0, value=0, step=10000, help="0 = no limit")
+            with col3:
+                max_seconds = st.number_input("Max seconds:", min_value=0, value=0, step=60, help="0 = no limit")
+            budget_limits = {'max_calls': max_calls, 'max_tokens': max_tokens, 'max_seconds': max_seconds}
         
         if start_index >= end_index:
             st.error(" Start index must be less than end index")
+        elif budget_limits is not None and not any(budget_limits.values()):
+            st.error(" Set at least one budget limit")
         else:
             articles_to_analyze = end_index - start_index
-            st.success(f" Will analyze **{articles_to_analyze}** articles (articles {start_index + 1} to {end_index})")
+            if budget_limits is None:
+                st.success(f" Will analyze **{articles_to_analyze}** articles (articles {start_index + 1} to {end_index})")
+            else:
+                st.success(f" Will analyze the most promising of **{articles_to_analyze}** articles within {AnalysisBudget(**budget_limits).describe()}")
             
-            # Analysis button
-            if st.button(" Start AI Analysis", type="primary", key="analyze"):
-                with st.spinner(f" AI analyzing {articles_to_analyze} articles for private sector companies..."):
-                    # Extract companies using enhanced Groq processing with range
-                    companies_data = scout.extract_companies_with_enhanced_groq(
-                        articles, 
-                        start_index=start_index, 
-                        end_index=end_index
+            checkpoint = ExtractionCheckpoint(articles, start_index, end_index, mode='range' if budget_limits is None else 'budget')
+            checkpoint_done = checkpoint.completed_count()
+            
+            # Analysis buttons
+            if st.session_state.analysis_job_id:
+                job_status_panel(st.session_state.analysis_job_id)
+            else:
+                resume = False
+                if 0 < checkpoint_done < checkpoint.total():
+                    if budget_limits is None:
+                        st.info(f" A previous analysis of this range stopped after {checkpoint_done} of {checkpoint.total()} articles. Resume to skip the completed ones.")
+                        resume_label = " Resume AI Analysis"
+                    else:
+                        # A budget run is expected to leave articles unanalyzed; only the budget ran out
+                        st.info(f" A previous budget run analyzed the {checkpoint_done} most promising articles. Continue with more budget to keep those and analyze the next ones.")
+                        resume_label = " Continue with More Budget"
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        resume = st.button(resume_label, type="primary", key="resume_analysis", use_container_width=True)
+                    with col2:
+                        start = st.button(" Start Over", key="analyze", use_container_width=True)
+                else:
+                    start = st.button(" Start AI Analysis", type="primary", key="analyze")
+                
+                if start or resume:
+                    job = runner.submit(
+                        'analysis',
+                        f"AI analyzing {articles_to_analyze} articles for private sector companies",
+                        run_analysis_job,
+                        articles,
+                        start_index,
+                        end_index,
+                        use_cascade,
+                        scout.TRIAGE_THRESHOLD,
+                        resume,
+                        budget_limits
                     )
+                    st.session_state.analysis_job_id = job.id
+                    st.query_params['analysis_job'] = job.id
                     
-                    if not companies_data:
-                        st.error("""
-                        ❌ No private sector companies extracted. This could mean:
-                        - Articles are about government projects
-                        - News doesn't contain specific company information
-                        - Try expanding sector selection
-                        - Increase number of articles analyzed
-                        """)
-                    else:
-                        # Filter and rank companies
-                        ranked_companies = scout.filter_and_rank_companies(companies_data)
-                        st.session_state.ranked_companies = ranked_companies
-                        st.session_state.analysis_complete = True
-                        
-                        st.success(f"🎉 Found {len(ranked_companies)} private sector companies!")
-                        
-                        # Rerun to show results
-                        st.rerun()
+                    # Rerun to show the job progress
+                    st.rerun()
     
     # Show results if analysis is complete
-    if st.session_state.analysis_complete and st.session_state.ranked_companies is not None:
+    if st.session_state.analysis_complete and st.session_state.lead_table is not None:
         # Display comprehensive results
         st.header(" Private Sector Discovery Results")
         
-        ranked_companies = st.session_state.ranked_companies
+        # Re-ranking under another profile is a vector operation over the stored lead table
+        scoring_profile = st.selectbox(
+            "Scoring profile:",
+            list(SCORING_PROFILES.keys()),
+            help="Weights applied to confidence, project type, lead signals, timeline and sector priority"
+        )
+        ranked = scout.lead_scorer.rank(st.session_state.lead_table, scoring_profile)
         
         # Statistics
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Articles Analyzed", articles_to_analyze)
+            st.metric("Articles Analyzed", st.session_state.articles_analyzed)
         with col2:
-            st.metric("Companies Found", len(ranked_companies))
+            st.metric("Companies Found", len(ranked))
         with col3:
-            greenfield_count = len([c for c in ranked_companies if c['Project Type'] == 'Greenfield'])
+            greenfield_count = int((ranked['Project Type'] == 'Greenfield').sum())
             st.metric("Greenfield", greenfield_count)
         with col4:
-            brownfield_count = len([c for c in ranked_companies if c['Project Type'] == 'Brownfield'])
+            brownfield_count = int((ranked['Project Type'] == 'Brownfield').sum())
             st.metric("Brownfield", brownfield_count)
         
+        if st.session_state.cascade_stats:
+            scout.cascade_stats = st.session_state.cascade_stats
+            scout.display_cascade_stats()
+        
         # Company details table
         st.subheader(" Company Details (Private Sector Only)")
-        df = pd.DataFrame(ranked_companies)
+        df = ranked
         
         # Enhanced color coding
         def color_project_type(val):
@@ -1086,9 +3629,9 @@ def main():
                 "Relevance Score": st.column_config.ProgressColumn(
                     "Relevance",
                     help="How relevant this company is to your search",
-                    format="%f",
+                    format="%.1f",
                     min_value=0,
-                    max_value=10,
+                    max_value=LeadScorer.max_score(scoring_profile),
                 )
             },
             use_container_width=True,
@@ -1098,7 +3641,7 @@ def main():
         
         # TSV Output
         st.subheader(" TSV Output - Copy Ready")
-        tsv_output = scout.generate_tsv_output(ranked_companies)
+        tsv_output = scout.generate_tsv_output(ranked.to_dict('records'))
         st.code(tsv_output, language='text')
         
         # Download button
@@ -1111,11 +3654,18 @@ def main():
         )
         
         # Reset button
-        if st.button(" Start New Search", type="secondary"):
+        job_running = bool(st.session_state.search_job_id or st.session_state.analysis_job_id)
+        if st.button(" Start New Search", type="secondary", disabled=job_running,
+                     help="Available once the running analysis finishes" if job_running else None):
+            discard_articles()
             st.session_state.articles = None
             st.session_state.search_complete = False
             st.session_state.analysis_complete = False
-            st.session_state.ranked_companies = None
+            st.session_state.lead_table = None
+            st.session_state.cascade_stats = None
+            st.session_state.source_report = None
+            st.session_state.date_range = None
+            st.session_state.articles_analyzed = None
             st.rerun()
 
     else:
@@ -0,0 +1,654 @@
+"""Load test: drive concurrent simulated sessions through app.py against local stand-ins for the news sources and Groq.
+
+Typical use:
+
+    python load_test.py --sessions 1 2 4 8 16
+    python load_test.py --sessions 4 8 --news-latency 0.5 --groq-latency 1.5 --groq-error-rate 0.05 --json results.json
+
+Each simulated session is a Streamlit AppTest running the real `main()` flow:
+configure the sidebar, search, choose the analysis range, analyze and export the TSV.
+Progress is polled with a full rerun every --poll-interval seconds (the browser reruns
+only the job status fragment, so this slightly overstates rerun cost). All sessions of
+a level share this process, so cache_resource objects (job runner, HTTP transport,
+shared caches) are shared exactly as they are between users of one server; they are
+cleared between levels.
+
+The stand-in servers run in a separate process so their CPU is not charged to the app.
+Outbound news requests are rewritten to the news stand-in at the requests adapter level,
+which keeps the app's pooled sessions, timeouts and redirects in play; Groq is reached
+through GROQ_BASE_URL.
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+PHASES = ["configure", "search", "range", "analyze", "export"]
+PERCENTILES = (50, 95, 99)
+ARTICLE_UNIVERSE = 5000
+
+COMPANY_WORDS = [
+    "Apex", "Bharat", "Crescent", "Deccan", "Everest", "Frontier", "Ganga", "Horizon", "Indus", "Jaipur",
+    "Kaveri", "Lotus", "Meridian", "Narmada", "Orient", "Pinnacle", "Quantum", "Sahyadri", "Trident", "Vista",
+]
+COMPANY_KINDS = ["Industries", "Logistics", "Healthcare", "Infratech", "Foods", "Textiles", "Pharma", "Realty"]
+COMPANY_SUFFIXES = ["Pvt Ltd", "Ltd", "Limited"]
+CITIES = ["Pune", "Chennai", "Hyderabad", "Ahmedabad", "Nagpur", "Coimbatore", "Lucknow", "Indore"]
+PROJECTS = [
+    "to set up new {sector} facility in {city}",
+    "lays foundation stone for {sector} plant near {city}",
+    "announces expansion of {city} {sector} capacity",
+    "breaks ground on {sector} project in {city}",
+]
+PUBLISHERS = ["economictimes.example", "businessline.example", "livemint.example", "moneycontrol.example"]
+
+
+# ---------------------------------------------------------------------------
+# Stand-in servers
+# ---------------------------------------------------------------------------
+
+def synthetic_article(index):
+    """Deterministic article number `index` of the shared universe the stand-in sources draw from"""
+    rng = random.Random(index)
+    company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_KINDS)} {rng.choice(COMPANY_SUFFIXES)}"
+    sector = rng.choice(["manufacturing", "warehouse", "hospital", "it park", "logistics park", "data center"])
+    city = rng.choice(CITIES)
+    title = f"{company} {rng.choice(PROJECTS).format(sector=sector, city=city)}"
+    published = datetime.now(timezone.utc) - timedelta(days=rng.randint(1, 400), hours=rng.randint(0, 23))
+    slug = re.sub(r'[^a-z0-9]+', '-', title.lower()).strip('-')
+    return {
+        'id': index,
+        'title': title,
+        'company': company,
+        'url': f"https://www.{rng.choice(PUBLISHERS)}/news/{published:%Y/%m/%d}/{slug}-{index}",
+        'description': f"{company} will invest Rs {rng.randint(50, 900)} crore; commercial operations are expected by Q{rng.randint(1, 4)} {published.year + 1}.",
+        'published': published,
+    }
+
+
+def page_articles(query, page, page_size):
+    """The articles a stand-in source returns for one page of a query, overlapping across queries and sources"""
+    seed = int(hashlib.sha1(query.lower().encode()).hexdigest()[:8], 16)
+    return [synthetic_article((seed + page * page_size + i * 7) % ARTICLE_UNIVERSE) for i in range(page_size)]
+
+
+def rss_document(articles, link_for=lambda article: article['url']):
+    items = "".join(
+        f"<item><title>{article['title']}</title><link>{link_for(article)}</link>"
+        f"<pubDate>{format_datetime(article['published'])}</pubDate>"
+        f"<description>{article['description']}</description></item>"
+        for article in articles
+    )
+    return f"<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>stub</title>{items}</channel></rss>"
+
+
+def render_news(host, path, params):
+    """(content type, body) in the markup each source's parser expects; None for an unknown page"""
+    query = (params.get('q') or params.get('p') or [''])[0]
+    if host == 'news.google.com' and path.startswith('/rss/search'):
+        return 'application/rss+xml', rss_document(
+            page_articles(query, 0, 40), lambda article: f"https://news.google.com/rss/articles/STUB{article['id']}"
+        )
+    if host == 'html.duckduckgo.com':
+        page = int((params.get('s') or [0])[0]) // 30
+        return 'text/html', "".join(
+            f"<div class=\"result\"><a class=\"result__a\" href=\"//duckduckgo.com/l/?uddg={urllib.parse.quote(article['url'], safe='')}\">"
+            f"{article['title']}</a><a class=\"result__snippet\">{article['description']}</a></div>"
+            for article in page_articles(query, page, 30)
+        )
+    if host == 'www.bing.com':
+        page = (int((params.get('first') or [1])[0]) - 1) // 10
+        return 'text/html', "".join(
+            f"<div class=\"news-card\"><a class=\"title\" href=\"{article['url']}\">{article['title']}</a>"
+            f"<div class=\"snippet\">{article['description']}</div><div class=\"source\">Bing News</div>"
+            f"<span class=\"time\">{(datetime.now(timezone.utc) - article['published']).days}d</span></div>"
+            for article in page_articles(query, page, 10)
+        )
+    if host == 'news.search.yahoo.com':
+        page = (int((params.get('b') or [1])[0]) - 1) // 10
+        return 'text/html', "".join(
+            f"<div class=\"NewsArticle\"><h4><a href=\"{article['url']}\">{article['title']}</a></h4>"
+            f"<p class=\"s-desc\">{article['description']}</p></div>"
+            for article in page_articles(query, page, 10)
+        )
+    if host == 'www.google.com' and path == '/search':
+        page = int((params.get('start') or [0])[0]) // 10
+        return 'text/html', "".join(
+            f"<div class=\"SoaBEf\"><a href=\"{article['url']}\"><div role=\"heading\">{article['title']}</div></a>"
+            f"<div class=\"Y3v8qd\">{article['description']}</div><span class=\"r0bn4c\">Business News</span></div>"
+            for article in page_articles(query, page, 10)
+        )
+    if host == 'www.reutersagency.com':
+        return 'application/rss+xml', rss_document(page_articles('reuters', 0, 50))
+    match = re.search(r'-(\d+)$', path)
+    if match:  # publisher article page
+        article = synthetic_article(int(match.group(1)) % ARTICLE_UNIVERSE)
+        return 'text/html', (
+            f"<html><head><title>{article['title']}</title></head><body><article><h1>{article['title']}</h1>"
+            + f"<p>{article['description']}</p>" * 6 + "</article></body></html>"
+        )
+    return None
+
+
+def groq_completion(request):
+    """OpenAI-style chat completion answering triage and extraction prompts from the article text"""
+    prompt = "\n".join(message.get('content', '') for message in request.get('messages', []))
+    if '"relevant"' in prompt:
+        content = {"relevant": True, "confidence": 0.9}
+    else:
+        names = dict.fromkeys(re.findall(r'\b((?:[A-Z][a-z]+ ){2}(?:Pvt Ltd|Ltd|Limited))\b', prompt))
+        content = {"companies": [
+            {
+                "company_name": name,
+                "core_intent": "New facility",
+                "stage": "Announced",
+                "detailed_timeline": "Commercial operations by Q4 2027",
+                "project_type": "Greenfield",
+                "sector": "manufacturing",
+                "confidence": "high",
+                "is_private_sector": True,
+            }
+            for name in list(names)[:3]
+        ]}
+    text = json.dumps(content)
+    prompt_tokens, completion_tokens = len(prompt) // 4, len(text) // 4
+    return {
+        "id": f"chatcmpl-stub-{random.getrandbits(32):08x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get('model', 'stub'),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens},
+    }
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server that delays every response and fails a share of them"""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, latency, error_rate):
+        super().__init__(address, StubHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):  # clients dropping pooled connections
+            super().handle_error(request, client_address)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves news pages under /<original host>/<path> and Groq chat completions under /openai/v1/"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, body=b"", content_type="text/html", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b""
+        if self.server.latency:
+            time.sleep(self.server.latency * random.uniform(0.5, 1.5))
+        if random.random() < self.server.error_rate:
+            return self._reply(500, b'{"error": {"message": "stub failure"}}', "application/json")
+
+        parsed = urllib.parse.urlsplit(self.path)
+        if parsed.path.startswith('/openai/v1/chat/completions'):
+            return self._reply(200, json.dumps(groq_completion(json.loads(body or b"{}"))).encode(), "application/json")
+
+        host, _, path = parsed.path.lstrip('/').partition('/')
+        path = '/' + path
+        params = urllib.parse.parse_qs(parsed.query)
+        if body:
+            params.update(urllib.parse.parse_qs(body.decode('utf-8', 'replace')))
+        if host == 'news.google.com' and path.startswith('/rss/articles/STUB'):
+            article = synthetic_article(int(path.rsplit('STUB', 1)[1]) % ARTICLE_UNIVERSE)
+            return self._reply(302, headers={'Location': article['url']})
+        rendered = render_news(host, path, params)
+        if rendered is None:
+            return self._reply(404, b"not found")
+        content_type, text = rendered
+        self._reply(200, text.encode('utf-8'), content_type)
+
+    do_GET = do_POST = do_HEAD = _handle
+
+
+def _serve_stubs(options, ready):
+    """Stand-in process entry point: start both servers and report their ports"""
+    news = StubServer(("127.0.0.1", 0), options['news_latency'], options['news_error_rate'])
+    groq = StubServer(("127.0.0.1", 0), options['groq_latency'], options['groq_error_rate'])
+    for server in (news, groq):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    ready.send((news.server_address[1], groq.server_address[1]))
+    threading.Event().wait()
+
+
+def start_stubs(args):
+    """Run the news and Groq stand-ins in a child process; returns (process, news port, groq port)"""
+    parent, child = multiprocessing.Pipe()
+    options = {name: getattr(args, name) for name in ('news_latency', 'news_error_rate', 'groq_latency', 'groq_error_rate')}
+    process = multiprocessing.Process(target=_serve_stubs, args=(options, child), daemon=True)
+    process.start()
+    news_port, groq_port = parent.recv()
+    return process, news_port, groq_port
+
+
+def route_news_to_stub(news_port):
+    """Send every outbound requests call to the news stand-in, keeping the original URL on the response"""
+    from requests.adapters import HTTPAdapter
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, *args, **kwargs):
+        original_url = request.url
+        parts = urllib.parse.urlsplit(original_url)
+        if parts.hostname not in ('127.0.0.1', 'localhost'):
+            request.url = urllib.parse.urlunsplit(('http', f"127.0.0.1:{news_port}", f"/{parts.netloc}{parts.path or '/'}", parts.query, ''))
+        try:
+            response = original_send(adapter, request, *args, **kwargs)
+        finally:
+            request.url = original_url
+        response.url = original_url
+        return response
+
+    HTTPAdapter.send = send
+
+
+# ---------------------------------------------------------------------------
+# Simulated sessions
+# ---------------------------------------------------------------------------
+
+def make_apptest_concurrent():
+    """Patch two AppTest assumptions that only hold for one test at a time.
+
+    Every AppTest run compiles the script afresh and concurrent ast.parse calls can fail on
+    older CPython 3.11 builds, so compiled bytecode is shared (as the server's script cache
+    does). Every run also clears the global Runtime when it ends, under sessions still
+    mid-run, so the last runtime stays visible between runs.
+    """
+    from streamlit.runtime.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    original_get_bytecode = ScriptCache.get_bytecode
+    compile_lock = threading.Lock()
+    bytecode = {}
+
+    def get_bytecode(cache, script_path):
+        with compile_lock:
+            if script_path not in bytecode:
+                bytecode[script_path] = original_get_bytecode(cache, script_path)
+            return bytecode[script_path]
+
+    last_runtime = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            last_runtime[:] = [cls._instance]
+            return cls._instance
+        if last_runtime:
+            return last_runtime[0]
+        raise RuntimeError("Runtime hasn't been created!")
+
+    ScriptCache.get_bytecode = get_bytecode
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(last_runtime))
+
+
+class SessionResult:
+    """Phase timings and the outcome of one simulated session"""
+
+    def __init__(self, index):
+        self.index = index
+        self.phases = {}
+        self.error = None
+        self.failed_phase = None
+        self.articles = 0
+        self.companies = 0
+        self.started = time.perf_counter()
+        self.total = None
+
+    def to_dict(self):
+        return {
+            'session': self.index,
+            'phases': self.phases,
+            'total': self.total,
+            'error': self.error,
+            'failed_phase': self.failed_phase,
+            'articles': self.articles,
+            'companies': self.companies,
+        }
+
+
+class PhaseFailed(Exception):
+    pass
+
+
+def _check(at, phase):
+    """Fail the phase on a script exception or an error banner"""
+    if at.exception:
+        raise PhaseFailed(f"{phase}: {at.exception[0].value}")
+    errors = [element.value for element in at.error]
+    if errors:
+        raise PhaseFailed(f"{phase}: {errors[0].strip()}")
+
+
+def _wait_for(at, flag, phase, args):
+    """Rerun like the polling job panel until session_state[flag] is set"""
+    deadline = time.perf_counter() + args.phase_timeout
+    while not at.session_state[flag]:
+        if time.perf_counter() > deadline:
+            raise PhaseFailed(f"{phase}: timed out after {args.phase_timeout:.0f}s")
+        time.sleep(args.poll_interval)
+        at.run()
+        _check(at, phase)
+
+
+def _widget(elements, label):
+    for element in elements:
+        if element.label.startswith(label):
+            return element
+    raise PhaseFailed(f"widget {label!r} not found")
+
+
+def session_config(index, sectors, args):
+    """Sidebar choices for one session; sessions differ unless --identical-sessions"""
+    if args.identical_sessions:
+        index = 0
+    count = args.sectors_per_session
+    return [sectors[(index * count + offset) % len(sectors)] for offset in range(count)]
+
+
+def run_session(index, args, start_barrier, result):
+    """One user's walk through main(): configure, search, choose range, analyze, export"""
+    from streamlit.testing.v1 import AppTest
+
+    current = None
+
+    def phase(name):
+        nonlocal current
+        now = time.perf_counter()
+        if current is not None:
+            result.phases[current[0]] = now - current[1]
+        current = (name, now) if name else None
+
+    try:
+        at = AppTest.from_file(APP_PATH, default_timeout=args.phase_timeout)
+        start_barrier.wait()
+        result.started = time.perf_counter()
+
+        phase('configure')
+        at.run()
+        _check(at, 'configure')
+        sectors_widget = _widget(at.sidebar.multiselect, "Select Sectors")
+        sectors_widget.set_value(session_config(index, sectors_widget.options, args)).run()
+        _widget(at.sidebar.multiselect, "Select Project Types").set_value(args.project_types).run()
+        _widget(at.sidebar.multiselect, "Select News Sources").set_value(args.sources).run()
+        _widget(at.sidebar.slider, "Results per Search").set_value(args.results_per_search).run()
+        _widget(at.sidebar.slider, "Request budget").set_value(args.request_budget).run()
+        _check(at, 'configure')
+
+        phase('search')
+        _widget(at.button, " Start Comprehensive Search").click().run()
+        _check(at, 'search')
+        _wait_for(at, 'search_complete', 'search', args)
+        result.articles = len(at.session_state.articles or [])
+
+        phase('range')
+        end = min(args.analyze_articles, result.articles)
+        _widget(at.number_input, "End analysis at article").set_value(end).run()
+        _widget(at.number_input, "Start analysis from article").set_value(0).run()
+        _check(at, 'range')
+
+        phase('analyze')
+        _widget(at.button, " Start AI Analysis").click().run()
+        _check(at, 'analyze')
+        _wait_for(at, 'analysis_complete', 'analyze', args)
+        lead_table = at.session_state.lead_table
+        result.companies = 0 if lead_table is None else int(lead_table['_dedup_key'].nunique())
+
+        phase('export')
+        _widget(at.selectbox, "Scoring profile").set_value(_widget(at.selectbox, "Scoring profile").options[-1]).run()
+        _check(at, 'export')
+        tsv = at.code[0].value if len(at.code) else ''
+        if len(tsv.splitlines()) != result.companies + 1:
+            raise PhaseFailed(f"export: TSV has {len(tsv.splitlines())} lines for {result.companies} companies")
+        phase(None)
+        result.total = time.perf_counter() - result.started
+    except Exception as e:
+        result.failed_phase = current[0] if current else 'startup'
+        result.error = str(e) if isinstance(e, PhaseFailed) else f"{type(e).__name__}: {e}"
+
+
+# ---------------------------------------------------------------------------
+# Measurement and reporting
+# ---------------------------------------------------------------------------
+
+def rss_megabytes():
+    """Current resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as handle:
+            return int(handle.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except (OSError, ValueError):
+        # Peak rather than current outside Linux; ru_maxrss is bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+class MemorySampler:
+    """Background sampler tracking peak RSS while a level runs"""
+
+    def __init__(self, interval=0.2):
+        self.interval = interval
+        self.peak = rss_megabytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, rss_megabytes())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, rss_megabytes())
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def run_level(sessions, args):
+    """Run `sessions` simulated users at once and summarize the level"""
+    import streamlit as st
+    st.cache_resource.clear()  # fresh job runner, transport and caches per level
+
+    results = [SessionResult(index) for index in range(sessions)]
+    barrier = threading.Barrier(sessions + 1)
+    threads = []
+    for index, result in enumerate(results):
+        thread = threading.Thread(target=run_session, args=(index, args, barrier, result), name=f"load-session-{index}")
+        thread.start()
+        threads.append(thread)
+        time.sleep(args.ramp / max(1, sessions))
+
+    baseline_rss = rss_megabytes()
+    cpu_before = time.process_time()
+    barrier.wait()
+    started = time.perf_counter()
+    with MemorySampler() as memory:
+        for thread in threads:
+            thread.join()
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_before
+
+    completed = [result for result in results if result.error is None]
+    summary = {
+        'sessions': sessions,
+        'completed': len(completed),
+        'failed': sessions - len(completed),
+        'wall_seconds': wall,
+        'throughput_per_minute': len(completed) / wall * 60 if wall else 0.0,
+        'cpu_seconds_per_session': cpu / sessions,
+        'memory_mb_per_session': max(0.0, memory.peak - baseline_rss) / sessions,
+        'peak_rss_mb': memory.peak,
+        'phases': {},
+        'errors': [result.error for result in results if result.error],
+        'results': [result.to_dict() for result in results],
+    }
+    for name in PHASES + ['total']:
+        values = [result.total if name == 'total' else result.phases.get(name) for result in completed]
+        values = [value for value in values if value is not None]
+        summary['phases'][name] = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    return summary
+
+
+def find_saturation(levels, slo_factor, max_failure_rate, min_gain=0.1):
+    """Highest level that still scaled, with the reason the next one did not.
+
+    A level is past saturation when its failures exceed max_failure_rate, its p95 session
+    time exceeds slo_factor x the lightest level's, or its throughput grew by less than
+    min_gain over the previous level.
+    """
+    baseline = levels[0]['phases']['total']['p95'] if levels else None
+    previous = None
+    for level in levels:
+        p95 = level['phases']['total']['p95']
+        reason = None
+        if level['failed'] / level['sessions'] > max_failure_rate:
+            reason = f"{level['failed']} of {level['sessions']} sessions failed"
+        elif baseline and p95 and p95 > slo_factor * baseline:
+            reason = f"p95 session time {p95:.1f}s > {slo_factor:g} x {baseline:.1f}s"
+        elif previous and level['throughput_per_minute'] < previous['throughput_per_minute'] * (1 + min_gain):
+            reason = (f"throughput {level['throughput_per_minute']:.1f} sessions/min vs "
+                      f"{previous['throughput_per_minute']:.1f} at {previous['sessions']}")
+        if reason:
+            return (previous['sessions'] if previous else None), f"at {level['sessions']} sessions: {reason}"
+        previous = level
+    return None, None
+
+
+def _fmt(value):
+    return "-" if value is None else f"{value:7.2f}"
+
+
+def print_level(level):
+    print(f"\n== {level['sessions']} concurrent sessions: {level['completed']} completed, {level['failed']} failed, "
+          f"{level['wall_seconds']:.1f}s wall, {level['throughput_per_minute']:.1f} sessions/min")
+    print(f"   CPU {level['cpu_seconds_per_session']:.2f}s/session | memory {level['memory_mb_per_session']:.1f} MB/session "
+          f"(peak RSS {level['peak_rss_mb']:.0f} MB)")
+    print(f"   {'phase':<10}" + "".join(f"{f'p{pct} (s)':>10}" for pct in PERCENTILES))
+    for name, stats in level['phases'].items():
+        print(f"   {name:<10}" + "".join(f"{_fmt(stats[f'p{pct}']):>10}" for pct in PERCENTILES))
+    for error in dict.fromkeys(level['errors']):
+        print(f"   ! {error}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the company scout")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8], help="Concurrency levels, run in order")
+    parser.add_argument("--ramp", type=float, default=0.0, help="Seconds over which a level's sessions are started")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between reruns while a job runs")
+    parser.add_argument("--phase-timeout", type=float, default=300.0, help="Seconds before a phase counts as timed out")
+    parser.add_argument("--news-latency", type=float, default=0.3, help="Mean news stand-in response time (s)")
+    parser.add_argument("--news-error-rate", type=float, default=0.0, help="Share of news requests answered with HTTP 500")
+    parser.add_argument("--groq-latency", type=float, default=0.8, help="Mean Groq stand-in response time (s)")
+    parser.add_argument("--groq-error-rate", type=float, default=0.0, help="Share of Groq calls answered with HTTP 500")
+    parser.add_argument("--sources", nargs="+", default=["Google News", "DuckDuckGo", "Bing News"])
+    parser.add_argument("--project-types", nargs="+", default=["Greenfield Projects"])
+    parser.add_argument("--sectors-per-session", type=int, default=1)
+    parser.add_argument("--identical-sessions", action="store_true", help="Same sidebar choices in every session (shared cache hits)")
+    parser.add_argument("--results-per-search", type=int, default=10)
+    parser.add_argument("--request-budget", type=int, default=30, help="Request budget slider (%% of full sweep)")
+    parser.add_argument("--analyze-articles", type=int, default=20, help="End of the analysis range")
+    parser.add_argument("--job-workers", type=int, default=None, help="JOB_WORKERS for the app (default: app default)")
+    parser.add_argument("--no-warmup", action="store_true", help="Skip the untimed warm-up session")
+    parser.add_argument("--slo-factor", type=float, default=2.0, help="Saturation when p95 session time exceeds this multiple of the lightest level")
+    parser.add_argument("--max-failure-rate", type=float, default=0.05)
+    parser.add_argument("--json", help="Write all level summaries and per-session results here")
+    args = parser.parse_args(argv)
+    if args.json:
+        args.json = os.path.abspath(args.json)
+
+    stub_process, news_port, groq_port = start_stubs(args)
+    route_news_to_stub(news_port)
+    make_apptest_concurrent()
+    workdir = tempfile.TemporaryDirectory(prefix="scout-load-")
+    # Settings go through the environment: AppTest secrets are process-global and reset by every session
+    os.environ.update({
+        'GROQ_API_KEY': 'load-test',
+        'GROQ_BASE_URL': f"http://127.0.0.1:{groq_port}",
+        'HTTP2': 'false',
+        # Article stores and checkpoints land in the scratch directory, not next to app.py
+        'ARTICLE_STORE_DIR': os.path.join(workdir.name, 'articles'),
+        'CHECKPOINT_DIR': os.path.join(workdir.name, 'checkpoints'),
+    })
+    if args.job_workers:
+        os.environ['JOB_WORKERS'] = str(args.job_workers)
+    import streamlit.logger
+    from streamlit import config
+    config.set_option("logger.level", "error")  # bare-mode and deprecation warnings from every rerun
+    streamlit.logger.set_log_level("error")
+
+    print(f"News stand-in on :{news_port} ({args.news_latency}s, {args.news_error_rate:.0%} errors), "
+          f"Groq stand-in on :{groq_port} ({args.groq_latency}s, {args.groq_error_rate:.0%} errors)")
+    levels = []
+    try:
+        if not args.no_warmup:
+            # One untimed session first, so lazy imports and first compiles are not charged to the lightest level
+            run_level(1, args)
+        for sessions in args.sessions:
+            level = run_level(sessions, args)
+            levels.append(level)
+            print_level(level)
+    finally:
+        stub_process.terminate()
+        workdir.cleanup()
+
+    saturation, reason = find_saturation(levels, args.slo_factor, args.max_failure_rate)
+    if saturation:
+        print(f"\nSaturation point: {saturation} concurrent sessions ({reason})")
+    elif reason:
+        print(f"\nSaturated at the lightest level ({reason})")
+    else:
+        print(f"\nNo saturation up to {max(args.sessions)} concurrent sessions")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump({'levels': levels, 'saturation': saturation, 'reason': reason, 'options': vars(args)}, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
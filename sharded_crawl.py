@@ -0,0 +1,370 @@
+"""Sharded crawl: fan (query, source) search tasks out to worker processes through a shared SQLite queue.
+
+Typical use on one machine:
+
+    python sharded_crawl.py run --db crawl.db --workers 8
+    python sharded_crawl.py merge --db crawl.db --output articles.jsonl
+
+Extra machines join by running `python sharded_crawl.py --shared-storage worker --db <path>`
+against the same database file on a network filesystem. WAL needs shared memory on a single
+host, so on shared storage (given by the flag, or detected from /proc/mounts) the database
+uses SQLite's rollback journal instead; the filesystem must honour POSIX byte-range locks
+(e.g. NFSv4 with locking enabled, not mounted with `nolock`). Tasks are claimed atomically
+and a claim that goes stale (crashed worker) is handed to the next worker that asks.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import sys
+import time
+
+DEFAULT_DB = "crawl.db"
+CLAIM_TIMEOUT_SECONDS = 600
+MAX_ATTEMPTS = 3
+SOURCE_DELAY_SECONDS = 1.0
+NETWORK_FILESYSTEMS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "fuse.sshfs", "glusterfs", "ceph", "lustre", "gpfs", "beegfs"}
+
+
+def on_shared_storage(db_path):
+    """True when asked to (CRAWL_SHARED_STORAGE) or when the database sits on a network filesystem"""
+    if os.environ.get("CRAWL_SHARED_STORAGE", "").lower() in ("1", "true", "yes"):
+        return True
+    try:
+        with open("/proc/mounts", encoding="utf-8") as handle:
+            mounts = [line.split()[1:3] for line in handle if len(line.split()) > 2]
+    except OSError:
+        return False
+    directory = os.path.dirname(os.path.abspath(db_path))
+    best, best_type = "", ""
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        if (directory == mount_point or directory.startswith(mount_point.rstrip("/") + "/")) and len(mount_point) > len(best):
+            best, best_type = mount_point, fs_type
+    return best_type in NETWORK_FILESYSTEMS
+
+
+def connect(db_path):
+    """Open the crawl database (WAL locally, rollback journal on shared storage) and make sure the schema exists"""
+    connection = sqlite3.connect(db_path, timeout=60, isolation_level=None)
+    if on_shared_storage(db_path):
+        connection.execute("PRAGMA journal_mode=DELETE")
+        connection.execute("PRAGMA synchronous=FULL")
+    else:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            query TEXT NOT NULL,
+            source TEXT NOT NULL,
+            max_results INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            worker TEXT,
+            claimed_at REAL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            article_count INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            UNIQUE(query, source)
+        )
+    """)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS articles (
+            task_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (task_id, position)
+        )
+    """)
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS source_last_request (
+            source TEXT PRIMARY KEY,
+            next_at REAL NOT NULL
+        )
+    """)
+    connection.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks(status, claimed_at)")
+    return connection
+
+
+def load_scout():
+    """Import the app lazily so the queue commands work without Streamlit's runtime"""
+    import app
+    return app, app.MultiSectorCompanyScout()
+
+
+def enqueue(db_path, sectors=None, project_types=None, sources=None, max_results=15, query_limit=None):
+    """Expand the sector x project-type query grid against every source and queue what is new"""
+    app, scout = load_scout()
+    sectors = sectors or list(scout.SECTORS)
+    project_types = project_types or ["Greenfield Projects", "Brownfield Projects"]
+    sources = sources or list(scout.NEWS_SOURCES.keys())
+    unknown = [source for source in sources if source not in scout.NEWS_SOURCES]
+    if unknown:
+        raise SystemExit(f"Unknown sources: {', '.join(unknown)}")
+
+    queries = scout.get_search_queries(sectors, project_types, limit=query_limit)
+    connection = connect(db_path)
+    with connection:
+        connection.execute("BEGIN IMMEDIATE")
+        before = connection.total_changes
+        connection.executemany(
+            "INSERT OR IGNORE INTO tasks (query, source, max_results) VALUES (?, ?, ?)",
+            [(query, source, max_results) for query in queries for source in sources]
+        )
+        added = connection.total_changes - before
+    connection.close()
+    print(f"Queued {added} new tasks ({len(queries)} queries x {len(sources)} sources)")
+    return added
+
+
+def claim_task(connection, worker_id):
+    """Atomically claim the next pending (or stale) task whose source is free, reserving the source's next request slot.
+
+    The slot lives in the database, so SOURCE_DELAY_SECONDS spaces requests to an engine
+    across every worker process and machine, not just within one worker.
+    """
+    now = time.time()
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        row = connection.execute(
+            """SELECT tasks.id, tasks.query, tasks.source, tasks.max_results FROM tasks
+               LEFT JOIN source_last_request ON source_last_request.source = tasks.source
+               WHERE (tasks.status = 'pending' OR (tasks.status = 'claimed' AND tasks.claimed_at < ?))
+                 AND COALESCE(source_last_request.next_at, 0) <= ?
+               ORDER BY tasks.attempts, tasks.id LIMIT 1""",
+            (now - CLAIM_TIMEOUT_SECONDS, now)
+        ).fetchone()
+        if row:
+            connection.execute(
+                "UPDATE tasks SET status = 'claimed', worker = ?, claimed_at = ?, attempts = attempts + 1 WHERE id = ?",
+                (worker_id, now, row[0])
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO source_last_request (source, next_at) VALUES (?, ?)",
+                (row[2], now + SOURCE_DELAY_SECONDS)
+            )
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    return row
+
+
+def hold_source(connection, source, until):
+    """Keep every worker off a source until `until` (extra pages sent, or a block to back off from)"""
+    connection.execute(
+        """INSERT INTO source_last_request (source, next_at) VALUES (?, ?)
+           ON CONFLICT(source) DO UPDATE SET next_at = MAX(next_at, excluded.next_at)""",
+        (source, until)
+    )
+
+
+def seconds_until_free_source(connection):
+    """How long until some source with pending work may be queried again"""
+    next_at = connection.execute(
+        """SELECT MIN(COALESCE(source_last_request.next_at, 0)) FROM tasks
+           LEFT JOIN source_last_request ON source_last_request.source = tasks.source
+           WHERE tasks.status = 'pending'"""
+    ).fetchone()[0]
+    return 2.0 if next_at is None else next_at - time.time()
+
+
+def outstanding_tasks(connection):
+    """Number of tasks that are still pending or claimed by some worker"""
+    return connection.execute("SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'claimed')").fetchone()[0]
+
+
+def complete_task(connection, task_id, articles):
+    """Store a task's articles and mark it done in one transaction"""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.execute("DELETE FROM articles WHERE task_id = ?", (task_id,))
+        connection.executemany(
+            "INSERT INTO articles (task_id, position, data) VALUES (?, ?, ?)",
+            [(task_id, position, json.dumps(article.to_dict())) for position, article in enumerate(articles)]
+        )
+        connection.execute(
+            "UPDATE tasks SET status = 'done', article_count = ?, error = NULL WHERE id = ?",
+            (len(articles), task_id)
+        )
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def fail_task(connection, task_id, error):
+    """Release a failed task for retry, or give up after MAX_ATTEMPTS"""
+    connection.execute(
+        """UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                            error = ?, worker = NULL
+           WHERE id = ?""",
+        (MAX_ATTEMPTS, str(error)[:500], task_id)
+    )
+
+
+def worker(db_path, worker_name=None, idle_exit=True):
+    """Claim and run tasks until the queue is drained"""
+    app, scout = load_scout()
+    worker_id = worker_name or f"{socket.gethostname()}:{os.getpid()}"
+    connection = connect(db_path)
+    completed = 0
+
+    while True:
+        task = claim_task(connection, worker_id)
+        if task is None:
+            if idle_exit and outstanding_tasks(connection) == 0:
+                break
+            # Sources are all inside their delay, or other workers hold claims that may go stale
+            time.sleep(min(max(seconds_until_free_source(connection), 0.05), 2.0))
+            continue
+
+        task_id, query, source, max_results = task
+        if source not in scout.NEWS_SOURCES:
+            fail_task(connection, task_id, f"Unknown source {source}")
+            continue
+
+        requests_before = scout.source_requests()
+        try:
+            scout.last_status_code = None
+            articles, cached = scout.cached_search(source, query, max_results)
+            if not articles and scout.last_status_code in app.BLOCKED_STATUS_CODES:
+                fail_task(connection, task_id, f"HTTP {scout.last_status_code}")
+                hold_source(connection, source, time.time() + 30)  # back off this source for a while
+                continue
+            scout.canonicalize_articles(articles)
+            complete_task(connection, task_id, articles)
+            completed += 1
+        except Exception as e:
+            fail_task(connection, task_id, e)
+        finally:
+            # The claim reserved one request; paged searches owe the delay for their other pages
+            extra_pages = scout.source_requests() - requests_before - 1
+            if extra_pages > 0:
+                hold_source(connection, source, time.time() + extra_pages * SOURCE_DELAY_SECONDS)
+
+    connection.close()
+    print(f"[{worker_id}] completed {completed} tasks")
+    return completed
+
+
+def _worker_process(db_path, index):
+    """multiprocessing entry point"""
+    worker(db_path, worker_name=f"{socket.gethostname()}:{os.getpid()}:{index}")
+
+
+def run(db_path, workers=4):
+    """Spawn local worker processes against an already enqueued database"""
+    processes = [
+        multiprocessing.Process(target=_worker_process, args=(db_path, index), daemon=False)
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    print_status(db_path)
+
+
+def print_status(db_path):
+    """Summarize task states"""
+    connection = connect(db_path)
+    rows = connection.execute(
+        "SELECT status, COUNT(*), COALESCE(SUM(article_count), 0) FROM tasks GROUP BY status ORDER BY status"
+    ).fetchall()
+    connection.close()
+    for status, count, article_count in rows:
+        print(f"{status:>8}: {count} tasks, {article_count} articles")
+    return rows
+
+
+def iter_articles(db_path):
+    """Stream every stored article back as Article records, in task order"""
+    import app
+    connection = connect(db_path)
+    try:
+        for (data,) in connection.execute("SELECT data FROM articles ORDER BY task_id, position"):
+            yield app.Article.from_dict(json.loads(data))
+    finally:
+        connection.close()
+
+
+def merge(db_path, recency_days=365, keep_undated=True, fetch_full_text=False, scout=None):
+    """Dedup all stored articles and run the app's date normalization and recency filter"""
+    import app
+    if scout is None:
+        app, scout = load_scout()
+    unique = scout.dedupe_articles(iter_articles(db_path), sink=app.ArticleStore())
+    result = scout.prepare_articles(unique, recency_days, keep_undated, fetch_full_text)
+    if result['articles'] is not unique:
+        unique.delete()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sharded multi-process news crawl for the company scout")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite queue database (shared storage for multi-node runs)")
+    parser.add_argument("--shared-storage", action="store_true",
+                        help="The database is on a network filesystem: use the rollback journal instead of WAL")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_parser = commands.add_parser("enqueue", help="Queue (query, source) tasks")
+    enqueue_parser.add_argument("--sectors", nargs="*")
+    enqueue_parser.add_argument("--project-types", nargs="*")
+    enqueue_parser.add_argument("--sources", nargs="*")
+    enqueue_parser.add_argument("--max-results", type=int, default=15)
+    enqueue_parser.add_argument("--query-limit", type=int, default=None, help="Cap on queries (default: full grid)")
+
+    worker_parser = commands.add_parser("worker", help="Run one worker until the queue drains")
+    worker_parser.add_argument("--name")
+
+    run_parser = commands.add_parser("run", help="Enqueue the full grid and run local worker processes")
+    run_parser.add_argument("--workers", type=int, default=4)
+    run_parser.add_argument("--sources", nargs="*")
+    run_parser.add_argument("--max-results", type=int, default=15)
+    run_parser.add_argument("--query-limit", type=int, default=None)
+
+    commands.add_parser("status", help="Show task counts")
+
+    merge_parser = commands.add_parser("merge", help="Dedup and date-filter stored articles")
+    merge_parser.add_argument("--output", default="articles.jsonl")
+    merge_parser.add_argument("--recency-days", type=int, default=365)
+    merge_parser.add_argument("--drop-undated", action="store_true")
+    merge_parser.add_argument("--fetch-full-text", action="store_true")
+    merge_parser.add_argument("--analyze", action="store_true", help="Also extract and rank companies (needs GROQ_API_KEY)")
+    merge_parser.add_argument("--tsv", default="companies.tsv")
+
+    args = parser.parse_args(argv)
+    if args.shared_storage:
+        os.environ["CRAWL_SHARED_STORAGE"] = "1"  # inherited by the worker processes
+    if args.command == "enqueue":
+        enqueue(args.db, args.sectors, args.project_types, args.sources, args.max_results, args.query_limit)
+    elif args.command == "worker":
+        worker(args.db, args.name)
+    elif args.command == "run":
+        enqueue(args.db, sources=args.sources, max_results=args.max_results, query_limit=args.query_limit)
+        run(args.db, args.workers)
+    elif args.command == "status":
+        print_status(args.db)
+    elif args.command == "merge":
+        app, scout = load_scout()
+        result = merge(args.db, args.recency_days, not args.drop_undated, args.fetch_full_text, scout=scout)
+        articles = result['articles']
+        with open(args.output, "w", encoding="utf-8") as handle:
+            for article in articles:
+                handle.write(json.dumps(article.to_dict()) + "\n")
+        print(f"Wrote {len(articles)} articles ({result['date_range'] or 'no dates'}) to {args.output}")
+        if args.analyze and articles:
+            analysis = scout.run_analysis_pipeline(articles, 0, len(articles))
+            lead_table = analysis['lead_table']
+            companies = [] if lead_table is None else scout.lead_scorer.rank(lead_table, 'Balanced').to_dict('records')
+            with open(args.tsv, "w", encoding="utf-8") as handle:
+                handle.write(scout.generate_tsv_output(companies))
+            print(f"Wrote {len(companies)} companies to {args.tsv}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
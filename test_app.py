@@ -0,0 +1,156 @@
+"""Tests for the pure helpers in app.py: LLM JSON repair, company validation and URL canonicalization"""
+import base64
+import json
+
+import pytest
+
+from app import canonicalize_url, parse_llm_json, unwrap_redirect_url, validate_company
+
+COMPANY = {
+    "company_name": "Apex Logistics Pvt Ltd",
+    "core_intent": "New warehouse in Pune",
+    "stage": "Construction started",
+    "detailed_timeline": "Q3 2026",
+    "project_type": "Greenfield",
+    "sector": "warehouse",
+    "confidence": "high",
+    "is_private_sector": True,
+}
+
+
+def test_parse_plain_json():
+    companies, status = parse_llm_json(json.dumps({"companies": [COMPANY]}))
+    assert status == 'ok'
+    assert companies == [COMPANY]
+
+
+def test_parse_fenced_json_with_prose():
+    text = "Here are the companies:\n```json\n" + json.dumps({"companies": [COMPANY]}) + "\n```\nHope this helps."
+    companies, status = parse_llm_json(text)
+    assert status == 'repaired'
+    assert companies[0]["company_name"] == "Apex Logistics Pvt Ltd"
+
+
+def test_parse_trailing_commas_and_python_literals():
+    text = '{"companies": [{"company_name": "Apex Ltd", "is_private_sector": True, "sector": None,},],}'
+    companies, status = parse_llm_json(text)
+    assert status == 'repaired'
+    assert companies == [{"company_name": "Apex Ltd", "is_private_sector": True, "sector": None}]
+
+
+def test_repair_leaves_literals_inside_strings_alone():
+    text = ('{"companies": [{"company_name": "True North Logistics Ltd", "core_intent": "None of the existing plants, ]", '
+            '"stage": "False start fixed", "is_private_sector": True,}]}')
+    companies, status = parse_llm_json(text)
+    assert status == 'repaired'
+    assert companies == [{
+        "company_name": "True North Logistics Ltd",
+        "core_intent": "None of the existing plants, ]",
+        "stage": "False start fixed",
+        "is_private_sector": True,
+    }]
+
+
+def test_parse_truncated_output_is_closed():
+    text = json.dumps({"companies": [COMPANY, COMPANY]})
+    truncated = text[:text.rfind('"sector"') + len('"sector": "ware')]
+    companies, status = parse_llm_json(truncated)
+    assert status == 'repaired'
+    assert companies[0] == COMPANY
+    # The cut-off value is dropped rather than kept half-written
+    assert companies[1]["company_name"] == COMPANY["company_name"]
+    assert "sector" not in companies[1]
+
+
+def test_parse_truncated_inside_first_key_of_object():
+    text = json.dumps({"companies": [COMPANY, COMPANY]})
+    truncated = text[:text.rfind('"company_name"') + len('"company_name": "Apex Lo')]
+    companies, status = parse_llm_json(truncated)
+    assert status == 'repaired'
+    assert [validate_company(company) for company in companies] == [COMPANY, None]
+
+
+def test_parse_salvages_complete_objects():
+    other = dict(COMPANY, company_name="Beta Warehousing Ltd")
+    text = '[' + json.dumps(COMPANY) + ' ; ' + json.dumps(other) + ' ; {"company_name": "Gam'
+    companies, status = parse_llm_json(text)
+    assert status == 'salvaged'
+    assert companies == [COMPANY, other]
+
+
+@pytest.mark.parametrize("text", ["", "no companies here", "{not json at all"])
+def test_parse_failure(text):
+    assert parse_llm_json(text) == ([], 'failed')
+
+
+def test_parse_bare_list_and_single_object():
+    assert parse_llm_json(json.dumps([COMPANY])) == ([COMPANY], 'ok')
+    assert parse_llm_json(json.dumps(COMPANY)) == ([COMPANY], 'ok')
+
+
+def test_validate_normalizes_enums_and_whitespace():
+    company = validate_company(dict(COMPANY, project_type="greenfield", confidence="HIGH", core_intent="  New\n warehouse "))
+    assert company["project_type"] == "Greenfield"
+    assert company["confidence"] == "high"
+    assert company["core_intent"] == "New warehouse"
+
+
+def test_validate_fills_defaults_for_missing_or_unknown_values():
+    company = validate_company({"company_name": "Apex Ltd", "is_private_sector": "yes", "project_type": "mixed", "stage": ["x"]})
+    assert company["is_private_sector"] is True
+    assert company["project_type"] == "Unknown"
+    assert company["stage"] == "Under Development"
+    assert company["confidence"] == "medium"
+
+
+@pytest.mark.parametrize("company", [
+    dict(COMPANY, company_name="Not mentioned"),
+    dict(COMPANY, company_name=None),
+    dict(COMPANY, is_private_sector=False),
+    dict(COMPANY, is_private_sector="no"),
+    "Apex Ltd",
+])
+def test_validate_rejects_unusable_leads(company):
+    assert validate_company(company) is None
+
+
+ARTICLE = "https://example.com/news/story-123"
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.example.com/news/story-123/amp/",
+    "https://m.example.com/news/story-123.amp.html",
+    "https://amp.example.com/amp/news/story-123",
+    "https://example-com.cdn.ampproject.org/c/s/example.com/news/story-123",
+    "https://www.google.com/amp/s/example.com/news/story-123",
+])
+def test_canonicalize_amp_variants(url):
+    assert canonicalize_url(url) == ARTICLE
+
+
+def test_canonicalize_drops_tracking_params_and_fragment():
+    url = "http://www.example.com/news/story-123/?utm_source=rss&utm_medium=feed&fbclid=abc&gclid=x&ref=home&id=5#comments"
+    assert canonicalize_url(url) == ARTICLE + "?id=5"
+
+
+def test_canonicalize_sorts_params_and_collapses_slashes():
+    assert canonicalize_url("http://EXAMPLE.com//news//story-123/?b=2&a=1") == ARTICLE + "?a=1&b=2"
+    assert canonicalize_url("//example.com/news/story-123") == ARTICLE
+    assert canonicalize_url("https://example.com:8443/news/story-123") == "https://example.com:8443/news/story-123"
+
+
+@pytest.mark.parametrize("url", [
+    "https://duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com%2Fnews%2Fstory-123%3Futm_medium%3Drss",
+    "https://www.bing.com/news/apiclick.aspx?url=https%3A%2F%2Fexample.com%2Fnews%2Fstory-123&c=1",
+    "https://www.bing.com/ck/a?!&&p=abc&u=a1" + base64.urlsafe_b64encode(ARTICLE.encode()).decode().rstrip("="),
+    "https://www.google.com/url?q=https://example.com/news/story-123&sa=U",
+    "https://r.search.yahoo.com/_ylt=A/RV=2/RE=1/RO=10/RU=https%3a%2f%2fexample.com%2fnews%2fstory-123/RK=2/RS=x-",
+])
+def test_canonicalize_unwraps_redirect_wrappers(url):
+    assert canonicalize_url(url) == ARTICLE
+
+
+def test_unwrap_leaves_other_links_alone():
+    assert unwrap_redirect_url(ARTICLE) == ARTICLE
+    assert unwrap_redirect_url("https://www.bing.com/ck/a?u=a1%%%") == "https://www.bing.com/ck/a?u=a1%%%"
+    assert canonicalize_url("not a url") == "not a url"